@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Start-up benchmark: wall time of fresh `miniml` processes for `-h` and for
+stopping after each of the first stages, i.e. what a one-shot invocation
+(like an editor running `-s type` per keystroke) pays.
+
+    bench/startup.py [-n RUNS] [--imports] [INFILE]
+
+--imports also lists the slowest imports of `-s type`, from `python -X importtime`.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MINIML = os.path.join(ROOT, 'miniml')
+
+CASES = [
+    ('-h', ['-h']),
+    ('-s lex', ['-s', 'lex', '{}']),
+    ('-s ast', ['-s', 'ast', '{}']),
+    ('-s name', ['-s', 'name', '{}']),
+    ('-s type', ['-s', 'type', '{}']),
+    ('-s secd', ['-s', 'secd', '{}']),
+]
+
+
+def run(script, argv, runs):
+    """
+    Wall times of runs fresh processes of `python script argv`.
+    """
+    cmd = [sys.executable] + (argv if script == sys.executable else [script] + argv)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times += [time.perf_counter() - start]
+    return times
+
+
+def report(name, times):
+    print(f'{name:<10} {min(times)*1000:>6.1f}ms {statistics.median(times)*1000:>6.1f}ms')
+
+
+def slowestImports(infile, count=15):
+    res = subprocess.run([sys.executable, '-X', 'importtime', MINIML, '-s', 'type', infile],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in res.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_, cumulative, name = line[len('import time:'):].split('|')
+        rows += [(int(cumulative), int(self_), name.rstrip())]
+    rows.sort(reverse=True)
+    print(f'\n{"cumulative":>12} {"self":>8}  module (-s type)')
+    for cumulative, self_, name in rows[:count]:
+        print(f'{cumulative/1000:>10.1f}ms {self_/1000:>6.1f}ms  {name}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='miniml start-up benchmark')
+    parser.add_argument('infile', nargs='?', default=os.path.join(ROOT, 'testcases', 'fact.ml'))
+    parser.add_argument('-n', '--runs', type=int, default=10)
+    parser.add_argument('--imports', action='store_true')
+    args = parser.parse_args()
+
+    print(f'{"":<10} {"min":>8} {"median":>8}')
+    report('python', run(sys.executable, ['-c', 'pass'], args.runs))
+    for name, argv in CASES:
+        report(name, run(MINIML, [a.format(args.infile) for a in argv], args.runs))
+    if args.imports:
+        slowestImports(args.infile)
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +0,0 @@
-from .main import main
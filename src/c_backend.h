@@ -176,6 +176,37 @@ static inline void _pushe1(val *ep, val v) {
     _pushs(t1);                                \
 } while (0);
 
+#define Ipopenv(n) do {                        \
+    for (int i = 0; i < n; i++) ep = load(ep); \
+} while (0);
+
+// constructor values: blocks [label, a1, ..., an], or immediates (label << 1) | 1
+//   if they have no arguments. Blocks are aligned, so their low bit is 0.
+#define Ictor(label, n) do {                   \
+    val t = ((label) << 1) | 1;                \
+    if (n > 0) {                               \
+        t = _new(4*n + 4);                     \
+        store(t, label);                       \
+        for (int i = n; i > 0; i--)            \
+            store(t + 4*i, _pops());           \
+    }                                          \
+    _pushs(t);                                 \
+} while (0);
+
+// jump table of label addresses, a gcc extension
+#define Iswitch(base, ...) do {                \
+    static void *lbls[] = { __VA_ARGS__ };     \
+    val t = _pops();                           \
+    val label = (t & 1) ? t >> 1 : load(t);    \
+    goto *lbls[label - (base)];                \
+} while (0);
+
+#define Iunpack(n) do {                        \
+    val t = _pops();                           \
+    for (int i = 0; i < n; i++)                \
+        _pushe(load(t + 4 + 4*i));             \
+} while (0);
+
 
 static inline void builtin_println(void) {
     val v = ep_v;
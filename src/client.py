@@ -0,0 +1,41 @@
+"""
+Thin client of the compile server (see server.py).
+
+Imports nothing of the compiler, so forwarding a request costs little more
+than starting the interpreter.
+"""
+import json
+import os
+import socket
+import sys
+
+
+def forward(socketPath, argv):
+    """
+    Has the server at socketPath run `miniml argv[1:]` in the current
+    directory, and relays its output.
+
+    Returns the exit code, or None if the server cannot take the request
+    (not running, restarting, or gone mid-request). The caller should then
+    compile locally.
+    """
+    request = json.dumps({ 'argv': argv[1:], 'cwd': os.getcwd() }).encode()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.connect(socketPath)
+            s.sendall(request)
+            s.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := s.recv(1 << 16):
+                chunks += [chunk]
+    except OSError:
+        return None
+    try:
+        reply = json.loads(b''.join(chunks))
+    except ValueError:
+        return None
+    if 'code' not in reply:
+        return None
+    sys.stdout.write(reply['stdout'])
+    sys.stderr.write(reply['stderr'])
+    return reply['code']
@@ -1,5 +1,6 @@
 DEBUG = {}
 DEBUG['main.PRINT_AST_BEFORE_UNIFY'] = False
+DEBUG['astnodes.CHECK_TRUSTED'] = False
 DEBUG['typer.PRINT_CONSTRS'] = False
 DEBUG['typer.PRINT_TVMAP'] = False
 DEBUG['typer.PRINT_VARTY_AFTER_UNIFICATION'] = False
@@ -1,8 +1,38 @@
-from .cst import ConstructASTVisitor
-from .astfmt import FormattedPrintVisitor
-from .ast import IndentedPrintVisitor, LISPStylePrintVisitor
-from .namer import NamerVisitor
-from .secdgen import SECDGenVisitor
-from .patmat import PatMatVisitor
-from .debrujin import DeBrujinVisitor
-from .typer import TyperVisitor, TypedIndentedPrintVisitor, UnifyTagVisitor
+"""
+The passes are imported on first use, e.g. `from .frontend import NamerVisitor`
+loads only the namer and the modules it needs. So each stage of the driver
+pays only for its own imports.
+"""
+import importlib
+
+_modules = {
+    'ConstructASTVisitor': 'cst',
+    'FormattedPrintVisitor': 'astfmt',
+    'IndentedPrintVisitor': 'ast',
+    'LISPStylePrintVisitor': 'ast',
+    'NamerVisitor': 'namer',
+    'SECDGenVisitor': 'secdgen',
+    'PatMatVisitor': 'patmat',
+    'DataReprVisitor': 'datarepr',
+    'DeBrujinVisitor': 'debrujin',
+    'FlatLowerVisitor': 'flatir',
+    'FlatSECDGen': 'flatir',
+    'TyperVisitor': 'typer',
+    'OnlineTyperVisitor': 'typer',
+    'TypedIndentedPrintVisitor': 'typer',
+    'UnifyTagVisitor': 'typer',
+    'TyperStats': 'typer',
+    'TypeCache': 'typecache',
+    'PassManager': 'passes',
+    'StageCache': 'stagecache',
+}
+
+__all__ = list(_modules)
+
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{_modules[name]}', __name__), name)
+    globals()[name] = value
+    return value
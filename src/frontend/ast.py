@@ -5,69 +5,93 @@ custom fashion.
 Note we must guarantee NO ALIASING for ASTNodes as they ARE MUTABLE!!!
 """
 
-from ..utils import *
-from ..common import *
-from collections import OrderedDict
+from types import GeneratorType
+
+from ..utils import MiniMLError, flatten
 
 class ASTNode:
     """
     The raw generic AST Node.
     Implements: location, __str__.
-    Subclasses need to implement field accessors (better never access _c directly)
 
-    @param `bunchedFields`: subset of `chs` (can also be a list)
+    Fields are plain attributes (slots) of the node, named in the class-level
+    tuple `fields` in traversal order.
+
+    @param `termFields`: subset of `fields`
+        Terminal values (names, literals, ...) rather than ASTNodes.
+        Visitors pass them to visitTermNode.
+
+    @param `bunchedFields`: subset of `fields`
         Children that contain a list of ASTNodes.
         Visitors visit the list's entries, instead of treating it as a terminal node.
 
+    `childFields` are the fields that are not terminal.
+
     INVARIANT:
-        type(x) is list | ASTNode       forall x in self._c
+        type(x) is list | ASTNode       forall x in childFields
             and type(x) is list, its entries are ASTNode
 
     NOTE:
         subclasses must have:
             self.__class__.NodeName defined
-            self.__class__.bunchedFields  defined
+        Passes annotate nodes only with the attributes in __slots__ below.
     """
-
-    def __init__(self, chs:OrderedDict, pos=(-1, -1)):
-        self._c = chs
+    __slots__ = (
+        'pos',
+        'type',     # typer
+        '_tenv',    # typer
+    )
+    fields = ()
+    termFields = ()
+    bunchedFields = ()
+    childFields = ()
+
+    def __init__(self, pos=(-1, -1)):
         self.pos = pos
 
     def __str__(self):
         return LISPStylePrintVisitor()(self)
 
+    def __reduce__(self):
+        """
+        Pickles fields and the type annotation only, the other annotations
+        are internal to their passes.
+        """
+        values = tuple(getattr(self, f) for f in self.fields)
+        return (ASTNode.unpickle, (type(self), self.pos, values, getattr(self, 'type', None)))
+
+    def copy(self):
+        """
+        Deep copy of the subtree. Terminal values and types are shared, other
+        annotations are not copied.
+        """
+        new = object.__new__(type(self))
+        new.pos = self.pos
+        for f in self.fields:
+            v = getattr(self, f)
+            if f in self.bunchedFields:
+                v = [ch.copy() for ch in v]
+            elif f not in self.termFields:
+                v = v.copy()
+            setattr(new, f, v)
+        if hasattr(self, 'type'):
+            new.type = self.type
+        return new
+
+    def unpickle(nodeClass, pos, values, ty):
+        n = object.__new__(nodeClass)
+        n.pos = pos
+        for f, v in zip(nodeClass.fields, values):
+            setattr(n, f, v)
+        if ty is not None:
+            n.type = ty
+        return n
+
     # Override me
     @property
     def NodeName(self):
         raise MiniMLError(f'Undefined NodeName for {type(self)}')
 
-    # Override me
-    @property
-    def bunchedFields(self):
-        raise MiniMLError(f'Undefined bunchedFields for {type(self)}')
-
-
-class TermNode(ASTNode):
-    """
-    Wrapper around terminal nodes, so that all nodes in an AST are of type `ASTNode`.
-    """
-    NodeName = 'Terminal'
-
-    def __init__(self, value, pos=(-1, -1)):
-        ASTNode.__init__(self, OrderedDict(), pos)
-        self._v = value
-
-    def getv(self):
-        return self._v
-
-    def setv(self, new):
-        self._v = new
-
-    def __str__(self):
-        return str(self.v)
-
-    v = property(getv, setv)
-
 
 class ASTVisitor:
     """
@@ -79,8 +103,8 @@ class ASTVisitor:
     def joinResults(self, n, chRes):
         return chRes
 
-    # Override me.
-    def visitTermNode(self, n):
+    # Override me. Called with the value of a terminal field.
+    def visitTermNode(self, v):
         pass
 
     # Override me
@@ -88,6 +112,12 @@ class ASTVisitor:
     def VisitorName(self):
         raise MiniMLError(f'Undefined VisitorName for {type(self)}')
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
+    _dispatch = {} # node class -> function (visitor, node) -> result
+
     def visit(self, n):
         """
         Default:
@@ -97,25 +127,64 @@ class ASTVisitor:
           derivedVisitor.visit{NodeName}
           node.accept{VisitorName}
           node.accept
+
+        The choice is made once per (visitor class, node class) and kept in
+        the visitor class' dispatch table, so these are looked up on classes.
+        """
+        return self.dispatch(type(n))(self, n)
+
+    def dispatch(self, nodeClass):
+        try:
+            return self._dispatch[nodeClass]
+        except KeyError:
+            f = self.resolveVisit(nodeClass)
+            if self.preHooks:
+                f = ASTVisitor.hooked(f, self.preHooks)
+            self._dispatch[nodeClass] = f
+            return f
+
+    preHooks = ()
+    # Whether a walk visits every node of the AST, so that pre hooks see them all.
+    visitsAllNodes = False
+
+    def addPreHooks(self, hooks):
+        """
+        Call each hook(n) right before visiting any node n, to run other
+        passes in the walk of this one (see passes.PassManager).
+        This visitor then gets a dispatch table of its own.
+        """
+        self.preHooks = self.preHooks + tuple(hooks)
+        self._dispatch = {}
+
+    def hooked(f, hooks):
+        def g(visitor, n):
+            for hook in hooks:
+                hook(n)
+            return f(visitor, n)
+        return g
+
+    def resolveVisit(self, nodeClass):
         """
-        if isinstance(n, TermNode):
-            return self.visitTermNode(n)
-        if hasattr(self, f'visit{n.NodeName}'):
-            f = getattr(self, f'visit{n.NodeName}')
-            return f(n)
-        if hasattr(n, f'accept{self.VisitorName}'):
-            f = getattr(n, f'accept{self.VisitorName}')
-            return f(self)
-        if hasattr(n, f'accept'):
-            f = getattr(n, f'accept')
-            return f(self)
-        res = self.visitChildren(n)
-        return self.joinResults(n, res)
+        The function (visitor, node) -> result visiting nodes of nodeClass.
+        """
+        if hasattr(type(self), f'visit{nodeClass.NodeName}'):
+            return getattr(type(self), f'visit{nodeClass.NodeName}')
+        for name in [f'accept{self.VisitorName}', 'accept']:
+            if hasattr(nodeClass, name):
+                accept = getattr(nodeClass, name)
+                return lambda visitor, n: accept(n, visitor)
+        return type(self).visitDefault
+
+    def visitDefault(self, n):
+        return self.joinResults(n, self.visitChildren(n))
 
     def visitChildren(self, n):
         res = []
-        for f, ch in n._c.items():
-            if f in n.bunchedFields:
+        for f in n.fields:
+            ch = getattr(n, f)
+            if f in n.termFields:
+                res += [self.visitTermNode(ch)]
+            elif f in n.bunchedFields:
                 res += [self(chch) for chch in ch]
             else:
                 res += [self(ch)]
@@ -131,11 +200,12 @@ class ASTTransformer(ASTVisitor):
     Node deletion not supported (do the deletion in parent node).
     """
     def visitChildren(self, n):
-        for f, ch in n._c.items():
+        for f in n.childFields:
+            ch = getattr(n, f)
             if f in n.bunchedFields:
-                n._c[f] = [self(chch) for chch in ch]
+                setattr(n, f, [self(chch) for chch in ch])
             else:
-                n._c[f] = self(ch)
+                setattr(n, f, self(ch))
 
     def visit(self, n):
         """
@@ -149,45 +219,105 @@ class ASTTransformer(ASTVisitor):
           node.accept
 
         Note:
-          Never visit a TermNode alone.
-          Do rewrite `visit` for its parent!
+          Terminal fields are not visited.
+          Do rewrite `visit` for their parent!
         """
-        if isinstance(n, TermNode):
-            return n
-        if hasattr(self, f'visit{n.NodeName}'):
-            f = getattr(self, f'visit{n.NodeName}')
-            return f(n)
-        if hasattr(n, f'accept{self.VisitorName}'):
-            f = getattr(n, f'accept{self.VisitorName}')
-            return f(self)
-        if hasattr(n, f'accept'):
-            f = getattr(n, f'accept')
-            return f(self)
+        return ASTVisitor.visit(self, n)
+
+    def visitDefault(self, n):
         self.visitChildren(n)
         return n
 
 
-class IndentedPrintVisitor(ASTVisitor):
+class IterativeVisitor(ASTVisitor):
+    """
+    Visits with an explicit stack instead of Python recursion, so arbitrarily
+    deep ASTs need no sys.setrecursionlimit.
+
+    Visit functions may be generators: `yield ch` visits the child ch and
+    evaluates to its result, and the generator's return value is the result
+    for the node. Plain visit functions work as in ASTVisitor, but recurse.
+    The default traversal is a generator, with the same order and results
+    as ASTVisitor's. In generators use `yield from self.visitChildrenIter(n)`
+    in place of `self.visitChildren(n)`.
+    """
+    def visit(self, n):
+        stack = []
+        res = self.dispatch(type(n))(self, n)
+        while True:
+            if type(res) is GeneratorType:
+                stack.append(res)
+                res = None
+            elif not stack:
+                return res
+            try:
+                ch = stack[-1].send(res)
+            except StopIteration as e:
+                stack.pop()
+                res = e.value
+                continue
+            res = self.dispatch(type(ch))(self, ch)
+
+    def visitDefault(self, n):
+        return self.joinResults(n, (yield from self.visitChildrenIter(n)))
+
+    def visitChildrenIter(self, n):
+        res = []
+        for f in n.fields:
+            ch = getattr(n, f)
+            if f in n.termFields:
+                res += [self.visitTermNode(ch)]
+            elif f in n.bunchedFields:
+                for chch in ch:
+                    res += [(yield chch)]
+            else:
+                res += [(yield ch)]
+        return res
+
+
+class IterativeTransformer(IterativeVisitor, ASTTransformer):
+    """
+    ASTTransformer on the explicit stack of IterativeVisitor.
+    """
+    def visitDefault(self, n):
+        yield from self.visitChildrenIter(n)
+        return n
+
+    def visitChildrenIter(self, n):
+        for f in n.childFields:
+            ch = getattr(n, f)
+            if f in n.bunchedFields:
+                new = []
+                for chch in ch:
+                    new += [(yield chch)]
+                setattr(n, f, new)
+            else:
+                setattr(n, f, (yield ch))
+
+
+class IndentedPrintVisitor(IterativeVisitor):
     VisitorName = 'IndentedPrint'
+    visitsAllNodes = True
     INDENT = '|   '
 
-    def visitTermNode(self, n):
-        return [str(n.v)]
+    def visitTermNode(self, v):
+        return [str(v)]
 
     def joinResults(self, n, chLines):
         return [n.NodeName] + [self.INDENT + x for x in flatten(chLines)]
 
     def visitTop(self, n):
-        res = self.visitChildren(n)
+        res = yield from self.visitChildrenIter(n)
         res = self.joinResults(n, res)
         return '\n'.join(res)
 
 
-class LISPStylePrintVisitor(ASTVisitor):
+class LISPStylePrintVisitor(IterativeVisitor):
     VisitorName = 'LISPStylePrint'
+    visitsAllNodes = True
 
-    def visitTermNode(self, n):
-        return str(n.v)
+    def visitTermNode(self, v):
+        return str(v)
 
     def joinResults(self, n, chLines):
         return '(' + ' '.join([n.NodeName] + chLines) + ')'
@@ -2,9 +2,7 @@
 This is possibly not well maintained.
 """
 
-from .ast import ASTVisitor, ASTNode
-from ..utils import *
-from ..common import *
+from .ast import ASTVisitor
 
 
 class FormattedPrintVisitor(ASTVisitor):
@@ -17,8 +15,8 @@ class FormattedPrintVisitor(ASTVisitor):
     def _q(self, s):
         return s if ' ' not in s else f'({s})'
 
-    def visitTermNode(self, n):
-        return str(n.v)
+    def visitTermNode(self, v):
+        return str(v)
 
     def joinResults(self, n, res):
         if isinstance(res, str):
@@ -126,6 +124,23 @@ end"""
         return f"""| {self(n.ptn)} ->
 {self._i(self(n.expr))}"""
 
+    def visitSwitch(self, n):
+        armsStr = '\n'.join(f"""| {i} ->\n{self._i(self(arm))}""" for i, arm in enumerate(n.arms))
+        return f"""switch {self(n.expr)} {n.base} {n.table}
+{armsStr}
+end"""
+
+    def visitUnpack(self, n):
+        return f"""unpack {', '.join(n.names)} = {self(n.val)} in
+{self(n.body)}"""
+
+    def visitCtor(self, n):
+        return f'(ctor {n.label} ' + ', '.join(f'({self(arg)})' for arg in n.args) + ')'
+
+    def visitNUnpack(self, n):
+        return f"""Unpack {n.n} {self(n.val)} in
+{self(n.body)}"""
+
     def visitIdentPtn(self, n):
         return f'{n.name}'
 
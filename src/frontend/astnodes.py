@@ -1,11 +1,9 @@
-from collections import namedtuple, OrderedDict
-
-from ..utils import *
-from ..common import *
-from .ast import ASTNode, TermNode
+from ..debug import DEBUG
+from ..utils import MiniMLError, ctxPos
+from .ast import ASTNode
 
 def nodeClassFactory(className, nodeName, fieldNames,
-        bunchedFields=None, termFields=None, Base=ASTNode):
+        bunchedFields=None, termFields=None, Base=ASTNode, module=__name__):
 
     bunchedFields = bunchedFields or []
     termFields = termFields or []
@@ -17,7 +15,6 @@ def nodeClassFactory(className, nodeName, fieldNames,
                 f'termFields {termFields} need be subset of fields {fieldNames}')
 
     def initf(self, pos=None, ctx=None, **kwargs):
-        # Python >=3.6 preserves order of kwargs
         if set(kwargs.keys()) != set(fieldNames):
             raise MiniMLError(f'for {className}, fields {fieldNames} expected, given {kwargs.keys()}')
         # dynamic type checking (we've lots of bugs on AST construction)
@@ -30,38 +27,44 @@ def nodeClassFactory(className, nodeName, fieldNames,
                     raise MiniMLError(f'{className}.{fieldName} expected to be terminal, got ASTNode: {type(val)}')
             elif not isinstance(val, ASTNode):
                 raise MiniMLError(f'{className}.{fieldName} expected to be ASTNode, got {type(val)}')
-        # Set children (for traversal)
-        pos = pos or ctxPos(ctx) or (-1, -1)
-        for termf in termFields:
-            kwargs[termf] = TermNode(kwargs[termf], pos)
-        Base.__init__(self, OrderedDict(kwargs), pos=pos)
+        self.pos = pos or ctxPos(ctx) or (-1, -1)
+        for fieldName, val in kwargs.items():
+            setattr(self, fieldName, val)
 
-    def mkGetSetDel(name, term, bunch):
-        if term:
-            def getter(self):
-                return self._c[name].v
-            def setter(self, new):
-                self._c[name].v = new
-            def deleter(self):
-                del self._c[name]
-        else:
-            def getter(self):
-                return self._c[name]
-            def setter(self, new):
-                self._c[name] = new
-            def deleter(self):
-                del self._c[name]
-        return (getter, setter, deleter)
+    def trustedf(pos=None, **kwargs):
+        """
+        Construct without checking fields, for passes that build nodes from
+        already checked ones (e.g. patmat).
+        Checked anyway if DEBUG['astnodes.CHECK_TRUSTED'].
+        """
+        if DEBUG['astnodes.CHECK_TRUSTED']:
+            return nodeClass(pos=pos, **kwargs)
+        self = object.__new__(nodeClass)
+        self.pos = pos or (-1, -1)
+        for fieldName, val in kwargs.items():
+            setattr(self, fieldName, val)
+        return self
 
-    accessors = {
-            f: property(*mkGetSetDel(f, bunch=f in bunchedFields, term=f in termFields))
-            for f in fieldNames }
-    d = {'__init__': initf, 'NodeName': nodeName, 'bunchedFields': bunchedFields, **accessors}
+    d = {
+        '__module__': module,
+        '__slots__': tuple(fieldNames),
+        '__init__': initf,
+        'trusted': staticmethod(trustedf),
+        'NodeName': nodeName,
+        'fields': tuple(fieldNames),
+        'termFields': tuple(termFields),
+        'bunchedFields': tuple(bunchedFields),
+        'childFields': tuple(f for f in fieldNames if f not in termFields),
+    }
     nodeClass = type(className, (Base,), d)
     return nodeClass
 
 
-def createNodes(spec):
+def createNodes(spec, module=__name__):
+    """
+    Node classes of the spec, to be put in the globals of `module` (so that
+    they pickle).
+    """
     spec = [x.split() for x in spec.strip().split('\n') if x.strip() != '' and not x.startswith('#')]
     classes = {}
     for nodeName, _, *fieldNames in spec:
@@ -70,7 +73,7 @@ def createNodes(spec):
         fieldNames = [f.replace('+', '').replace('.', '') for f in fieldNames]
         className = nodeName + 'Node'
         nodeClass = nodeClassFactory(className, nodeName, fieldNames,
-                bunchedFields=bunchedFields, termFields=termFields)
+                bunchedFields=bunchedFields, termFields=termFields, module=module)
         classes[className] = nodeClass
     return classes
 
@@ -97,6 +100,12 @@ Match                   : expr arms+
         PtnTuple        : subs+
         PtnLit          : expr
         PtnData         : name. subs+
+# patmat output. Switch jumps on the constructor of expr, to arms[table[label - base]].
+Switch                  : expr  base.  table.  arms+
+# binds names to the arguments of val, a value of the constructor with label
+Unpack                  : label.  names.  val  body
+# datarepr output. Constructor value, an immediate if it has no args.
+Ctor                    : label.  args+
 Lam                     : name.  ty  body
 Seq                     : subs+
 Ite                     : cond  tr  fl
@@ -1,8 +1,11 @@
-from ..utils import *
-from ..common import *
+from ..utils import text
 from ..generated.MiniMLParser import MiniMLParser
 from ..generated.MiniMLVisitor import MiniMLVisitor
-from .astnodes import *
+from .astnodes import (AppNode, BinOpNode, BuiltinNode, DataCtorNode, DataTypeNode,
+        IteNode, LamNode, LetNode, LetRecArmNode, LetRecNode, LitNode, MatchArmNode,
+        MatchNode, NthNode, PtnBinderNode, PtnDataNode, PtnLitNode, PtnTupleNode,
+        SeqNode, TopNode, TupleNode, TyBaseNode, TyDataNode, TyLamNode, TyUnkNode,
+        UnaOpNode, VarRefNode)
 
 def _acceptMaybeTy(ctx, visitor):
     if ctx.ty() is None:
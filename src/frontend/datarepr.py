@@ -0,0 +1,108 @@
+"""
+Data representation: lays out constructor values.
+Should come after patmat.
+
+    A constructor value is a single block [label, a1, ..., an], made by a Ctor
+    node (one allocation). A constructor whose arguments are all of type unit
+    carries nothing but its label, so it is an immediate instead: a Ctor node
+    without arguments, which allocates nothing.
+
+    Saturated constructor applications become Ctor nodes directly
+    ```
+        Cons 1 l            =>  Ctor Cons (1, l)
+        Nil ()              =>  Ctor Nil ()                 -- with `Nil unit`
+        Nil (println 1)     =>  println 1; Ctor Nil ()
+    ```
+    Only constructors also used otherwise, i.e. partially applied or passed
+    as values, are defined as curried functions, before the program
+    ```
+        | ctor a1 a2
+
+        ->
+
+        let ctor = \\a1 -> \\a2 -> Ctor ctor (a1, a2) in cont
+    ```
+
+    Unpacks of immediates bind their variables to ().
+"""
+from collections import namedtuple
+
+from .ast import IterativeTransformer
+from .astnodes import (AppNode, CtorNode, LamNode, LetNode, LitNode, NullNode, SeqNode, TyBaseNode,
+        VarRefNode)
+
+# boxed: whether the ctor's values are blocks, or else immediates
+CtorRepr = namedtuple('CtorRepr', 'label arity boxed')
+
+
+class DataReprVisitor(IterativeTransformer):
+    """
+    Lowers constructor applications and unpacks to the data representation.
+    """
+    VisitorName = 'DataRepr'
+
+    def __init__(self):
+        self.ctors = {}     # ctor name -> CtorRepr
+        self.labels = {}    # ctor label -> CtorRepr
+        self.unsaturated = set() # ctor names used other than saturated
+
+    def visitTop(self, n):
+        for dt in n.dataTypes:
+            for c in dt.ctors:
+                name, label = c.name
+                boxed = not all(isinstance(ty, TyBaseNode) and ty.name == 'unit' for ty in c.argTys)
+                self.ctors[name] = self.labels[label] = CtorRepr(label, len(c.argTys), boxed)
+        expr = yield n.expr
+        for dt in reversed(n.dataTypes):
+            for c in reversed(dt.ctors):
+                if c.name[0] in self.unsaturated:
+                    expr = LetNode.trusted(pos=c.pos, name=c.name[0], ty=NullNode.trusted(),
+                            val=self.curried(c), body=expr)
+        n.expr = expr
+        return n
+
+    def curried(self, c):
+        name, label = c.name
+        params = [f'${name}@{i}' for i in range(len(c.argTys))]
+        fn = self.mkCtor(self.labels[label], [VarRefNode.trusted(name=a) for a in params], c.pos)
+        for a in reversed(params):
+            fn = LamNode.trusted(pos=c.pos, name=a, ty=NullNode.trusted(), body=fn)
+        return fn
+
+    def mkCtor(self, ctor, args, pos):
+        if ctor.boxed:
+            return CtorNode.trusted(pos=pos, label=ctor.label, args=args)
+        # keep the arguments' effects
+        args = [a for a in args if not isinstance(a, (LitNode, VarRefNode))]
+        res = CtorNode.trusted(pos=pos, label=ctor.label, args=[])
+        return SeqNode.trusted(pos=pos, subs=args + [res]) if args else res
+
+    def visitApp(self, n):
+        args = []
+        fn = n
+        while isinstance(fn, AppNode):
+            args += [fn.arg]
+            fn = fn.fn
+        ctor = self.ctors.get(fn.name) if isinstance(fn, VarRefNode) else None
+        if ctor is None or len(args) != ctor.arity:
+            yield from self.visitChildrenIter(n)
+            return n
+        new = []
+        for a in reversed(args):
+            new += [(yield a)]
+        return self.mkCtor(ctor, new, n.pos)
+
+    def visitVarRef(self, n):
+        if n.name in self.ctors:
+            self.unsaturated.add(n.name)
+        return n
+
+    def visitUnpack(self, n):
+        if self.labels[n.label].boxed:
+            yield from self.visitChildrenIter(n)
+            return n
+        body = yield n.body
+        for name in reversed(n.names):
+            body = LetNode.trusted(pos=n.pos, name=name, ty=NullNode.trusted(),
+                    val=LitNode.trusted(val=()), body=body)
+        return body
@@ -3,8 +3,9 @@ Should be done after Namer's alpha conversion pass.
 
 De brujin indices are unstable so only do this pass just before emitting to SECD.
 """
-from .ast import *
-from .astnodes import *
+from ..utils import MiniMLLocatedError
+from .ast import IterativeTransformer
+from .astnodes import createNodes
 
 # New ASTNodes
 # idx, sub >= 1.
@@ -15,12 +16,54 @@ NVarRef    : idx.
 NClosRef   : idx. sub.
 NLetRecArm : val
 NLet       : val body
+NUnpack    : n. val body
 
 NIdentPtn        :
 NTuplePtn        : subs+
-"""))
+""", __name__))
 
-class DeBrujinVisitor(ASTTransformer):
+class DeBrujinScope:
+    """
+    The binders in scope, each a name, or a tuple of names for a let rec group.
+
+    Every name maps to the stack of its binders' depths, so resolving a name
+    takes O(1): its index is the depth of the innermost binder minus the
+    depth of its own.
+    """
+    def __init__(self):
+        self.binders = []   # innermost last
+        self.depths = {}    # name -> [(depth, sub)], innermost last. sub is 0 for a single name
+
+    def push(self, var):
+        self.binders.append(var)
+        depth = len(self.binders)
+        if isinstance(var, tuple):
+            for sub, name in enumerate(var):
+                self.depths.setdefault(name, []).append((depth, sub+1))
+        else:
+            self.depths.setdefault(var, []).append((depth, 0))
+
+    def pop(self):
+        var = self.binders.pop()
+        for name in var if isinstance(var, tuple) else (var,):
+            shadowed = self.depths[name]
+            shadowed.pop()
+            if not shadowed:
+                del self.depths[name]
+
+    def resolve(self, name):
+        """
+        (idx, sub) of name with idx >= 1, sub >= 1 within let rec groups and 0
+        otherwise. None if name is not in scope.
+        """
+        shadowed = self.depths.get(name)
+        if shadowed is None:
+            return None
+        depth, sub = shadowed[-1]
+        return len(self.binders) - depth + 1, sub
+
+
+class DeBrujinVisitor(IterativeTransformer):
     """
     Convert to de brujin representation.
 
@@ -29,26 +72,27 @@ class DeBrujinVisitor(ASTTransformer):
     VisitorName = 'DeBrujin'
 
     def __init__(self):
-        self.vars = []
+        self.scope = DeBrujinScope()
 
     def pushVar(self, var):
-        self.vars = [var] + self.vars
+        self.scope.push(var)
 
-    def popVar(self, n=1):
-        self.vars = self.vars[n:]
+    def popVar(self):
+        self.scope.pop()
 
     def visitVarRef(self, n):
-        for i, v in enumerate(self.vars):
-            if isinstance(v, str) and v == n.name:
-                return NVarRefNode(pos=n.pos, idx=i+1)
-            if isinstance(v, tuple) and n.name in v:
-                return NClosRefNode(pos=n.pos, idx=i+1, sub=v.index(n.name)+1)
-        raise MiniMLLocatedError(n, f'cannot find {n.name}')
+        res = self.scope.resolve(n.name)
+        if res is None:
+            raise MiniMLLocatedError(n, f'cannot find {n.name}')
+        idx, sub = res
+        if sub == 0:
+            return NVarRefNode.trusted(pos=n.pos, idx=idx)
+        return NClosRefNode.trusted(pos=n.pos, idx=idx, sub=sub)
 
     def visitLam(self, n):
         self.pushVar(n.name)
         del n.name
-        new = NLamNode(pos=n.pos, body=self(n.body))
+        new = NLamNode.trusted(pos=n.pos, body=(yield n.body))
         self.popVar()
         return new
 
@@ -56,15 +100,24 @@ class DeBrujinVisitor(ASTTransformer):
         self.pushVar(tuple(arm.fnName for arm in n.arms))
         for i, arm in enumerate(n.arms):
             self.pushVar(arm.argName)
-            n.arms[i] = NLetRecArmNode(pos=arm.pos, val=self(arm.val))
+            n.arms[i] = NLetRecArmNode.trusted(pos=arm.pos, val=(yield arm.val))
             self.popVar()
-        n.body = self(n.body)
+        n.body = yield n.body
         self.popVar()
         return n
 
+    def visitUnpack(self, n):
+        val = yield n.val
+        for name in n.names:
+            self.pushVar(name)
+        new = NUnpackNode.trusted(pos=n.pos, n=len(n.names), val=val, body=(yield n.body))
+        for name in n.names:
+            self.popVar()
+        return new
+
     def visitLet(self, n):
-        val = self(n.val)
+        val = yield n.val
         self.pushVar(n.name)
-        new = NLetNode(pos=n.pos, val=val, body=self(n.body))
+        new = NLetNode.trusted(pos=n.pos, val=val, body=(yield n.body))
         self.popVar()
         return new
@@ -0,0 +1,326 @@
+"""
+Flat, array-backed IR for the backend.
+
+After patmat only a small set of node kinds is left. FlatLowerVisitor lowers
+them into parallel arrays, and backend passes work on the arrays directly,
+without per-node objects. The IR pickles compactly as well.
+
+Should be done after patmat.
+"""
+from array import array
+from collections import namedtuple
+from types import GeneratorType
+
+from ..utils import MiniMLLocatedError
+from .ast import IterativeVisitor
+from .debrujin import DeBrujinScope
+from .secdgen import SECDEmitter
+
+# Opcodes, with the meaning of the operand columns a, b, c.
+#   Child nodes (ch) are node indices. Names, literals and operators are
+#   indices into consts. Lists of children are the kids[a:a+b] slice.
+OPCODES = """
+Top     : expr.ch
+Lit     : val.const
+VarRef  : name.const
+Builtin : name.const
+Lam     : name.const body.ch
+Let     : name.const val.ch body.ch
+LetRec  : arms.kids narms body.ch
+LetRecArm : fnName.const argName.const val.ch
+Seq     : subs.kids nsubs
+Tuple   : subs.kids nsubs
+Ite     : cond.ch tr.ch fl.ch
+BinOp   : lhs.ch rhs.ch op.const
+UnaOp   : sub.ch op.const
+App     : fn.ch arg.ch
+Nth     : expr.ch idx
+Switch  : subs.kids nsubs table.const
+Unpack  : names.const val.ch body.ch
+Ctor    : args.kids nargs label
+"""
+# Switch: subs are the scrutinee then the arms, table is (base, table) of the Switch node
+OPNAMES = [x.split(':')[0].strip() for x in OPCODES.strip().split('\n')]
+OPFIELDS = [x.split(':')[1].split() for x in OPCODES.strip().split('\n')]
+globals().update({ f'OP_{name.upper()}': op for op, name in enumerate(OPNAMES) })
+
+_Loc = namedtuple('_Loc', 'pos')
+
+
+class FlatIR:
+    """
+    Nodes are indices into the parallel arrays op, a, b, c, line and col.
+    Children come before their parents, so the root is the last node.
+    """
+    def __init__(self):
+        self.op = array('B')
+        self.a = array('l')
+        self.b = array('l')
+        self.c = array('l')
+        self.line = array('l')
+        self.col = array('l')
+        self.kids = array('l')
+        self.consts = []
+        self.constIdx = {}
+
+    def emit(self, op, pos, a=0, b=0, c=0):
+        self.op.append(op)
+        self.a.append(a)
+        self.b.append(b)
+        self.c.append(c)
+        self.line.append(pos[0])
+        self.col.append(pos[1])
+        return len(self.op) - 1
+
+    def const(self, v):
+        key = (type(v), v)
+        idx = self.constIdx.get(key)
+        if idx is None:
+            idx = self.constIdx[key] = len(self.consts)
+            self.consts.append(v)
+        return idx
+
+    def children(self, chs):
+        start = len(self.kids)
+        self.kids.extend(chs)
+        return start, len(chs)
+
+    def root(self):
+        return len(self.op) - 1
+
+    def loc(self, i):
+        """
+        For MiniMLLocatedError.
+        """
+        return _Loc((self.line[i], self.col[i]))
+
+    def __getstate__(self):
+        return { k: v for k, v in self.__dict__.items() if k != 'constIdx' }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.constIdx = { (type(v), v): i for i, v in enumerate(self.consts) }
+
+    def __str__(self):
+        lines = []
+        for i, op in enumerate(self.op):
+            args = []
+            for field, x in zip(OPFIELDS[op], (self.a[i], self.b[i], self.c[i])):
+                if field.endswith('.const'):
+                    args += [repr(self.consts[x])]
+                elif field.endswith('.kids'):
+                    args += ['[' + ' '.join(f'%{k}' for k in self.kids[x:x+self.b[i]]) + ']']
+                elif field.endswith('.ch'):
+                    args += [f'%{x}']
+                else:
+                    args += [str(x)]
+            lines += [f'%{i:<6}{OPNAMES[op]:<10}' + ' '.join(args)]
+        return '\n'.join(lines)
+
+
+class FlatLowerVisitor(IterativeVisitor):
+    """
+    Lowers the AST after patmat into a FlatIR. Returns the IR.
+    Type annotations and data type declarations are dropped.
+    """
+    VisitorName = 'FlatLower'
+
+    def __init__(self):
+        self.ir = FlatIR()
+
+    def visitTop(self, n):
+        self.ir.emit(OP_TOP, n.pos, (yield n.expr))
+        return self.ir
+
+    def visitLit(self, n):
+        return self.ir.emit(OP_LIT, n.pos, self.ir.const(n.val))
+
+    def visitVarRef(self, n):
+        return self.ir.emit(OP_VARREF, n.pos, self.ir.const(n.name))
+
+    def visitBuiltin(self, n):
+        return self.ir.emit(OP_BUILTIN, n.pos, self.ir.const(n.name))
+
+    def visitLam(self, n):
+        return self.ir.emit(OP_LAM, n.pos, self.ir.const(n.name), (yield n.body))
+
+    def visitLet(self, n):
+        val = yield n.val
+        return self.ir.emit(OP_LET, n.pos, self.ir.const(n.name), val, (yield n.body))
+
+    def visitLetRec(self, n):
+        arms = []
+        for arm in n.arms:
+            arms += [(yield arm)]
+        start, narms = self.ir.children(arms)
+        return self.ir.emit(OP_LETREC, n.pos, start, narms, (yield n.body))
+
+    def visitLetRecArm(self, n):
+        return self.ir.emit(OP_LETRECARM, n.pos,
+                self.ir.const(n.fnName), self.ir.const(n.argName), (yield n.val))
+
+    def visitSeq(self, n):
+        return self.emitList(OP_SEQ, n, (yield from self.visitSubs(n)))
+
+    def visitTuple(self, n):
+        return self.emitList(OP_TUPLE, n, (yield from self.visitSubs(n)))
+
+    def visitSubs(self, n):
+        subs = []
+        for sub in n.subs:
+            subs += [(yield sub)]
+        return subs
+
+    def emitList(self, op, n, subs):
+        start, nsubs = self.ir.children(subs)
+        return self.ir.emit(op, n.pos, start, nsubs)
+
+    def visitIte(self, n):
+        cond = yield n.cond
+        tr = yield n.tr
+        return self.ir.emit(OP_ITE, n.pos, cond, tr, (yield n.fl))
+
+    def visitBinOp(self, n):
+        lhs = yield n.lhs
+        return self.ir.emit(OP_BINOP, n.pos, lhs, (yield n.rhs), self.ir.const(n.op))
+
+    def visitUnaOp(self, n):
+        return self.ir.emit(OP_UNAOP, n.pos, (yield n.sub), 0, self.ir.const(n.op))
+
+    def visitApp(self, n):
+        fn = yield n.fn
+        return self.ir.emit(OP_APP, n.pos, fn, (yield n.arg))
+
+    def visitNth(self, n):
+        return self.ir.emit(OP_NTH, n.pos, (yield n.expr), n.idx)
+
+    def visitSwitch(self, n):
+        subs = [(yield n.expr)]
+        for arm in n.arms:
+            subs += [(yield arm)]
+        start, nsubs = self.ir.children(subs)
+        return self.ir.emit(OP_SWITCH, n.pos, start, nsubs, self.ir.const((n.base, n.table)))
+
+    def visitUnpack(self, n):
+        val = yield n.val
+        return self.ir.emit(OP_UNPACK, n.pos, self.ir.const(n.names), val, (yield n.body))
+
+    def visitCtor(self, n):
+        args = []
+        for arg in n.args:
+            args += [(yield arg)]
+        start, nargs = self.ir.children(args)
+        return self.ir.emit(OP_CTOR, n.pos, start, nargs, n.label)
+
+    def visitDefault(self, n):
+        raise MiniMLLocatedError(n, f'{n.NodeName} cannot be lowered, run patmat first')
+
+
+class FlatSECDGen(SECDEmitter):
+    """
+    Generates SECD from a FlatIR, resolving variables to de Bruijn indices
+    on the way (as DeBrujinVisitor + SECDGenVisitor do on the AST). The
+    output, labels included, is the same as theirs, see SECDEmitter.
+
+    Walks with an explicit stack of generators, like IterativeVisitor.
+    """
+    def __init__(self):
+        super().__init__()
+        self.scope = DeBrujinScope()
+        self.handlers = [getattr(self, f'gen{name}') for name in OPNAMES]
+
+    def bind(self, var):
+        self.scope.push(var)
+
+    def unbind(self):
+        self.scope.pop()
+
+    def __call__(self, ir):
+        self.ir = ir
+        self.walk(ir.root())
+        return self
+
+    def walk(self, i):
+        stack = []
+        res = self.handlers[self.ir.op[i]](i)
+        while True:
+            if type(res) is GeneratorType:
+                stack.append(res)
+                res = None
+            elif not stack:
+                return res
+            try:
+                ch = stack[-1].send(res)
+            except StopIteration as e:
+                stack.pop()
+                res = e.value
+                continue
+            res = self.handlers[self.ir.op[ch]](ch)
+
+    def kids(self, i):
+        return self.ir.kids[self.ir.a[i]:self.ir.a[i]+self.ir.b[i]]
+
+    def const(self, x):
+        return self.ir.consts[x]
+
+    def genTop(self, i):
+        return self.top(self.ir.a[i])
+
+    def genLit(self, i):
+        return self.lit(self.const(self.ir.a[i]))
+
+    def genVarRef(self, i):
+        name = self.const(self.ir.a[i])
+        res = self.scope.resolve(name)
+        if res is None:
+            raise MiniMLLocatedError(self.ir.loc(i), f'cannot find {name}')
+        return self.access(*res)
+
+    def genBuiltin(self, i):
+        return self.builtin(self.const(self.ir.a[i]))
+
+    def genLam(self, i):
+        return self.lam(self.const(self.ir.a[i]), self.ir.b[i])
+
+    def genLet(self, i):
+        return self.let(i, self.const(self.ir.a[i]), self.ir.b[i], self.ir.c[i])
+
+    def genUnpack(self, i):
+        return self.unpack(i, self.const(self.ir.a[i]), self.ir.b[i], self.ir.c[i])
+
+    def genSwitch(self, i):
+        expr, *arms = self.kids(i)
+        base, table = self.const(self.ir.c[i])
+        return self.switch(i, expr, base, table, arms)
+
+    def genLetRec(self, i):
+        arms = self.kids(i)
+        fnNames = tuple(self.const(self.ir.a[arm]) for arm in arms)
+        return self.letRec(i, fnNames, arms, self.ir.c[i])
+
+    def genLetRecArm(self, i):
+        return self.letRecArm(self.const(self.ir.b[i]), self.ir.c[i])
+
+    def genSeq(self, i):
+        return self.seq(i, self.kids(i))
+
+    def genTuple(self, i):
+        return self.mktuple(self.kids(i))
+
+    def genCtor(self, i):
+        return self.ctor(self.ir.c[i], self.kids(i))
+
+    def genIte(self, i):
+        return self.ite(i, self.ir.a[i], self.ir.b[i], self.ir.c[i])
+
+    def genBinOp(self, i):
+        return self.binOp(self.const(self.ir.c[i]), self.ir.a[i], self.ir.b[i])
+
+    def genUnaOp(self, i):
+        return self.unaOp(self.const(self.ir.c[i]), self.ir.a[i])
+
+    def genApp(self, i):
+        return self.app(self.ir.a[i], self.ir.b[i])
+
+    def genNth(self, i):
+        return self.nth(self.ir.b[i], self.ir.a[i])
@@ -13,10 +13,10 @@ It also assigns the integer label for each constructor,
 by making DataCtor.name and PtnData.name a tuple (str, int).
 > This should actually be a class or variant including symbol information.
 """
-from .ast import *
-from .astnodes import *
+from ..utils import MiniMLError, MiniMLLocatedError, joinlist, noDuplicates
+from .ast import IterativeVisitor
 
-class NamerVisitor(ASTVisitor):
+class NamerVisitor(IterativeVisitor):
     """
     Renaming process.
 
@@ -28,6 +28,7 @@ class NamerVisitor(ASTVisitor):
     def __init__(self):
         self.nameSuffix = {} # global for all scopes
         self.vars = []       # push and pop'ed
+        self.scopes = {}     # oldName -> stack of newNames in scope, innermost last
 
     def genName(self, name, namespace='_'):
         suffix = self.nameSuffix.get(name, 0)
@@ -39,21 +40,24 @@ class NamerVisitor(ASTVisitor):
         # TODO: should we mangle data ctor by just prefixing them with a namespace
         newName = self.genName(oldName) if mangle else oldName
         self.vars.append((oldName, newName))
+        self.scopes.setdefault(oldName, []).append(newName)
         return newName
 
     def undefVar(self, newName_=None):
         oldName, newName = self.vars.pop()
         if newName_ is not None and newName != newName_:
             raise MiniMLError(f'unmatched undefVar. arg={newName_}, pop() got={newName}')
+        shadowed = self.scopes[oldName]
+        shadowed.pop()
+        if not shadowed:
+            del self.scopes[oldName]
 
     def visitVarRef(self, n):
-        for (oldName, newName) in reversed(self.vars):
-            if n.name == oldName:
-                n.name = newName
-                break
-        else:
+        shadowed = self.scopes.get(n.name)
+        if shadowed is None:
             print(self.vars)
             raise MiniMLLocatedError(n, f'unknown name: {n.name}')
+        n.name = shadowed[-1]
 
     def visitTop(self, n):
         # check dataTypes, declare dataType ctors
@@ -66,17 +70,17 @@ class NamerVisitor(ASTVisitor):
         self.dataTypes = []
         self.ctorLabels = {}
         for dt in n.dataTypes:
-            self(dt)
+            yield dt
 
         # check the expression
-        self(n.expr)
+        yield n.expr
 
     def visitDataType(self, n):
         if n.name in self.dataTypes:
             raise MiniMLLocatedError(n, f'data type {n.name} already defined')
         self.dataTypes += [n.name]
         for ctor in n.ctors:
-            self(ctor)
+            yield ctor
 
     def visitDataCtor(self, n):
         if n.name in self.ctorLabels:
@@ -91,8 +95,8 @@ class NamerVisitor(ASTVisitor):
 
     def visitLam(self, n):
         n.name = self.defVar(n.name)
-        self(n.ty)
-        self(n.body)
+        yield n.ty
+        yield n.body
         self.undefVar(n.name)
 
     def visitLetRec(self, n):
@@ -101,30 +105,30 @@ class NamerVisitor(ASTVisitor):
             raise MiniMLLocatedError(n, 'duplicate names in let-rec')
 
         for arm in n.arms:
-            self(arm.fnTy)
-            self(arm.argTy)
+            yield arm.fnTy
+            yield arm.argTy
             arm.fnName = self.defVar(arm.fnName)
 
         for arm in n.arms:
             arm.argName = self.defVar(arm.argName)
-            self(arm.val)
+            yield arm.val
             self.undefVar(arm.argName)
 
-        self(n.body)
+        yield n.body
 
         for arm in reversed(n.arms):
             self.undefVar(arm.fnName)
 
     def visitLet(self, n):
-        self(n.ty)
-        self(n.val)
+        yield n.ty
+        yield n.val
         n.name = self.defVar(n.name)
-        self(n.body)
+        yield n.body
         self.undefVar(n.name)
 
     def visitMatchArm(self, n):
-        ptnBinders = self(n.ptn)
-        self(n.expr)
+        ptnBinders = yield n.ptn
+        yield n.expr
         for v in reversed(ptnBinders):
             self.undefVar(v)
 
@@ -134,7 +138,10 @@ class NamerVisitor(ASTVisitor):
 
     def visitPtnTuple(self, n):
         # TODO: duplicate bindings in one pattern?
-        return joinlist([], [self(p) for p in n.subs])
+        binders = []
+        for p in n.subs:
+            binders += [(yield p)]
+        return joinlist([], binders)
 
     def visitPtnLit(self, n):
         return []
@@ -143,4 +150,7 @@ class NamerVisitor(ASTVisitor):
         if n.name not in self.ctorLabels:
             raise MiniMLLocatedError(n, f'undefined data constructor {n.name}')
         n.name = (n.name, self.ctorLabels[n.name])
-        return joinlist([], [self(p) for p in n.subs])
+        binders = []
+        for p in n.subs:
+            binders += [(yield p)]
+        return joinlist([], binders)
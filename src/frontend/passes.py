@@ -0,0 +1,76 @@
+"""
+Running passes over the AST, with per-pass timings and fewer tree walks.
+"""
+import json
+import time
+from contextlib import contextmanager
+
+from .ast import IterativeVisitor
+
+
+class HookWalker(IterativeVisitor):
+    """
+    A walk doing nothing but the pre hooks.
+    """
+    VisitorName = 'HookWalker'
+    visitsAllNodes = True
+
+    def __init__(self, hooks):
+        self.addPreHooks(hooks)
+
+    def visitDefault(self, n):
+        yield from self.visitChildrenIter(n)
+
+
+class PassManager:
+    """
+    Runs passes over the AST and records their wall times.
+
+    A node-local pass, i.e. a hook(n) that can run on each node in any order,
+    is queued by `defer`. It is fused into the walk of the next pass run whose
+    visitor visitsAllNodes, or else walks the AST alone right before that pass.
+    Fused passes are timed together, e.g. as 'tag+typedprint'.
+    """
+    def __init__(self):
+        self.times = {} # pass name -> wall time in seconds
+        self.deferred = [] # (pass name, hook)
+
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] = self.times.get(name, 0) + time.perf_counter() - start
+
+    def defer(self, name, hook):
+        self.deferred += [(name, hook)]
+
+    def run(self, name, visitor, ast):
+        """
+        Returns visitor(ast), fused with the deferred passes if possible.
+        """
+        if self.deferred and visitor.visitsAllNodes:
+            name = '+'.join([d for d, _ in self.deferred] + [name])
+            visitor.addPreHooks([hook for _, hook in self.deferred])
+            self.deferred = []
+        else:
+            self.flush(ast)
+        with self.timed(name):
+            return visitor(ast)
+
+    def flush(self, ast):
+        """
+        Runs the deferred passes now.
+        """
+        if not self.deferred:
+            return
+        name = '+'.join(d for d, _ in self.deferred)
+        walker = HookWalker([hook for _, hook in self.deferred])
+        self.deferred = []
+        with self.timed(name):
+            walker(ast)
+
+    def dump(self, f):
+        json.dump(self.times, f, indent=2)
+        print(file=f)
@@ -1,159 +1,110 @@
 """
-Convert pattern matching into plain lambda.
-Used to be bad design of premature desugaring.
+Compile pattern matching into plain lets, tests, projections and constructor
+switches.
 Should come after typer and namer.
 
 - After namer:
     possible to clash invented names with existing ones, but avoided by carefully choosing namespaces.
 - After typer:
     better type error info.
-    the translation can be untyped (which is crucial as the scheme below is not typable).
+    the translation is untyped, it relies on the program being well typed
+    (e.g. tuple patterns are never tested, only projected).
 
 Translation scheme:
 
-    Translating into pattern lambdas with a ptn2lam function.
-
-        ptn2lam(ptn, rhs): lam
-
-    Since lambdas does it automatically, we need not worry about name binding.
-    @p -> r     is transformed into     \\args ... -> (OK|FAIL, r)
-
-    A match expression is translated as
+    Matches compile into decision trees (Maranget, "Compiling pattern matching
+    to good decision trees", 2008). Every scrutinee position is tested at most
+    once on any path, and pattern variables are bound by plain lets: matching
+    allocates nothing.
+
+    The arms form a clause matrix: a row per arm, a column per position of
+    the scrutinee (an occurrence) still to be matched. Occurrences are
+    variables, bound to a projection of their parent occurrence if the tree
+    uses them.
+
+        compile(occurrences, rows):
+            no rows                 =>  the match fails: panic ()
+            first row irrefutable   =>  its arm, after binding its variables
+            otherwise, take the first column whose pattern in the first row
+            is not a variable, and
+                tuples              =>  expand the column into a column per
+                                        component, i.e. let o_i = nth i o
+                constructors        =>  switch on the constructor of o, a jump
+                                        table over the constructors of its data
+                                        type. A case unpacks the constructor's
+                                        arguments into a column each.
+                literals            =>  test o against each literal of the column.
+            In the case for constructor (literal) c, the rows are those with c
+            or a variable in the column, the constructor replaced by its
+            arguments. The default case has the rows with a variable. It is
+            left out when the column covers all constructors (values).
+
+    For example
     ```
-        match expr
-        | p1 -> r1
-        | p2 -> r2
-        | ...
-        | pk -> rk
+        match l
+        | Nil _ -> a
+        | Cons v t -> b
         end
 
         =>
 
-        // compute expr ahead and pushenv so we can reuse it
-        let e = expr in
-
-            // try first pattern
-            let lam1 = ptn2lam (@p1 -> r1) in
-            let res1 = lam1 e in
-            if nth 0 res1 == OK then nth 1 res1 else
-
-            // try second pattern
-            let lam2 = ptn2lam (@p2 -> r2) in
-            let res2 = lam2 e in
-            if nth 0 res2 == OK then nth 1 res2 else
-
-            // try remaining patterns
-            ...
-
-            // try last (assume k-th) pattern
-            let lam_k = ptn2lam (@pk -> rk) in
-            let res_k = lam_k e in
-            if nth 0 res_k == OK then nth 1 res_k else
-
-            // inexhaustive match
-            undefined // for now it's (_FAIL, _DUMMY), should be panic
-    ```
-
-    When p is ident pattern
-    ```
-        ptn2lam( @i -> r )
-        =
-        \\i -> (OK, r)      where i could occur freely in r
+        let e = l in
+        switch e
+        | Nil -> a
+        | Cons -> unpack (v, t) = e in b
     ```
 
-    When p is a constant pattern
-    ```
-        ptn2lam( @c -> r )
-        =
-        \\x -> if x == c then (OK, r) else (FAIL, _)
-    ```
-
-    When p is a tuple pattern, things gets complicated, as we got to do a lot
-    of tuple unrolling.
-    > The SLPJ book avoids this problem because it does not use a tuple to encode
-    > match failure, rather it uses a bottom value.
-    ```
-        ptn2lam( @p1..pk -> r )
-        =
-
-        \\x ->
-            let lam = ptn2lam p1 (ptn2lam p2 (... (ptn2lam pk r))) in
-
-            // the 1st pattern in the tuple
-            #let f0 = lam in
-            let r0 = lam (nth 0 x) in
-            if nth 0 r0 == FAIL then (FAIL, _) else
-
-            #let f1 = (nth 1 r0) in
-            let r1 = f1 (nth 1 x) in
-            if nth 0 r1 == FAIL then (FAIL, _) else
-
-            ...
-
-            #let f_k-1 = (nth 1 r_k-2) in
-            let r_k-1 = f_k-1 (nth k-1 x) in
-            if nth 0 r_k-1 == FAIL then (FAIL, _) else
-
-            (OK, nth 1 r_k-1)
-    ```
-
-    When p is a adt pattern, simply convert it to the tuple form
-    ```
-        ptn2lam( @ctor p1..pk -> r)
-        =
-        \\x ->
-            if nth 0 x == V_ctor then
-                ptn2lam (@p1..pk -> r) (nth 1 x)
-            else
-                (FAIL, _)
-    ```
+    Switch and Unpack nodes are kept down to SECD generation, which emits
+    them as a single indexed jump and a single destructuring instruction.
 
-    And for the data type definitions, each constructor is transformed into a 'let'
-        ```
-        | ctor a1 a2
+    An arm can end up in more than one leaf. Small ones are copied, larger
+    ones are shared as a function of their variables, defined before the tree.
 
-        ->
-
-        let ctor = \\a1 -> \\a2 -> (V_ctor, (a1, a2)) in cont
-        ```
+    Constructor values and the constructors themselves are left to datarepr.
 """
-from .ast import *
-from .astnodes import *
-from ..utils import *
-from ..common import *
+from collections import namedtuple
 
-# match expressions actually return (_OK, T) or (_FAIl, _DUMMY)
-_OKVAL = 111
-_ERRVAL = 222
-_DUMMYVAL = 333
+from ..utils import unreachable
+from .ast import IterativeTransformer
+from .astnodes import (AppNode, BinOpNode, BuiltinNode, IteNode, LamNode, LetNode, LitNode,
+        NthNode, NullNode, PtnBinderNode, PtnDataNode, PtnLitNode, PtnTupleNode, SwitchNode,
+        TupleNode, UnpackNode, VarRefNode)
 
-def ok(expr):
-    return TupleNode(subs=[LitNode(val=_OKVAL), expr])
+# Arms of at most this many nodes are copied into each of their leaves.
+COPY_ARM_SIZE = 32
 
-def err():
-    return TupleNode(subs=[LitNode(val=_ERRVAL), LitNode(val=_DUMMYVAL)])
+# Decision trees
+#   binds: [(name, occurrence)] for the pattern variables of the arm
+Fail = namedtuple('Fail', '')
+Leaf = namedtuple('Leaf', 'arm binds')
+Project = namedtuple('Project', 'name occ idx body')    # let name = nth idx occ in body
+Switch = namedtuple('Switch', 'occ cases default')      # cases: [(value, tree)]. default may be None
+CtorSwitch = namedtuple('CtorSwitch', 'occ labels cases default')   # labels: all of the data type
+Unpack = namedtuple('Unpack', 'label names occ body')   # binds names to the arguments of occ, of ctor label
 
-def is_ok(expr):
-    return BinOpNode(lhs=NthNode(idx=0, expr=expr), op='==', rhs=LitNode(val=_OKVAL))
+# A row of the clause matrix. ptns has a pattern or None (matches anything) per column.
+Row = namedtuple('Row', 'ptns binds arm')
 
-def is_err(expr):
-    return BinOpNode(lhs=NthNode(idx=0, expr=expr), op='==', rhs=LitNode(val=_ERRVAL))
+def _v(name):
+    return VarRefNode.trusted(name=name)
 
-def unwrap(expr):
-    return NthNode(idx=1, expr=expr)
+def _let(name, val, body):
+    return LetNode.trusted(name=name, ty=NullNode.trusted(), val=val, body=body)
 
-def _v(name):
-    return VarRefNode(name=name)
+def _lam(name, body):
+    return LamNode.trusted(name=name, ty=NullNode.trusted(), body=body)
 
 
-class PatMatVisitor(ASTTransformer):
+class PatMatVisitor(IterativeTransformer):
     """
     Pattern matching desugaring.
     """
     VisitorName = 'PatMat'
+    visitsAllNodes = True
 
     def __init__(self):
         self.nameidx = {}
+        self.ctorLabels = {} # ctor label -> labels of the ctors of its data type, ascending
 
     def genName(self, name, namespace='$'):
         suffix = self.nameidx.get(namespace, 0)
@@ -162,151 +113,273 @@ class PatMatVisitor(ASTTransformer):
 
     def visitTop(self, n):
         for dt in n.dataTypes:
-            self(dt)
-        ctorCont = rfold(joinCont, [dt.cont for dt in n.dataTypes], idfun)
-        n.expr = ctorCont(self(n.expr))
+            yield dt
+        n.expr = yield n.expr
         return n
 
     def visitDataType(self, n):
-        for dt in n.ctors:
-            self(dt)
-        ctorCont = rfold(joinCont, [c.cont for c in n.ctors], idfun)
-        n.cont = ctorCont
-        return n
-
-    def visitDataCtor(self, n):
-        # use cps...
-        def letk(cont):
-            params = [self.genName('a') for _ in n.argTys]
-            ctorRepr = TupleNode(subs=[
-                LitNode(val=n.name[1]),
-                TupleNode(subs=[_v(a) for a in params])])
-            for a in reversed(params):
-                ctorRepr = LamNode(name=a, ty=NullNode(), body=ctorRepr)
-            cont = LetNode(
-                    name=n.name[0],
-                    ty=NullNode(),
-                    val=ctorRepr,
-                    body=cont)
-            return cont
-        n.cont = letk
+        labels = tuple(sorted(c.name[1] for c in n.ctors))
+        for c in n.ctors:
+            self.ctorLabels[c.name[1]] = labels
+        yield from self.visitChildrenIter(n)
         return n
 
     def visitMatch(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         e_name = self.genName('e')
-        # TODO: inexhaustive match?
-        # maybe transform the return value into a function that may panic?
-
-        cont = err()
-        for arm in reversed(n.arms):
-            lam_name = self.genName('l')
-            res_name = self.genName('v')
-
-            cont = IteNode(
-                    cond=is_ok(_v(res_name)),
-                    tr=NthNode(idx=1, expr=_v(res_name)),
-                    fl=cont)
-
-            cont = LetNode(
-                    name=res_name,
-                    val=AppNode(fn=_v(lam_name), arg=_v(e_name)),
-                    ty=NullNode(),
-                    body=cont)
-
-            cont = LetNode(
-                    name=lam_name,
-                    val=self.mkPtnLam(arm.ptn, arm.expr),
-                    ty=NullNode(),
-                    body=cont)
-
-        cont = LetNode(name=e_name, val=n.expr, ty=NullNode(), body=cont)
-        return cont
-
-    def mkPtnLam(self, ptn, rhs):
-        if isinstance(ptn, PtnBinderNode):
-            return LamNode(
-                    name=ptn.name,
-                    ty=NullNode(),
-                    body=ok(rhs))
-
-        if isinstance(ptn, PtnLitNode):
-            x_name = self.genName('x')
-
-            cont = IteNode(
-                    cond=BinOpNode(lhs=_v(x_name), op='==', rhs=ptn.expr),
-                    tr=ok(rhs),
-                    fl=err())
-            cont = LamNode(
-                    name=x_name,
-                    ty=NullNode(),
-                    body=cont)
-            return cont
-
+        # variables the arms use, the others need not be bound
+        self.armUses = [varRefNames(arm.expr) for arm in n.arms]
+        rows = [Row([arm.ptn], [], i) for i, arm in enumerate(n.arms)]
+        tree, _ = self.compile([e_name], rows)
+
+        leaves = [0] * len(n.arms)
+        self.countLeaves(tree, leaves)
+        # arm -> [name of the shared function or None, its variables, its expr, leaves left]
+        self.arms = []
+        shared = []
+        for arm, uses, count in zip(n.arms, self.armUses, leaves):
+            binders = [v for v in ptnBinders(arm.ptn) if v in uses]
+            k_name = None
+            if count > 1 and treeSize(arm.expr) > COPY_ARM_SIZE:
+                k_name = self.genName('k')
+                shared += [(k_name, self.mkSharedArm(binders, arm.expr))]
+            self.arms += [[k_name, binders, arm.expr, count]]
+
+        cont = self.emit(tree)
+        for k_name, fn in reversed(shared):
+            cont = _let(k_name, fn, cont)
+        return _let(e_name, n.expr, cont)
+
+    def compile(self, occs, rows):
+        """
+        The decision tree matching rows against the occurrences, and the
+        occurrences the tree refers to.
+        """
+        if not rows:
+            return Fail(), set()
+        rows = [self.peelBinders(occs, row) for row in rows]
+        first = rows[0]
+        col = next((i for i, p in enumerate(first.ptns) if p is not None), None)
+        if col is None:
+            return Leaf(first.arm, first.binds), { occ for _, occ in first.binds }
+
+        ptn, occ = first.ptns[col], occs[col]
         if isinstance(ptn, PtnTupleNode):
-            biglam = self.mkPtnLam(ptn.subs[-1], rhs)
-            for ptn1 in reversed(ptn.subs[:-1]):
-                biglam = self.mkPtnLam(ptn1, biglam)
-
-            # we need to unroll it
-            # In the original SLPJ book they did not use a tuple to represent the result
-            # and thus avoided the problem.
-
-            x_name = self.genName('x')
-            biglam_name = self.genName('lam')
-            k = len(ptn.subs)
-            r_names = [ self.genName(f'r{i}') for i in range(k) ]
-
-            # let r_n = f_nth(n), 1 <= n <= len(r_names)-1
-            def f(i):
-                if i == 0:
-                    return _v(biglam_name)
-                else:
-                    return unwrap(_v(r_names[i-1]))
-
-            cont = ok(NthNode(idx=1, expr=_v(r_names[k-1])))
-
-            for i in range(k-1, -1, -1):
-                cont = IteNode(
-                        cond=is_err(_v(r_names[i])),
-                        tr=err(),
+            return self.compileTuple(occs, rows, col, len(ptn.subs))
+        if isinstance(ptn, PtnDataNode):
+            cases = []
+            arities = { p.name[1]: len(p.subs) for p in column(rows, col) }
+            for label, k in arities.items():
+                args = [self.genName('a') for _ in range(k)]
+                spec = [specialize(row, col, label, k) for row in rows]
+                cases += [(label, self.unpack(label, args, occ,
+                    self.compile(occs[:col] + args + occs[col+1:], [r for r in spec if r is not None])))]
+            labels = self.ctorLabels[ptn.name[1]]
+            complete = len(cases) == len(labels)
+            return self.switch(occ, cases, None if complete else self.compileDefault(occs, rows, col),
+                    labels)
+        if isinstance(ptn, PtnLitNode):
+            cases = []
+            for val in uniq(p.expr.val for p in column(rows, col)):
+                spec = [specialize(row, col, val, 0) for row in rows]
+                cases += [(val, self.compile(occs[:col] + occs[col+1:], [r for r in spec if r is not None]))]
+            # by type: 0 == False and 1 == True
+            vals = [c[0] for c in cases]
+            complete = vals == [()] or len(vals) == 2 and all(type(v) is bool for v in vals)
+            return self.switch(occ, cases, None if complete else self.compileDefault(occs, rows, col))
+        unreachable()
+
+    def peelBinders(self, occs, row):
+        """
+        Replaces variable patterns by None, binding the variables to their occurrences.
+        """
+        if not any(isinstance(p, PtnBinderNode) for p in row.ptns):
+            return row
+        ptns, binds = [], list(row.binds)
+        for p, occ in zip(row.ptns, occs):
+            if isinstance(p, PtnBinderNode):
+                if p.name in self.armUses[row.arm]:
+                    binds += [(p.name, occ)]
+                p = None
+            ptns += [p]
+        return Row(ptns, binds, row.arm)
+
+    def compileTuple(self, occs, rows, col, k):
+        subOccs = [self.genName('o') for _ in range(k)]
+        expanded = []
+        for row in rows:
+            p = row.ptns[col]
+            subs = p.subs if p is not None else [None] * k
+            expanded += [Row(row.ptns[:col] + subs + row.ptns[col+1:], row.binds, row.arm)]
+        res = self.compile(occs[:col] + subOccs + occs[col+1:], expanded)
+        for i in reversed(range(k)):
+            res = self.project(subOccs[i], occs[col], i, res)
+        return res
+
+    def compileDefault(self, occs, rows, col):
+        default = [Row(row.ptns[:col] + row.ptns[col+1:], row.binds, row.arm)
+                for row in rows if row.ptns[col] is None]
+        return self.compile(occs[:col] + occs[col+1:], default)
+
+    def project(self, name, occ, idx, res):
+        """
+        Binds name to nth idx occ around the tree in res, if the tree refers to it.
+        """
+        tree, used = res
+        if name not in used:
+            return tree, used
+        return Project(name, occ, idx, tree), (used - {name}) | {occ}
+
+    def unpack(self, label, names, occ, res):
+        """
+        Binds names to the constructor arguments of occ around the tree in
+        res, if the tree refers to any.
+        """
+        tree, used = res
+        if used.isdisjoint(names):
+            return tree, used
+        return Unpack(label, names, occ, tree), (used - set(names)) | {occ}
+
+    def switch(self, occ, cases, default, labels=None):
+        """
+        Tests occ against the literals of cases, or with labels, switches on
+        its constructor.
+        """
+        used = set()
+        for _, (_, caseUsed) in cases:
+            used |= caseUsed
+        if default is not None:
+            used |= default[1]
+            default = default[0]
+        if default is None and len(cases) == 1:
+            return cases[0][1][0], used
+        cases = [(v, t) for v, (t, _) in cases]
+        if labels is not None:
+            return CtorSwitch(occ, labels, cases, default), used | {occ}
+        return Switch(occ, cases, default), used | {occ}
+
+    def countLeaves(self, tree, leaves):
+        stack = [tree]
+        while stack:
+            t = stack.pop()
+            if isinstance(t, Leaf):
+                leaves[t.arm] += 1
+            elif isinstance(t, (Project, Unpack)):
+                stack += [t.body]
+            elif isinstance(t, (Switch, CtorSwitch)):
+                stack += [c[1] for c in t.cases]
+                if t.default is not None:
+                    stack += [t.default]
+
+    def mkSharedArm(self, binders, expr):
+        """
+        A function of the arm's variables returning the arm: of unit, of the
+        variable, or of the tuple of the variables.
+        """
+        if len(binders) == 0:
+            return _lam(self.genName('u'), expr)
+        if len(binders) == 1:
+            return _lam(binders[0], expr)
+        b_name = self.genName('b')
+        for i in reversed(range(len(binders))):
+            expr = _let(binders[i], NthNode.trusted(idx=i, expr=_v(b_name)), expr)
+        return _lam(b_name, expr)
+
+    def emit(self, tree):
+        if isinstance(tree, Fail):
+            return AppNode.trusted(fn=BuiltinNode.trusted(name='panic'), arg=LitNode.trusted(val=()))
+        if isinstance(tree, Leaf):
+            return self.emitLeaf(tree)
+        if isinstance(tree, Project):
+            return _let(tree.name, NthNode.trusted(idx=tree.idx, expr=_v(tree.occ)), self.emit(tree.body))
+        if isinstance(tree, Unpack):
+            return UnpackNode.trusted(label=tree.label, names=tuple(tree.names), val=_v(tree.occ),
+                    body=self.emit(tree.body))
+        if isinstance(tree, CtorSwitch):
+            arms = [self.emit(case) for _, case in tree.cases]
+            if tree.default is not None:
+                arms += [self.emit(tree.default)]
+            armOf = { label: i for i, (label, _) in enumerate(tree.cases) }
+            table = tuple(armOf.get(label, len(tree.cases)) for label in tree.labels)
+            return SwitchNode.trusted(expr=_v(tree.occ), base=tree.labels[0], table=table, arms=arms)
+        if isinstance(tree, Switch):
+            cont = self.emit(tree.default) if tree.default is not None else None
+            for val, case in reversed(tree.cases):
+                if cont is None:
+                    cont = self.emit(case)
+                    continue
+                cont = IteNode.trusted(
+                        cond=BinOpNode.trusted(lhs=_v(tree.occ), op='==', rhs=LitNode.trusted(val=val)),
+                        tr=self.emit(case),
                         fl=cont)
-
-                cont = LetNode(
-                        name=r_names[i],
-                        ty=NullNode(),
-                        val=AppNode(fn=f(i), arg=NthNode(idx=i, expr=_v(x_name))),
-                        body=cont)
-
-            cont = LetNode(
-                    name=biglam_name,
-                    ty=NullNode(),
-                    val=biglam,
-                    body=cont)
-
-            cont = LamNode(
-                    name=x_name,
-                    ty=NullNode(),
-                    body=cont)
-
             return cont
 
-        if isinstance(ptn, PtnDataNode):
-            x_name = self.genName('x')
-
-            cont = self.mkPtnLam(PtnTupleNode(subs=ptn.subs), rhs)
-
-            cont = IteNode(
-                    cond=BinOpNode(
-                        lhs=NthNode(idx=0, expr=_v(x_name)),
-                        op='==',
-                        rhs=LitNode(val=ptn.name[1])),
-                    tr=AppNode(fn=cont, arg=NthNode(idx=1, expr=_v(x_name))),
-                    fl=err())
-
-            cont = LamNode(
-                    name=x_name,
-                    ty=NullNode(),
-                    body=cont)
-
-            return cont
+    def emitLeaf(self, leaf):
+        k_name, binders, expr, count = self.arms[leaf.arm]
+        occOf = dict(leaf.binds)
+        if k_name is not None:
+            if len(binders) == 0:
+                arg = LitNode.trusted(val=())
+            elif len(binders) == 1:
+                arg = _v(occOf[binders[0]])
+            else:
+                arg = TupleNode.trusted(subs=[_v(occOf[b]) for b in binders])
+            return AppNode.trusted(fn=_v(k_name), arg=arg)
+        # the last leaf of an arm takes the original, the others copies
+        self.arms[leaf.arm][3] -= 1
+        if count > 1:
+            expr = expr.copy()
+        for name, occ in reversed(leaf.binds):
+            expr = _let(name, _v(occ), expr)
+        return expr
+
+
+def column(rows, col):
+    return [row.ptns[col] for row in rows if row.ptns[col] is not None]
+
+def uniq(values):
+    return list(dict.fromkeys(values))
+
+def specialize(row, col, value, k):
+    """
+    The row for the case value, with k arguments, of column col. None if it
+    does not match. The column is replaced by a column per argument.
+    """
+    p = row.ptns[col]
+    if p is None:
+        subs = [None] * k
+    elif (p.name[1] if isinstance(p, PtnDataNode) else p.expr.val) != value:
+        return None
+    else:
+        subs = p.subs if isinstance(p, PtnDataNode) else []
+    return Row(row.ptns[:col] + subs + row.ptns[col+1:], row.binds, row.arm)
+
+def ptnBinders(ptn):
+    if isinstance(ptn, PtnBinderNode):
+        return [ptn.name]
+    if isinstance(ptn, (PtnTupleNode, PtnDataNode)):
+        return [v for sub in ptn.subs for v in ptnBinders(sub)]
+    return []
+
+def varRefNames(n):
+    names = set()
+    stack = [n]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, VarRefNode):
+            names.add(n.name)
+        for f in n.childFields:
+            ch = getattr(n, f)
+            stack += ch if f in n.bunchedFields else [ch]
+    return names
+
+def treeSize(n):
+    size = 0
+    stack = [n]
+    while stack:
+        n = stack.pop()
+        size += 1
+        for f in n.childFields:
+            ch = getattr(n, f)
+            stack += ch if f in n.bunchedFields else [ch]
+    return size
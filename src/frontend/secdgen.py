@@ -2,33 +2,54 @@
 Should be done after De brujin pass.
 """
 
-from ..common import *
-from ..utils import *
+from .ast import IterativeVisitor
+from .secdinstrs import (AccessInstr, ApplyInstr, BinaryInstr, BranchInstr, BuiltinInstr,
+        ClosureInstr, ClosuresInstr, ConstInstr, CtorInstr, FocusInstr, HaltInstr, LabelInstr,
+        MktupleInstr, NthInstr, PopInstr, PopenvInstr, PushenvInstr, ReturnInstr,
+        SwitchInstr, UnaryInstr, UnpackInstr)
 
-from .ast import *
-from .secdinstrs import *
 
-class SECDGenVisitor(ASTVisitor):
+class SECDEmitter:
     """
-    Generate SECD.
-    """
-    VisitorName = 'SECDGen'
+    SECD code generation, shared by SECDGenVisitor on the AST and FlatSECDGen
+    on the flat IR. The walkers pick the parts out of their nodes, and call
+    the generator of the construct on them.
 
-    def newLabel(self, namespace):
-        idx = self.labelIdx.get(namespace, 0)
-        self.labelIdx[namespace] = idx + 1
-        return f'{namespace}{idx}'
+    Generators yield the children of the construct, to have the walker
+    generate their code, and get back what the walker returns for them (only
+    let rec arms return something, their labels). The other parts are
+    operands. Nodes are whatever the walker walks, e.g. AST nodes or indices.
 
-    def joinResults(self, n, chRes):
-        return flatten(chRes)
+    Code is appended to the list of the function being generated, self.code,
+    so generation takes time linear in the size of the program. Labels are
+    named once the code they delimit is done, their instructions are
+    reserved in the list until then.
 
+    Lets and unpacks drop their env entries after their body, unless the body
+    is in tail position, i.e. followed by return or halt, which drop the env
+    anyway.
+
+    Binders call bind(var) and unbind() around the code in their scope, with
+    var as in DeBrujinScope.push, for walkers resolving variables themselves.
+    """
     def __init__(self):
         self.instrs = {}
         self.labelIdx = {}
+        self.tails = set()  # nodes in tail position
+        self.code = None    # instructions of the function being generated
 
-    def visitTop(self, n):
-        self.instrs['main'] = self(n.expr) + [HaltInstr()]
-        return self
+    # Override me
+    def bind(self, var):
+        pass
+
+    # Override me
+    def unbind(self):
+        pass
+
+    def newLabel(self, namespace):
+        idx = self.labelIdx.get(namespace, 0)
+        self.labelIdx[namespace] = idx + 1
+        return f'{namespace}{idx}'
 
     def emit(self, fmt='secdi'):
         assert fmt in {'secdi', 'c'}
@@ -46,58 +67,228 @@ class SECDGenVisitor(ASTVisitor):
             return HEADER + '\n\n\n'.join(f'void {label}(void){{{f(instrs)}\n}}'
                     for label, instrs in self.instrs.items())
 
-    def visitSeq(self, n):
+    def inTail(self, n, ch):
+        """
+        ch, in tail position if its parent n is.
+        """
+        if n in self.tails:
+            self.tails.add(ch)
+        return ch
+
+    def function(self, label, body, end):
+        """
+        Generates the function label: body in tail position, then end.
+        """
+        outer, self.code = self.code, []
+        self.tails.add(body)
+        yield body
+        self.code.append(end)
+        self.instrs[label] = self.code
+        self.code = outer
+
+    def popEnv(self, n, k):
+        """
+        Drops the innermost k env entries after the body of n, unless n is in
+        tail position. Merges into a trailing popenv.
+        """
+        if n in self.tails:
+            return
+        if isinstance(self.code[-1], PopenvInstr):
+            self.code[-1] = PopenvInstr(self.code[-1].n + k)
+        else:
+            self.code.append(PopenvInstr(k))
+
+    def reserve(self, k=1):
+        """
+        Index of k instructions reserved at the end of the code, set later.
+        """
+        self.code += [None] * k
+        return len(self.code) - k
+
+    def top(self, expr):
+        yield from self.function('main', expr, HaltInstr())
+
+    def lit(self, val):
+        self.code.append(ConstInstr(val))
+
+    def access(self, idx, sub):
+        """
+        sub: 0 for a variable, or the index of a closure in its let rec group.
+        """
+        self.code.append(AccessInstr(idx))
+        if sub != 0:
+            self.code.append(FocusInstr(sub))
+
+    def builtin(self, name):
+        self.code.append(BuiltinInstr(name))
+
+    def lam(self, name, body):
+        lamLabel = self.newLabel('lam')
+        self.bind(name)
+        yield from self.function(lamLabel, body, ReturnInstr())
+        self.unbind()
+        self.code.append(ClosureInstr(lamLabel))
+
+    def let(self, n, name, val, body):
+        yield val
+        self.code.append(PushenvInstr())
+        self.bind(name)
+        yield self.inTail(n, body)
+        self.unbind()
+        self.popEnv(n, 1)
+
+    def unpack(self, n, names, val, body):
+        yield val
+        self.code.append(UnpackInstr(len(names)))
+        for name in names:
+            self.bind(name)
+        yield self.inTail(n, body)
+        for name in names:
+            self.unbind()
+        self.popEnv(n, len(names))
+
+    def letRec(self, n, fnNames, arms, body):
+        self.bind(fnNames)
+        labels = []
+        for arm in arms:
+            labels += [(yield arm)]
+        self.code.append(ClosuresInstr(labels))
+        yield self.inTail(n, body)
+        self.unbind()
+        self.popEnv(n, 1)
+
+    def letRecArm(self, argName, val):
+        closLabel = self.newLabel('clos')
+        self.bind(argName)
+        yield from self.function(closLabel, val, ReturnInstr())
+        self.unbind()
+        return closLabel
+
+    def seq(self, n, subs):
         # each semicolon discards result of its lhs
-        return joinlist([PopInstr(1)], self.visitChildren(n))
+        for sub in subs[:-1]:
+            yield sub
+            self.code.append(PopInstr(1))
+        yield self.inTail(n, subs[-1])
+
+    def mktuple(self, subs):
+        for sub in subs:
+            yield sub
+        self.code.append(MktupleInstr(len(subs)))
+
+    def ctor(self, label, args):
+        for arg in args:
+            yield arg
+        self.code.append(CtorInstr(label, len(args)))
+
+    def ite(self, n, cond, tr, fl):
+        yield cond
+        brfl = self.reserve(2)
+        yield self.inTail(n, tr)
+        br = self.reserve(2)
+        yield self.inTail(n, fl)
+        l1, l2, l3 = self.newLabel('tr'), self.newLabel('fl'), self.newLabel('end')
+        self.code[brfl:brfl+2] = [BranchInstr('brfl', l2), LabelInstr(l1)]
+        self.code[br:br+2] = [BranchInstr('br', l3), LabelInstr(l2)]
+        self.code.append(LabelInstr(l3))
+
+    def switch(self, n, expr, base, table, arms):
+        yield expr
+        switch = self.reserve()
+        starts, brs = [], []
+        for i, arm in enumerate(arms):
+            starts += [self.reserve()]
+            yield self.inTail(n, arm)
+            if i != len(arms) - 1:
+                brs += [self.reserve()]
+        lbls = [self.newLabel('case') for _ in arms]
+        end = self.newLabel('end')
+        self.code[switch] = SwitchInstr(base, tuple(lbls[i] for i in table))
+        for start, lbl in zip(starts, lbls):
+            self.code[start] = LabelInstr(lbl)
+        for br in brs:
+            self.code[br] = BranchInstr('br', end)
+        self.code.append(LabelInstr(end))
+
+    def binOp(self, op, lhs, rhs):
+        yield lhs
+        yield rhs
+        self.code.append(BinaryInstr(op))
+
+    def unaOp(self, op, sub):
+        yield sub
+        self.code.append(UnaryInstr(op))
+
+    def app(self, fn, arg):
+        yield fn
+        yield arg
+        self.code.append(ApplyInstr())
+
+    def nth(self, idx, expr):
+        yield expr
+        self.code.append(NthInstr(idx))
+
+
+class SECDGenVisitor(SECDEmitter, IterativeVisitor):
+    """
+    Generate SECD, see SECDEmitter.
+    """
+    VisitorName = 'SECDGen'
+
+    def visitTop(self, n):
+        yield from self.top(n.expr)
+        return self
+
+    def visitSeq(self, n):
+        return self.seq(n, n.subs)
 
     def visitApp(self, n):
-        return self(n.fn) + self(n.arg) + [ApplyInstr()]
+        return self.app(n.fn, n.arg)
 
     def visitLit(self, n):
-        return [ConstInstr(n.val)]
+        return self.lit(n.val)
 
     def visitNVarRef(self, n):
-        return [AccessInstr(n.idx)]
+        return self.access(n.idx, 0)
 
     def visitNClosRef(self, n):
-        return [AccessInstr(n.idx), FocusInstr(n.sub)]
+        return self.access(n.idx, n.sub)
 
     def visitNLam(self, n):
-        lamLabel = self.newLabel('lam')
-        self.instrs[lamLabel] = self(n.body) + [ReturnInstr()]
-        return [ClosureInstr(lamLabel)]
+        return self.lam(None, n.body)
 
     def visitNLetRecArm(self, n):
-        closLabel = self.newLabel('clos')
-        self.instrs[closLabel] = self(n.val) + [ReturnInstr()]
-        return closLabel
+        return self.letRecArm(None, n.val)
 
     def visitLetRec(self, n):
-        arms = [self(arm) for arm in n.arms]
-        return [ClosuresInstr(arms)] + self(n.body)
+        return self.letRec(n, None, n.arms, n.body)
 
     def visitBuiltin(self, n):
-        return [BuiltinInstr(n.name)]
+        return self.builtin(n.name)
 
     def visitIte(self, n):
-        cond, tr, fl = self(n.cond), self(n.tr), self(n.fl)
-        l1, l2, l3 = self.newLabel('tr'), self.newLabel('fl'), self.newLabel('end')
-        return cond + [BranchInstr('brfl', l2), LabelInstr(l1)] +\
-            tr + [BranchInstr('br', l3), LabelInstr(l2)] + fl + [LabelInstr(l3)]
+        return self.ite(n, n.cond, n.tr, n.fl)
 
     def visitBinOp(self, n):
-        lhs, rhs = self(n.lhs), self(n.rhs)
-        return lhs + rhs + [BinaryInstr(n.op)]
+        return self.binOp(n.op, n.lhs, n.rhs)
 
     def visitUnaOp(self, n):
-        sub = self(n.sub)
-        return sub + [UnaryInstr(n.op)]
+        return self.unaOp(n.op, n.sub)
 
     def visitNLet(self, n):
-        return self(n.val) + [PushenvInstr()] + self(n.body)
+        return self.let(n, None, n.val, n.body)
+
+    def visitNUnpack(self, n):
+        return self.unpack(n, (None,) * n.n, n.val, n.body)
+
+    def visitSwitch(self, n):
+        return self.switch(n, n.expr, n.base, n.table, n.arms)
 
     def visitNth(self, n):
-        return self(n.expr) + [NthInstr(n.idx)]
+        return self.nth(n.idx, n.expr)
 
     def visitTuple(self, n):
-        return joinlist([], self.visitChildren(n)) + [MktupleInstr(len(n.subs))]
+        return self.mktuple(n.subs)
+
+    def visitCtor(self, n):
+        return self.ctor(n.label, n.args)
@@ -1,5 +1,5 @@
-from ..common import *
-from ..utils import *
+from ..common import binOpToStr, unaOpToStr
+from ..utils import MiniMLError, unreachable
 
 class SECDInstr:
     """
@@ -77,14 +77,22 @@ label    : name
 pushenv  :
 nth      : n
 mktuple  : n
+popenv   : n
+switch   : base lbls
+unpack   : n
+ctor     : label n
 """
 # mktuple has rhs on the top, lhs below
+# switch pops a constructor value with label l and jumps to lbls[l - base]
+# unpack pops a constructor value and pushes its n arguments onto env, the last innermost
+# ctor pops n arguments, the last on the top, and pushes the constructor value. An immediate if n is 0
 globals().update(createInstrs(spec))
 
 BinaryInstr.fmtSECD = lambda self: binOpToStr[self.op]
 UnaryInstr.fmtSECD = lambda self: unaOpToStr[self.op]
 LabelInstr.fmtSECD = lambda self: f'\n  {self.name}:'
 BranchInstr.fmtSECD = lambda self: f'{self.op} {self.lbl}'
+SwitchInstr.fmtSECD = lambda self: f'{self.InstrName:<10}{self.base} {" ".join(self.lbls)}'
 
 def constFmtC(self):
     if type(self.val) is int:
@@ -105,3 +113,5 @@ def branchFmtC(self):
         return f'Ibr1(0 ==, {self.lbl});'
 BranchInstr.fmtC = branchFmtC
 
+SwitchInstr.fmtC = lambda self: f'Iswitch({self.base}, {", ".join("&&" + l for l in self.lbls)});'
+
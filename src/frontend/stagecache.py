@@ -0,0 +1,106 @@
+"""
+On-disk cache of the AST after the front end stages, so that recompiling an
+unchanged source (e.g. with other backend options) can skip them.
+
+Entries are keyed by the source and the compiler version, the latter being a
+hash of the compiler's own sources.
+
+Entries are pickles, and unpickling runs code: the cache directory must be
+writable only by users trusted to run code as you. Each entry starts with an
+HMAC-SHA256 of its pickle keyed by the compiler version, which is checked
+before unpickling. That catches corrupt, truncated and foreign entries (e.g.
+left by another compiler version sharing the directory), not forged ones: the
+compiler sources are no secret.
+"""
+import hashlib
+import hmac
+import os
+import pickle
+from pathlib import Path
+
+
+class StageCache:
+    """
+    Stores pickled ASTs as DIR/<key>.<stage>.pkl, after their digest.
+    """
+    # in pipeline order
+    STAGES = ['namer', 'typer', 'debrujin']
+    DIGEST_SIZE = hashlib.sha256().digest_size
+
+    _version = None
+
+    def compilerVersion():
+        """
+        Hash of the compiler sources when first asked for, i.e. of the
+        compiler loaded in this process.
+        """
+        if StageCache._version is None:
+            StageCache._version = StageCache.hashCompilerSources()
+        return StageCache._version
+
+    def hashCompilerSources():
+        src = Path(__file__).resolve().parent.parent
+        h = hashlib.sha256()
+        for p in sorted(src.glob('**/*.py')) + sorted(src.glob('*.g4')):
+            if 'generated' in p.parts:
+                continue
+            h.update(str(p.relative_to(src)).encode())
+            h.update(p.read_bytes())
+        return h.hexdigest()
+
+    def __init__(self, cacheDir, source):
+        self.cacheDir = Path(cacheDir)
+        h = hashlib.sha256(StageCache.compilerVersion().encode())
+        h.update(source if isinstance(source, bytes) else source.encode())
+        self.key = h.hexdigest()
+
+    def path(self, stage):
+        return self.cacheDir / f'{self.key}.{stage}.pkl'
+
+    def digest(data):
+        return hmac.new(StageCache.compilerVersion().encode(), data, hashlib.sha256).digest()
+
+    def load(self, stage):
+        """
+        The AST cached after stage, or None. Any entry that cannot be read
+        back is a miss.
+        """
+        try:
+            with open(self.path(stage), 'rb') as f:
+                entry = f.read()
+            digest, data = entry[:StageCache.DIGEST_SIZE], entry[StageCache.DIGEST_SIZE:]
+            if not hmac.compare_digest(digest, StageCache.digest(data)):
+                return None
+            return pickle.loads(data)
+        except Exception:
+            return None
+
+    def latest(self, stages):
+        """
+        (stage, AST) for the latest of stages cached, or (None, None).
+        """
+        for stage in reversed(StageCache.STAGES):
+            if stage in stages:
+                ast = self.load(stage)
+                if ast is not None:
+                    return stage, ast
+        return None, None
+
+    def save(self, stage, ast):
+        """
+        Caches ast after stage. Returns whether it did: an AST pickle cannot
+        represent (e.g. too deep) or an unwritable directory just is not
+        cached.
+        """
+        # write then rename, so concurrent builds never read partial entries
+        tmp = self.path(stage).with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            data = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+            self.cacheDir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(StageCache.digest(data) + data)
+            os.replace(tmp, self.path(stage))
+            return True
+        except (OSError, RecursionError, pickle.PicklingError):
+            tmp.unlink(missing_ok=True)
+            return False
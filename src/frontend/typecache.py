@@ -0,0 +1,230 @@
+"""
+Cache of let-bound type schemata, for programs that keep repeating the same
+definitions (e.g. a generated prelude of folds and filters).
+
+A let (or let rec) is keyed by a hash of its bound expression(s) after alpha
+normalization, together with the types of their free variables. Only
+definitions whose free variables all have closed types (i.e. no free type
+variables) are cached. Their schemata are closed as well, and valid in any
+program producing the same key.
+
+Should come after namer, as it relies on names being distinct.
+
+The cache file is plain JSON, read back into types by the TypeTable below
+only: a file that does not describe closed schemata is ignored.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+
+from ..common import AllBaseTypes
+from .ast import IterativeVisitor
+from .astnodes import LetNode
+from .typer import BaseType, DataType, LamType, TupleType, TypeSchema, TypeVar
+
+
+class AlphaKeyVisitor(IterativeVisitor):
+    """
+    Serializes a subtree into nested lists of tokens, with binders numbered in
+    order of appearance and free variables replaced by their types in tenv.
+    Constructors in patterns come with their types, as in expressions.
+
+    Sets `self.closed` to False on a free variable whose type is not closed.
+    """
+    VisitorName = 'AlphaKey'
+
+    def __init__(self, tenv):
+        self.tenv = tenv
+        self.binders = {}
+        self.closed = True
+
+    def bind(self, name):
+        self.binders[name] = len(self.binders)
+        return f'${self.binders[name]}'
+
+    def visitTermNode(self, v):
+        return repr(v)
+
+    def joinResults(self, n, chRes):
+        return [n.NodeName] + chRes
+
+    def visitVarRef(self, n):
+        if n.name in self.binders:
+            return ['VarRef', f'${self.binders[n.name]}']
+        return ['VarRef', self.freeType(n.name)]
+
+    def freeType(self, name):
+        ty = self.tenv[name]
+        if isinstance(ty, TypeSchema):
+            if ty.freeTV() != [] or ty.constrs != []:
+                self.closed = False
+            return str(ty.canonical())
+        if not ty.ground:
+            self.closed = False
+        return str(ty)
+
+    def visitPtnData(self, n):
+        subs = []
+        for sub in n.subs:
+            subs += [(yield sub)]
+        return ['PtnData', repr(n.name), self.freeType(n.name[0]), subs]
+
+    def visitLet(self, n):
+        return ['Let', self.bind(n.name), (yield n.ty), (yield n.val), (yield n.body)]
+
+    def visitLam(self, n):
+        return ['Lam', self.bind(n.name), (yield n.ty), (yield n.body)]
+
+    def visitLetRec(self, n):
+        self.bindArms(n)
+        arms = []
+        for arm in n.arms:
+            arms += [(yield arm)]
+        return ['LetRec', arms, (yield n.body)]
+
+    def bindArms(self, n):
+        for arm in n.arms:
+            self.bind(arm.fnName)
+
+    def visitLetRecArm(self, n):
+        return ['LetRecArm', (yield n.fnTy), self.bind(n.argName), (yield n.argTy), (yield n.val)]
+
+    def visitPtnBinder(self, n):
+        return ['PtnBinder', self.bind(n.name)]
+
+
+class TypeTable:
+    """
+    Types as a flat list of nodes, each a JSON list referring to its
+    components by their index in the list. Components come first, and each
+    type once, so reading and writing deep or shared types takes no
+    recursion and no more room than the types themselves.
+    """
+    def __init__(self):
+        self.nodes = []
+        self.idx = {} # type -> index
+
+    def add(self, ty):
+        """
+        Index of ty, adding it and its components as needed.
+        """
+        def f(t, subs):
+            if isinstance(t, BaseType):
+                node = ['base', t.name]
+            elif isinstance(t, TypeVar):
+                node = ['var', t.id]
+            elif isinstance(t, DataType):
+                node = ['data', t.name]
+            elif isinstance(t, LamType):
+                node = ['lam', *subs]
+            elif isinstance(t, TupleType):
+                node = ['tuple', *subs]
+            else:
+                raise TypeError(f'cannot tabulate {t}')
+            self.nodes.append(node)
+            return len(self.nodes) - 1
+        return ty.fold(f, memo=self.idx)
+
+    def read(nodes):
+        """
+        The types of nodes, as written by add. Raises ValueError on anything else.
+        """
+        types = []
+        for node in nodes:
+            if not isinstance(node, list) or node == []:
+                raise ValueError(f'bad type node {node!r}')
+            kind, *args = node
+            if kind in {'base', 'data'} and len(args) == 1 and isinstance(args[0], str):
+                if kind == 'base' and args[0] not in AllBaseTypes:
+                    raise ValueError(f'bad base type {args[0]!r}')
+                types.append((BaseType if kind == 'base' else DataType)(args[0]))
+            elif kind == 'var' and len(args) == 1 and TypeTable.isIdx(args[0], float('inf')):
+                types.append(TypeVar(args[0]))
+            elif kind in {'lam', 'tuple'} and all(TypeTable.isIdx(i, len(types)) for i in args):
+                subs = [types[i] for i in args]
+                if kind == 'lam' and len(subs) != 2:
+                    raise ValueError(f'bad type node {node!r}')
+                types.append((LamType if kind == 'lam' else TupleType)(*subs))
+            else:
+                raise ValueError(f'bad type node {node!r}')
+        return types
+
+    def isIdx(i, bound):
+        return type(i) is int and 0 <= i < bound
+
+
+class TypeCache:
+    """
+    Bounded LRU map from let keys to the list of schemata they bind.
+    Opt-in for TyperVisitor, persisted with save/load.
+    """
+    VERSION = 3
+
+    def __init__(self, maxsize=4096):
+        self.entries = OrderedDict() # key -> [TypeSchema]
+        self.maxsize = maxsize
+
+    def keyOf(self, n):
+        """
+        Key of a let or let rec node with _tenv set, None if not cacheable.
+        """
+        v = AlphaKeyVisitor(n._tenv)
+        if isinstance(n, LetNode):
+            tokens = ['Let', v(n.ty), v(n.val)]
+        else:
+            v.bindArms(n)
+            tokens = ['LetRec', [v(arm) for arm in n.arms]]
+        if not v.closed:
+            return None
+        return hashlib.sha256(repr(tokens).encode()).hexdigest()
+
+    def lookup(self, key):
+        schemas = self.entries.get(key)
+        if schemas is not None:
+            self.entries.move_to_end(key)
+        return schemas
+
+    def store(self, key, schemas):
+        if any(s.freeTV() != [] or s.constrs != [] for s in schemas):
+            return
+        self.entries[key] = [s.canonical() for s in schemas]
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def save(self, path):
+        """
+        Writes {version, types: TypeTable nodes, entries: [[key, [[type, quantTVIds]]]]}.
+        """
+        table = TypeTable()
+        entries = [[key, [[table.add(s.ty), s.quantTVIds] for s in schemas]]
+                for key, schemas in self.entries.items()]
+        with open(path, 'w') as f:
+            json.dump({'version': TypeCache.VERSION, 'types': table.nodes, 'entries': entries}, f)
+
+    def load(path, maxsize=4096):
+        """
+        A cache with the entries saved at path, or an empty one if there are
+        none, or the file cannot be read back for any reason.
+        """
+        cache = TypeCache(maxsize)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data['version'] != TypeCache.VERSION:
+                return cache
+            types = TypeTable.read(data['types'])
+            for key, schemas in data['entries'][-maxsize:]:
+                cache.entries[key] = [TypeCache.readSchema(types, s) for s in schemas]
+        except Exception:
+            return TypeCache(maxsize)
+        return cache
+
+    def readSchema(types, schema):
+        ty, quantTVIds = schema
+        if not TypeTable.isIdx(ty, len(types)) or not all(type(i) is int for i in quantTVIds):
+            raise ValueError(f'bad schema {schema!r}')
+        s = TypeSchema(types[ty], quantTVIds=quantTVIds)
+        if s.freeTV() != []:
+            raise ValueError(f'schema {s} is not closed')
+        return s
@@ -5,89 +5,187 @@ We use a Hindley-Milner style type system.
 
 When python 3.10 comes out this'll be a lot easier with pattern matching.
 """
-from ..utils import *
-from ..common import *
-
-from .ast import *
-from .astnodes import *
+import json
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
+from contextvars import ContextVar
+from weakref import WeakValueDictionary
+
+from ..common import AllBaseTypes
+from ..debug import DEBUG
+from ..utils import (MiniMLError, MiniMLLocatedError, PersistentMap, asinstance, flatten,
+        joindict, unimplemented, unreachable, unzip)
+from .ast import IterativeVisitor
+from .astnodes import LamNode, LetNode, LetRecArmNode
 
 class Type:
+    """
+    Types are hash-consed: constructing a type that is structurally equal to a
+    live one returns that very object. So equality and hashing are by identity,
+    and types must never be mutated.
+
+    `ground` caches whether the type is free of type variables.
+    """
+    __slots__ = ('ground', '__weakref__')
+    _interned = WeakValueDictionary()
+
+    def hashcons(cls, key, ground, **fields):
+        key = (cls, *key)
+        ty = Type._interned.get(key)
+        if ty is None:
+            ty = object.__new__(cls)
+            for f, v in fields.items():
+                setattr(ty, f, v)
+            ty.ground = ground
+            Type._interned[key] = ty
+        return ty
+
     def __repr__(self):
         return str(self)
 
+    def components(self):
+        """
+        The types this type is built from, in the order its constructor takes them.
+        """
+        return ()
+
+    def fold(self, f, stop=None, memo=None):
+        """
+        f(t, [results of t's components]) for this type t, computed bottom up.
+        Types for which stop(t) holds are taken as having no components.
+        Walks with an explicit stack, so deep types need no recursion.
+
+        Shared components are folded once. memo, { type: result }, can carry
+        the results over to other folds with the same f.
+        """
+        memo = {} if memo is None else memo
+        done = []
+        todo = [(self, None)]
+        while todo != []:
+            t, subs = todo.pop()
+            if subs is None:
+                if t in memo:
+                    done.append(memo[t])
+                    continue
+                subs = () if stop is not None and stop(t) else t.components()
+                todo += [(t, subs)] + [(sub, None) for sub in reversed(subs)]
+                continue
+            k = len(done) - len(subs)
+            res = memo[t] = f(t, done[k:])
+            del done[k:]
+            done.append(res)
+        return done[0]
+
+    def rebuild(self, leaf, memo=None):
+        """
+        This type with each type variable tv replaced by leaf(tv).
+        """
+        def f(t, subs):
+            if subs:
+                return type(t)(*subs)
+            return leaf(t) if isinstance(t, TypeVar) else t
+        return self.fold(f, stop=lambda t: t.ground, memo=memo)
+
+    def __str__(self):
+        return self.fold(lambda t, subs: t.fmt(subs))
+
+    def fmt(self, subStrs):
+        """
+        This type printed, given its components printed.
+        """
+        raise MiniMLError('unimplemented fmt')
+
     def subst(self, tvId, ty):
-        raise MiniMLError('unimplemented subst')
+        return self.rebuild(lambda tv: ty if tv.id == tvId else tv)
 
-    def substMap(self, tvMap):
-        raise MiniMLError('unimplemented substMap')
+    def substMap(self, tvMap, memo=None):
+        """
+        memo: see fold, for substituting tvMap in many types.
+        """
+        return self.rebuild(lambda tv: tvMap.get(tv.id, tv), memo)
 
     def freeTV(self):
         """
         a list of free type variables within this type.
         """
-        raise MiniMLError('unimplemented freeTV')
+        acc = []
+        self.addFreeTV(acc)
+        return acc
+
+    def addFreeTV(self, acc):
+        """
+        append free type variables within this type to acc.
+        """
+        todo = [self]
+        while todo != []:
+            t = todo.pop()
+            if isinstance(t, TypeVar):
+                acc.append(t.id)
+            elif not t.ground:
+                todo += reversed(t.components())
+
+    def size(self):
+        """
+        number of type constructors and variables within this type.
+        """
+        size, todo = 0, [self]
+        while todo != []:
+            size += 1
+            todo += todo.pop().components()
+        return size
 
     # PartialEq
     def __eq__(self, other):
-        raise MiniMLError('unimplemented Type.__eq__')
+        return self is other
+
+    __hash__ = object.__hash__
 
     # Actually __ne__ but this name is more informative.
     def unableToUnify(self, other):
         raise MiniMLError('unimplemented Type.unableToUnify')
 
 class BaseType(Type):
-    def __init__(self, name):
-        assert name in AllBaseTypes
-        self.name = name
+    __slots__ = ('name',)
 
-    def __str__(self):
-        return self.name
+    def __new__(cls, name):
+        assert name in AllBaseTypes
+        return Type.hashcons(cls, (name,), True, name=name)
 
-    def __eq__(self, other):
-        return isinstance(other, BaseType) and self.name == other.name
+    def __reduce__(self):
+        return (BaseType, (self.name,))
 
-    def __hash__(self):
-        return hash(self.name)
+    def fmt(self, subStrs):
+        return self.name
 
     def subst(self, tvId, ty):
         return self
 
-    def substMap(self, tvMap):
+    def substMap(self, tvMap, memo=None):
         return self
 
-    def freeTV(self):
-        return []
+    def addFreeTV(self, acc):
+        pass
 
     def unableToUnify(self, other):
         return not (isinstance(other, TypeVar) or self == other)
 
 class LamType(Type):
-    def __init__(self, lhs, rhs):
-        assert isinstance(lhs, Type) and isinstance(rhs, Type)
-        self.lhs = lhs
-        self.rhs = rhs
+    __slots__ = ('lhs', 'rhs')
 
-    def __str__(self):
-        return f'({self.lhs}) -> ({self.rhs})'
-
-    def __eq__(self, other):
-        return isinstance(other, LamType) and self.lhs == other.lhs and self.rhs == other.rhs
-
-    def __hash__(self):
-        return hash((self.lhs, self.rhs))
+    def __new__(cls, lhs, rhs):
+        assert isinstance(lhs, Type) and isinstance(rhs, Type)
+        return Type.hashcons(cls, (lhs, rhs), lhs.ground and rhs.ground, lhs=lhs, rhs=rhs)
 
-    def subst(self, tvId, ty):
-        lhs_ = self.lhs.subst(tvId, ty)
-        rhs_ = self.rhs.subst(tvId, ty)
-        return LamType(lhs_, rhs_)
+    def __reduce__(self):
+        return (LamType, (self.lhs, self.rhs))
 
-    def substMap(self, tvMap):
-        lhs_ = self.lhs.substMap(tvMap)
-        rhs_ = self.rhs.substMap(tvMap)
-        return LamType(lhs_, rhs_)
+    def components(self):
+        return (self.lhs, self.rhs)
 
-    def freeTV(self):
-        return self.lhs.freeTV() + self.rhs.freeTV()
+    def fmt(self, subStrs):
+        lhs, rhs = subStrs
+        return f'({lhs}) -> ({rhs})'
 
     def unableToUnify(self, other):
         return not (isinstance(other, TypeVar) or self == other)
@@ -104,9 +202,14 @@ class LamType(Type):
         return ret
 
 class TupleType(Type):
-    def __init__(self, *subs):
+    __slots__ = ('subs',)
+
+    def __new__(cls, *subs):
         assert all(isinstance(t, Type) for t in subs)
-        self.subs = subs
+        return Type.hashcons(cls, subs, all(t.ground for t in subs), subs=subs)
+
+    def __reduce__(self):
+        return (TupleType, self.subs)
 
     def arity(self):
         return len(self.subs)
@@ -114,25 +217,11 @@ class TupleType(Type):
     def nth(self, n):
         return self.subs[n]
 
-    def __str__(self):
-        return '(' + ', '.join([str(x) for x in self.subs]) + ')'
-
-    def __eq__(self, other):
-        if not isinstance(other, TupleType):
-            return False
-        return self.arity() == other.arity() and all(x == y for x, y in zip(self.subs, other.subs))
-
-    def __hash__(self):
-        return hash(self.subs)
-
-    def subst(self, tvId, ty):
-        return TupleType(*[t.subst(tvId, ty) for t in self.subs])
-
-    def substMap(self, tvMap):
-        return TupleType(*[t.substMap(tvMap) for t in self.subs])
+    def components(self):
+        return self.subs
 
-    def freeTV(self):
-        return joinlist([], [t.freeTV() for t in self.subs])
+    def fmt(self, subStrs):
+        return '(' + ', '.join(subStrs) + ')'
 
     def unableToUnify(self, other):
         return not (isinstance(other, TypeVar) or self == other)
@@ -140,37 +229,66 @@ class TupleType(Type):
 
 class TypeVar(Type):
     """
-    genTypeVarName ensures that generated type variables are always unique.
+    Type variables are identified by integers drawn from the current typing
+    session (see newSession), so generating one is O(1), ids are deterministic
+    per compilation, and compilations sharing a process do not interfere.
+    Names like 'a, 'b, ..., 'aa are only made up for printing.
 
     TODO: associate TypeVar with ASTNode for better error
     """
-    _S = []
-
-    def genTypeVarName():
-        for i in range(len(TypeVar._S)-1, -1, -1):
-            if TypeVar._S[i] != 'z':
-                TypeVar._S[i] = chr(ord(TypeVar._S[i]) + 1)
-                for j in range(i+1, len(TypeVar._S)):
-                    TypeVar._S[j] = 'a'
-                break
-        else:
-            TypeVar._S = ['a'] * (len(TypeVar._S) + 1)
-        return ''.join(TypeVar._S)
+    __slots__ = ('id',)
+    _session = ContextVar('TypeVar._session')
+
+    def newSession():
+        """
+        Restart type variable ids from 0, for the current thread/context.
+        """
+        TypeVar._session.set([0])
+
+    def _supply():
+        try:
+            return TypeVar._session.get()
+        except LookupError:
+            TypeVar.newSession()
+            return TypeVar._session.get()
+
+    def genTypeVarId():
+        supply = TypeVar._supply()
+        tvId = supply[0]
+        supply[0] += 1
+        return tvId
 
     def genFresh():
         return TypeVar()
 
-    def __init__(self):
-        self.id = TypeVar.genTypeVarName()
+    def watermark():
+        """
+        Type variables generated after this call are exactly those whose
+        id is no less than the returned mark.
+        """
+        return TypeVar._supply()[0]
 
-    def __hash__(self):
-        return hash(self.id)
+    def name(tvId):
+        """
+        0, 1, ..., 25, 26, ... => a, b, ..., z, aa, ...
+        """
+        res = ''
+        tvId += 1
+        while tvId > 0:
+            tvId, r = divmod(tvId - 1, 26)
+            res = chr(ord('a') + r) + res
+        return res
 
-    def __eq__(self, other):
-        return isinstance(other, TypeVar) and self.id == other.id
+    def __new__(cls, tvId=None):
+        if tvId is None:
+            tvId = TypeVar.genTypeVarId()
+        return Type.hashcons(cls, (tvId,), False, id=tvId)
 
-    def __str__(self):
-        return f"'{self.id}"
+    def __reduce__(self):
+        return (TypeVar, (self.id,))
+
+    def fmt(self, subStrs):
+        return "'" + TypeVar.name(self.id)
 
     def subst(self, tvId, ty):
         if tvId == self.id:
@@ -178,11 +296,11 @@ class TypeVar(Type):
         else:
             return self
 
-    def substMap(self, tvMap):
+    def substMap(self, tvMap, memo=None):
         return tvMap.get(self.id, self)
 
-    def freeTV(self):
-        return [self.id]
+    def addFreeTV(self, acc):
+        acc.append(self.id)
 
     def unableToUnify(self, other):
         return False
@@ -192,29 +310,46 @@ class TypeSchema(Type):
     For HM type systems, type schemata only occur in typing contexts. They
     are instantiated at each use, and thus do not participate in the
     unification process. So all methods only used in unification are unimplemented.
+
+    Either quantTVIds are given, or the schema generalizes ty given `since`:
+    a TypeVar.watermark taken before the generalized expression got typed.
+    constrs are then that expression's constraints, which the caller keeps in
+    its own store as well. As the typing context only holds older type
+    variables, constrs are solved right away with the older variables ranked
+    outside (see RankedUnifier). The schema becomes the solved ty, quantified
+    over the younger variables not reachable from older ones, and keeps no
+    constraints: instances of them would only repeat what the store already
+    says. So instantiation costs no more than copying ty.
+    The solving counts in stats, if given.
     """
-    def __init__(self, ty, tenv=None, quantTVIds=None, constrs=None):
+    def __init__(self, ty, quantTVIds=None, constrs=None, since=None, stats=None):
         constrs = constrs or []
 
         self.ty = ty
         self.constrs = constrs
-        assert tenv or quantTVIds is not None
+        assert quantTVIds is not None or since is not None
         if quantTVIds is not None:
             self.quantTVIds = quantTVIds
         else:
-            # NOTE: generalization requires constraints to be generalized as well
-            constrFreeTV = joinlist([], [c.freeTV() for c in self.constrs])
-            self.quantTVIds = list(set(ty.freeTV() + constrFreeTV) - set(tenv.freeTV()))
+            uf = RankedUnifier(stats, since=since)
+            for c in self.constrs:
+                uf.unify(c.lhs, c.rhs)
+            self.ty = uf.resolve(ty)
+            self.constrs = []
+            self.quantTVIds = list({ tvId for tvId in self.ty.freeTV() if uf.levelOf(tvId) > uf.level })
 
     def subst(self, tvId, ty):
         unimplemented()
 
-    def substMap(self, tvMap):
+    def substMap(self, tvMap, memo=None):
         unimplemented()
 
     def freeTV(self):
         return list(set(self.ty.freeTV()) - set(self.quantTVIds))
 
+    def addFreeTV(self, acc):
+        acc += self.freeTV()
+
     def __eq__(self, other):
         unimplemented()
 
@@ -222,56 +357,75 @@ class TypeSchema(Type):
         unimplemented()
 
     def instantiate(self):
+        if not self.quantTVIds:
+            return self.ty, self.constrs
         tvMap = { qTV: TypeVar.genFresh() for qTV in self.quantTVIds }
         ty = self.ty.substMap(tvMap)
         constrs = [c.substMap(tvMap) for c in self.constrs]
         return ty, constrs
 
+    def canonical(self):
+        """
+        The same schema with quantified variables renumbered 0, 1, ... in order
+        of occurrence, so equal schemata print equally across typing sessions.
+        """
+        order = []
+        for tvId in self.ty.freeTV():
+            if tvId in self.quantTVIds and tvId not in order:
+                order.append(tvId)
+        tvMap = { tvId: TypeVar(i) for i, tvId in enumerate(order) }
+        return TypeSchema(self.ty.substMap(tvMap),
+                quantTVIds=list(range(len(order))),
+                constrs=[c.substMap(tvMap) for c in self.constrs])
+
     def __str__(self):
-        t = ' '.join(self.quantTVIds)
+        t = ' '.join(TypeVar.name(tvId) for tvId in self.quantTVIds)
         return f'A<{t}>. {self.ty}'
 
 class DataType(Type):
-    def __init__(self, name):
-        self.name = name
+    __slots__ = ('name',)
 
-    def __str__(self):
-        return f'dataType<{self.name}>'
+    def __new__(cls, name):
+        return Type.hashcons(cls, (name,), True, name=name)
 
-    def __eq__(self, other):
-        return isinstance(other, DataType) and self.name == other.name
+    def __reduce__(self):
+        return (DataType, (self.name,))
 
-    def __hash__(self):
-        return hash(self.name)
+    def fmt(self, subStrs):
+        return f'dataType<{self.name}>'
 
     def subst(self, tvId, ty):
         return self
 
-    def substMap(self, tvMap):
+    def substMap(self, tvMap, memo=None):
         return self
 
-    def freeTV(self):
-        return []
+    def addFreeTV(self, acc):
+        pass
 
     def unableToUnify(self, other):
         return not (isinstance(other, TypeVar) or self == other)
 
 class TypeEnv:
-    def __init__(self, tenv=None):
-        tenv = tenv or {}
-        self.tenv = tenv
+    """
+    Typing context (\Gamma), persistent: `update` returns a new environment
+    and an environment never changes once built. Both extending and lookup
+    take O(log n) in the number of names bound (see PersistentMap).
+    Inner bindings shadow outer ones.
+    """
+    def __init__(self, bindings=None):
+        self.bindings = bindings if bindings is not None else PersistentMap()
 
     def update(self, varTyBindings):
-        tenv = deepcopy(self.tenv)
-        tenv.update(varTyBindings)
-        return TypeEnv(tenv=tenv)
+        if not varTyBindings:
+            return self
+        bindings = self.bindings
+        for var, ty in dict(varTyBindings).items():
+            bindings = bindings.set(var, ty)
+        return TypeEnv(bindings)
 
     def __getitem__(self, key):
-        return self.tenv[key]
-
-    def freeTV(self):
-        return joinlist([], [ty.freeTV() for ty in self.tenv.values()])
-
+        return self.bindings[key]
 
 
 class MiniMLTypeMismatchError(MiniMLLocatedError):
@@ -299,6 +453,11 @@ class TypeConstr:
         unimplemented()
 
     def freeTV(self):
+        acc = []
+        self.addFreeTV(acc)
+        return acc
+
+    def addFreeTV(self, acc):
         unimplemented()
 
 class TypeConstrEq(TypeConstr):
@@ -321,25 +480,264 @@ class TypeConstrEq(TypeConstr):
     def substMap(self, tvMap):
         return TypeConstrEq(self.lhs.substMap(tvMap), self.rhs.substMap(tvMap))
 
-    def freeTV(self):
-        return self.lhs.freeTV() + self.rhs.freeTV()
+    def addFreeTV(self, acc):
+        self.lhs.addFreeTV(acc)
+        self.rhs.addFreeTV(acc)
+
+    def size(self):
+        return self.lhs.size() + self.rhs.size()
+
+class TyperStats:
+    """
+    Profiling counters of the typer, filled in by TyperVisitor, Unifier and
+    main.doTyper when given one. See `miniml --typer-stats`.
+    """
+    def __init__(self):
+        self.constrsByNode = {}     # NodeName -> #constraints generated there
+        self.maxConstrSize = 0      # in types, see Type.size
+        self.substs = 0             # type variables bound by unification
+        self.occursChecks = 0
+        self.occursCheckSteps = 0   # types visited by occurs checks
+        self.generalizations = 0
+        self.instantiations = 0
+        self.cacheHits = 0          # lets whose schemata came from a TypeCache
+        self.cacheMisses = 0        # cacheable lets typed and stored
+        self.phaseTimes = {}        # phase -> wall time in seconds
+
+    def countConstrs(self, n, constrs):
+        if constrs == []:
+            return
+        self.constrsByNode[n.NodeName] = self.constrsByNode.get(n.NodeName, 0) + len(constrs)
+        self.maxConstrSize = max(self.maxConstrSize, *[c.size() for c in constrs])
+
+    @contextmanager
+    def timed(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phaseTimes[phase] = self.phaseTimes.get(phase, 0) + time.perf_counter() - start
+
+    def asdict(self):
+        return {
+            'constrs': sum(self.constrsByNode.values()),
+            'constrsByNode': self.constrsByNode,
+            'maxConstrSize': self.maxConstrSize,
+            'substs': self.substs,
+            'occursChecks': self.occursChecks,
+            'occursCheckSteps': self.occursCheckSteps,
+            'generalizations': self.generalizations,
+            'instantiations': self.instantiations,
+            'cacheHits': self.cacheHits,
+            'cacheMisses': self.cacheMisses,
+            'phaseTimes': self.phaseTimes,
+        }
+
+    def dump(self, f):
+        json.dump(self.asdict(), f, indent=2)
+        print(file=f)
+
+class Unifier:
+    """
+    Union-find based unification.
+
+    Type variables are bound in place (by id) to the type they unify with.
+    Chains of bound variables are compressed on lookup, and every equation is
+    decomposed exactly once, so solving is near-linear in the constraint size
+    instead of re-substituting all remaining constraints per solved variable.
+    """
+    def __init__(self, stats=None):
+        self.bound = {} # tvId -> Type
+        self.stats = stats
+
+    def find(self, ty):
+        """
+        The representative of ty: either an unbound TypeVar or a non-variable type.
+        """
+        path = []
+        while isinstance(ty, TypeVar) and ty.id in self.bound:
+            path += [ty.id]
+            ty = self.bound[ty.id]
+        for tvId in path[:-1]: # path compression
+            self.bound[tvId] = ty
+        return ty
+
+    def occurs(self, tvId, ty):
+        if self.stats is not None:
+            self.stats.occursChecks += 1
+        todo = [ty]
+        while todo != []:
+            t = self.find(todo.pop())
+            if self.stats is not None:
+                self.stats.occursCheckSteps += 1
+            if t.ground:
+                continue
+            if isinstance(t, TypeVar):
+                if t.id == tvId:
+                    return True
+            elif isinstance(t, LamType):
+                todo += [t.lhs, t.rhs]
+            elif isinstance(t, TupleType):
+                todo += t.subs
+        return False
+
+    def bind(self, tv, ty):
+        if ty is tv:
+            return
+        if not isinstance(ty, TypeVar) and self.occurs(tv.id, ty):
+            raise MiniMLError(f'unable to unify possibly recursive type: {tv} == {self.resolve(ty)}')
+        self.bound[tv.id] = ty
+        if self.stats is not None:
+            self.stats.substs += 1
+
+    def unify(self, lhs, rhs):
+        todo = [(lhs, rhs)]
+        while todo != []:
+            lhs, rhs = todo.pop()
+            lhs, rhs = self.find(lhs), self.find(rhs)
+            if lhs is rhs: # hash-consed, so equal types are identical
+                continue
+            if isinstance(lhs, TypeVar):
+                self.bind(lhs, rhs)
+            elif isinstance(rhs, TypeVar):
+                self.bind(rhs, lhs)
+            elif isinstance(lhs, LamType) and isinstance(rhs, LamType):
+                todo += [(lhs.rhs, rhs.rhs), (lhs.lhs, rhs.lhs)]
+            elif isinstance(lhs, TupleType) and isinstance(rhs, TupleType):
+                if lhs.arity() != rhs.arity():
+                    raise MiniMLError(f'tuple arity dismatch: cannot unify {self.resolve(lhs)} with {self.resolve(rhs)}')
+                todo += reversed(list(zip(lhs.subs, rhs.subs)))
+            elif lhs.unableToUnify(rhs):
+                raise MiniMLError(f'cannot unify {self.resolve(lhs)} with {self.resolve(rhs)}')
+
+    def resolve(self, ty, memo=None):
+        """
+        Substitute all bound type variables within ty.
+        Walks with an explicit stack, as Type.fold does. memo, { type: resolved },
+        carries resolved types over to other calls while no variable gets bound.
+        """
+        memo = {} if memo is None else memo
+        done = []
+        todo = [(ty, None)]
+        while todo != []:
+            t, subs = todo.pop()
+            if subs is not None:
+                if isinstance(t, TypeVar):
+                    self.bound[t.id] = done[-1] # later lookups need not resolve again
+                else:
+                    k = len(done) - len(subs)
+                    res = memo[t] = type(t)(*done[k:])
+                    del done[k:]
+                    done.append(res)
+            elif t.ground or isinstance(t, TypeVar) and t.id not in self.bound:
+                done.append(t)
+            elif t in memo:
+                done.append(memo[t])
+            elif isinstance(t, TypeVar):
+                todo += [(t, ()), (self.bound[t.id], None)]
+            else:
+                subs = t.components()
+                todo += [(t, subs)] + [(sub, None) for sub in reversed(subs)]
+        return done[0]
+
+    def solution(self):
+        """
+        The most general unifier as { tvId: ty }, with no bound tvId occurring in any ty.
+        """
+        memo = {}
+        return { tvId: self.resolve(ty, memo) for tvId, ty in list(self.bound.items()) }
 
-class TyperVisitor(ASTVisitor):
+class RankedUnifier(Unifier):
+    """
+    Unifier that also tracks the let-nesting level of type variables, as
+    OCaml does, to generalize while unification is still in progress.
+
+    A type variable starts at the level it is generated in. Binding a type
+    variable to a type lowers the variables within that type to its level,
+    since they are now reachable from there. Variables above the current
+    level are thus local to the let-bound expression being typed.
+    """
+    def __init__(self, stats=None, since=None):
+        """
+        If since is given, type variables generated from since on start
+        one level inside.
+        """
+        super().__init__(stats)
+        self.level = 0
+        self.markIds = [0]      # levels in effect for ids from markIds[i] on
+        self.markLevels = [0]
+        self.levels = {}        # tvId -> lowered level
+        if since is not None:
+            self.markIds += [since]
+            self.markLevels += [1]
+
+    def enterLevel(self):
+        self.level += 1
+        self.markIds += [TypeVar.watermark()]
+        self.markLevels += [self.level]
+
+    def leaveLevel(self):
+        self.level -= 1
+        self.markIds += [TypeVar.watermark()]
+        self.markLevels += [self.level]
+
+    def levelOf(self, tvId):
+        lvl = self.levels.get(tvId)
+        if lvl is None:
+            lvl = self.markLevels[bisect_right(self.markIds, tvId) - 1]
+        return lvl
+
+    def bind(self, tv, ty):
+        Unifier.bind(self, tv, ty)
+        lvl = self.levelOf(tv.id)
+        todo = [ty]
+        while todo != []:
+            t = self.find(todo.pop())
+            if t.ground:
+                continue
+            if isinstance(t, TypeVar):
+                if self.levelOf(t.id) > lvl:
+                    self.levels[t.id] = lvl
+            elif isinstance(t, LamType):
+                todo += [t.lhs, t.rhs]
+            elif isinstance(t, TupleType):
+                todo += t.subs
+
+    def generalize(self, ty):
+        ty = self.resolve(ty)
+        quantTVIds = list({ tvId for tvId in ty.freeTV() if self.levelOf(tvId) > self.level })
+        return TypeSchema(ty, quantTVIds=quantTVIds)
+
+class TyperVisitor(IterativeVisitor):
     """
     Type inference & checking. Attaches type info to AST nodes.
 
     Nodes are annotated with fields
         _tenv (\Gamma)  :: down, of type TypeEnv
-        _constr         :: up.
-                           type constraints are either
-                            (T1, T2):   T1 = T2
-                            TODO Richer constraints like `isNotLam T`
         type            :: up
 
+    Type constraints are appended to the single store `self.constrs`, in
+    traversal order. So the constraints of a subtree are a contiguous range
+    of it, which is what let-generalization takes along into its TypeSchema.
+        type constraints are either
+            (T1, T2):   T1 = T2
+            TODO Richer constraints like `isNotLam T`
+
     Visit functions returns nothing. Still visiting patterns return (ty, newBind: tenv)
+    Children are visited by yielding goDown(n, ch), see IterativeVisitor.
+
+    Given a TypeCache, lets with closed bound expressions take their schemata
+    from it when already typed elsewhere. Nodes inside them are then left
+    without type annotations.
     """
     VisitorName = 'Typer'
 
+    def __init__(self, stats=None, cache=None):
+        TypeVar.newSession()
+        self.constrs = []
+        self.stats = stats
+        self.cache = cache
+
     UnaOpRules = {
     #  op : sub, resTy
         '-': (BaseType('int'), BaseType('int'))
@@ -361,124 +759,143 @@ class TyperVisitor(ASTVisitor):
 
     def visitTop(self, n):
         n._tenv = TypeEnv()
-        newBind = joindict([self.goDown(n, dt) for dt in n.dataTypes])
-        self.goDown(n, n.expr, newBind=newBind)
+        newBinds = []
+        for dt in n.dataTypes:
+            newBinds += [(yield self.goDown(n, dt))]
+        yield self.goDown(n, n.expr, newBind=joindict(newBinds))
 
     def visitTyUnk(self, n):
         n.type = TypeVar.genFresh()
-        n._constr = []
 
     def visitTyBase(self, n):
         n.type = BaseType(n.name)
-        n._constr = []
 
     def visitTyLam(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         n.type = LamType(n.lhs.type, n.rhs.type)
-        n._constr = []
 
     def visitTyData(self, n):
         n.type = DataType(n.name)
-        n._constr = []
 
     def visitDataType(self, n):
         newBind = {}
         for ctor in n.ctors:
             ctorTy = DataType(n.name)
             for ty in reversed(ctor.argTys):
-                self.goDown(n, ty)
+                yield self.goDown(n, ty)
                 ctorTy = LamType(ty.type, ctorTy)
             newBind[ctor.name[0]] = ctorTy
         return newBind
 
     def visitLet(self, n):
-        self.goDown(n, n.ty)
-        self.goDown(n, n.val)
-        self.goDown(n, n.body, newBind={ n.name: TypeSchema(n.val.type, tenv=n._tenv, constrs=n.val._constr) })
+        yield self.goDown(n, n.ty)
+        key, cached = self.cacheLookup(n)
+        if cached is not None:
+            schema, = cached
+            valTy, _ = schema.instantiate()
+        else:
+            since = self.enterLevel()
+            start = len(self.constrs)
+            yield self.goDown(n, n.val)
+            valConstrs = self.constrs[start:]
+            self.leaveLevel()
+            schema = self.generalize(n.val.type, since, valConstrs)
+            self.cacheStore(key, [schema])
+            valTy = n.val.type
+        yield self.goDown(n, n.body, newBind={ n.name: schema })
         n.type = n.body.type
-        n._constr += [TypeConstrEq(n.ty.type, n.val.type)]
+        self.constrain(n, [TypeConstrEq(n.ty.type, valTy)])
 
     def visitLetRec(self, n):
         # Polymorphic let-recs require some careful thought.
         #   ... written lots of stuff and deleted
         #   within let-rec arms, all arms are monotype, but in body they are polytype
+        key, cached = self.cacheLookup(n)
+        if cached is not None:
+            yield self.goDown(n, n.body, newBind={ arm.fnName: schema
+                for arm, schema in zip(n.arms, cached) })
+            n.type = n.body.type
+            return
+        since = self.enterLevel()
+        start = len(self.constrs)
         armDecls = {}
         armValTys = []
         # 1. declare all arms before going into their body, but do not go into vals yet
         for arm in n.arms:
-            self.goDown(n, arm.fnTy)
-            self.goDown(n, arm.argTy)
+            yield self.goDown(n, arm.fnTy)
+            yield self.goDown(n, arm.argTy)
             armValTy = TypeVar.genFresh()
             armValTys += [armValTy]
-            n._constr += [TypeConstrEq(arm.fnTy.type, LamType(arm.argTy.type, armValTy))]
+            self.constrain(n, [TypeConstrEq(arm.fnTy.type, LamType(arm.argTy.type, armValTy))])
             armDecls[arm.fnName] = arm.fnTy.type
         # 2. type the arm bodies
         tenv = n._tenv.update(armDecls)
         for arm, armValTy in zip(n.arms, armValTys):
-            self.goDown(n, arm.val, chTEnv=tenv.update({ arm.argName: arm.argTy.type }))
-            n._constr += [TypeConstrEq(arm.val.type, armValTy)]
+            yield self.goDown(n, arm.val, chTEnv=tenv.update({ arm.argName: arm.argTy.type }))
+            self.constrain(n, [TypeConstrEq(arm.val.type, armValTy)])
+        # the arms are typed together, so each schema carries all their constraints
+        armsConstrs = self.constrs[start:]
+        self.leaveLevel()
         # 3. type the let body
         polyArmBinds = { arm.fnName:
-                TypeSchema(LamType(arm.argTy.type, arm.val.type),
-                    tenv=n._tenv,
-                    constrs=arm.val._constr + arm.argTy._constr)
+                self.generalize(LamType(arm.argTy.type, arm.val.type),
+                    since,
+                    armsConstrs)
                 for arm in n.arms }
-        self.goDown(n, n.body, chTEnv=tenv.update(polyArmBinds))
+        self.cacheStore(key, [polyArmBinds[arm.fnName] for arm in n.arms])
+        yield self.goDown(n, n.body, chTEnv=tenv.update(polyArmBinds))
         n.type = n.body.type
 
     def visitLam(self, n):
-        self.goDown(n, n.ty)
-        self.goDown(n, n.body, newBind={ n.name : n.ty.type })
+        yield self.goDown(n, n.ty)
+        yield self.goDown(n, n.body, newBind={ n.name : n.ty.type })
         n.type = LamType(n.ty.type, n.body.type)
 
     def visitSeq(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         n.type = n.subs[-1].type
 
     def visitIte(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         n.type = n.tr.type
-        n._constr += [
+        self.constrain(n, [
                 TypeConstrEq(n.cond.type, BaseType('bool')),
-                TypeConstrEq(n.tr.type, n.fl.type)]
+                TypeConstrEq(n.tr.type, n.fl.type)])
 
     def visitBinOp(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
 
         if n.op in {'==', '!='}:
             # TODO: lam types are not compariable
             n.type = BaseType('bool')
-            n._constr += [TypeConstrEq(n.lhs.type, n.rhs.type)]
+            self.constrain(n, [TypeConstrEq(n.lhs.type, n.rhs.type)])
             return
 
         lhsTy, rhsTy, resTy = TyperVisitor.BinOpRules[n.op]
         n.type = resTy
-        n._constr += [
+        self.constrain(n, [
                 TypeConstrEq(n.lhs.type, lhsTy),
-                TypeConstrEq(n.rhs.type, rhsTy)]
+                TypeConstrEq(n.rhs.type, rhsTy)])
 
     def visitUnaOp(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         subTy, resTy = TyperVisitor.UnaOpRules[n.op]
         n.type = resTy
-        n._constr += [TypeConstrEq(n.sub.type, subTy)]
+        self.constrain(n, [TypeConstrEq(n.sub.type, subTy)])
 
     def visitApp(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         resTy = TypeVar.genFresh()
         n.type = resTy
-        n._constr += [TypeConstrEq(n.fn.type, LamType(n.arg.type, resTy))]
+        self.constrain(n, [TypeConstrEq(n.fn.type, LamType(n.arg.type, resTy))])
 
     def visitLit(self, n):
         if type(n.val) is int:
             n.type = BaseType('int')
-            n._constr = []
         elif n.val == ():
             n.type = BaseType('unit')
-            n._constr = []
         elif type(n.val) is bool: # fuck you python for bool <: int
             n.type = BaseType('bool')
-            n._constr = []
         else:
             unreachable()
 
@@ -486,26 +903,25 @@ class TyperVisitor(ASTVisitor):
         ty, constr = n._tenv[n.name], []
         if isinstance(ty, TypeSchema):
             ty, constr = ty.instantiate()
+            if self.stats is not None:
+                self.stats.instantiations += 1
         n.type = ty
-        n._constr = constr
+        self.constrain(n, constr)
 
     def visitTuple(self, n):
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         n.type = TupleType(*[sub.type for sub in n.subs])
 
     def visitBuiltin(self, n):
         if n.name == 'println': # println: \forall t. t -> unit
             argTV = TypeVar.genFresh()
             n.type = LamType(argTV, BaseType('unit'))
-            n._constr = []
         elif n.name == 'print': # print: \forall t. t -> unit
             # TODO: put them foremost. now we have type schemata.
             argTV = TypeVar.genFresh()
             n.type = LamType(argTV, BaseType('unit'))
-            n._constr = []
         elif n.name == 'panic': # print: \forall t. t
             n.type = TypeVar.genFresh()
-            n._constr = []
         else:
             unreachable()
 
@@ -518,7 +934,7 @@ class TyperVisitor(ASTVisitor):
         #       Because essentially  nth  is (variably) dependently typed.
         #
         #       Seems like Scala and Rust take the same approach.
-        self.visitChildren(n)
+        yield from self.visitChildrenIter(n)
         if not isinstance(n.expr.type, TupleType):
             raise MiniMLLocatedError(n,
                     'typeck limitation: argument to nth must be of concrete tuple type')
@@ -528,16 +944,16 @@ class TyperVisitor(ASTVisitor):
         n.type = n.expr.type.nth(n.idx)
 
     def visitMatch(self, n):
-        self.goDown(n, n.expr)
+        yield self.goDown(n, n.expr)
         resTy = TypeVar.genFresh()
         n.type = resTy
 
         for arm in n.arms:
-            ty, newBind = self.goDown(n, arm.ptn)
-            self.goDown(n, arm.expr, newBind=newBind)
-            n._constr += [
+            ty, newBind = yield self.goDown(n, arm.ptn)
+            yield self.goDown(n, arm.expr, newBind=newBind)
+            self.constrain(n, [
                     TypeConstrEq(arm.expr.type, resTy),
-                    TypeConstrEq(ty, n.expr.type)]
+                    TypeConstrEq(ty, n.expr.type)])
 
     def visitPtnBinder(self, n):
         # NOTE: visiting patterns returns (ty, newBind)
@@ -546,186 +962,222 @@ class TyperVisitor(ASTVisitor):
         ty = TypeVar.genFresh()
         tenv = { n.name: ty }
         n.type = ty
-        n._constr = []
         return ty, tenv
 
     def visitPtnTuple(self, n):
-        tys, tenvs = list(unzip(self.goDown(n, s) for s in n.subs))
+        subs = []
+        for s in n.subs:
+            subs += [(yield self.goDown(n, s))]
+        tys, tenvs = list(unzip(subs))
         tenv = joindict(tenvs)
         ty = TupleType(*tys)
         n.type = ty
-        n._constr = []
         return ty, tenv
 
     def visitPtnLit(self, n):
-        self.goDown(n, n.expr)
+        yield self.goDown(n, n.expr)
         ty = n.expr.type
         tenv = {}
         n.type = ty
-        n._constr = []
         return ty, tenv
 
     def visitPtnData(self, n):
-        tys, tenvs = list(unzip(self.goDown(n, s) for s in n.subs))
+        subs = []
+        for s in n.subs:
+            subs += [(yield self.goDown(n, s))]
+        tys, tenvs = list(unzip(subs))
         tenv = joindict(tenvs)
         # the provided (ptn) argument tys and ctor param tys agree
         ctorTys = asinstance(n._tenv[n.name[0]], LamType).flatten()
         constrs = [TypeConstrEq(argTy, ctorParamTy)
                 for argTy, ctorParamTy in zip(tys, ctorTys)]
         n.type = ctorTys[-1]
-        n._constr = constrs
+        self.constrain(n, constrs)
         return n.type, tenv
 
+    def constrain(self, n, constrs):
+        # constraints generated at node n
+        self.constrs += constrs
+        if self.stats is not None:
+            self.stats.countConstrs(n, constrs)
+
+    def enterLevel(self):
+        """
+        Called before typing a let-bound expression.
+        Returns the `since` to pass to generalize.
+        """
+        return TypeVar.watermark()
+
+    def leaveLevel(self):
+        pass
+
+    def generalize(self, ty, since, constrs):
+        if self.stats is not None:
+            self.stats.generalizations += 1
+        return TypeSchema(ty, since=since, constrs=constrs, stats=self.stats)
+
+    def cacheLookup(self, n):
+        """
+        Returns (key, schemata) of let/let rec n, where key is None if n is not
+        cacheable and schemata is None on a miss.
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.keyOf(n)
+        if key is None:
+            return None, None
+        cached = self.cache.lookup(key)
+        if self.stats is not None:
+            if cached is not None:
+                self.stats.cacheHits += 1
+            else:
+                self.stats.cacheMisses += 1
+        return key, cached
+
+    def cacheStore(self, key, schemas):
+        if key is not None:
+            self.cache.store(key, schemas)
+
     def goDown(self, n, ch, newBind=None, chTEnv=None):
-        # just pass down _tenv and collect constr
+        # just pass down _tenv, returns ch to visit
         if chTEnv is not None:
             ch._tenv = asinstance(chTEnv, TypeEnv)
         elif newBind is not None:
             ch._tenv = n._tenv.update(newBind)
         else:
             ch._tenv = n._tenv
-        ret = self(ch)
-        constr, cDelta = getattr(n, '_constr', []), getattr(ch, '_constr', [])
-        n._constr = constr + cDelta
-        return ret
+        return ch
 
-    def visitChildren(self, n):
+    def visitChildrenIter(self, n):
         ret = []
-        for f, ch in n._c.items():
+        for f in n.childFields:
+            ch = getattr(n, f)
             if f in n.bunchedFields:
                 for chch in ch:
-                    ret += [self.goDown(n, chch)]
+                    ret += [(yield self.goDown(n, chch))]
             else:
-                ret += [self.goDown(n, ch)]
+                ret += [(yield self.goDown(n, ch))]
         return ret
 
 
 
-class UnifyTagVisitor(ASTVisitor):
+class OnlineTyperVisitor(TyperVisitor):
+    """
+    Algorithm J style type inference.
+
+    Same typing rules as TyperVisitor, but each constraint is unified as soon
+    as it is generated rather than stored for UnifyTagVisitor. So no
+    constraint list is kept alive, and a type error is reported at the node
+    that generated the offending constraint. Let-generalization uses the
+    levels of RankedUnifier, and schemata carry no constraints.
+
+    Tag the types afterwards with UnifyTagVisitor(tvMap=self.solution()).
+    """
+    VisitorName = 'OnlineTyper'
+
+    def __init__(self, stats=None, cache=None):
+        super().__init__(stats, cache)
+        self.uf = RankedUnifier(stats)
+
+    def constrain(self, n, constrs):
+        if self.stats is not None:
+            self.stats.countConstrs(n, constrs)
+        for c in constrs:
+            try:
+                self.uf.unify(c.lhs, c.rhs)
+            except MiniMLLocatedError:
+                raise
+            except MiniMLError as e:
+                raise MiniMLLocatedError(n, str(e))
+
+    def enterLevel(self):
+        self.uf.enterLevel()
+
+    def leaveLevel(self):
+        self.uf.leaveLevel()
+
+    def generalize(self, ty, since, constrs):
+        if self.stats is not None:
+            self.stats.generalizations += 1
+        return self.uf.generalize(ty)
+
+    def solution(self):
+        return self.uf.solution()
+
+
+class UnifyTagVisitor(IterativeVisitor):
     """
     Does unification and tagging types.
 
     Nodes are annotated with fields
         _tenv           deleted
-        _constr         deleted
         type            the inferred type
     """
     VisitorName = 'UnifyTag'
 
-    def unify(_constrs):
-        tvMap = {}
-
-        constrs = _constrs
-        niter = 0
-        while constrs != []:
-            if DEBUG['typer.PRINT_CONSTRS']:
-                print('='*70)
-                print('Constrs:')
-                pprint(constrs)
-                print(':Constrs')
-
-            if DEBUG['typer.PRINT_UNIF_STATS']:
-                niter += 1
-                print(f'unification iter {niter}')
-            newConstrs = []
-
-            # 1. break lambdas, tuples etc.
-            constrs = [c for c in constrs if not c.isValid()] # filter out all tautologies
-            if constrs == []:
-                break
-            for c in constrs:
-                if isinstance(c, TypeConstrEq):
-                    if isinstance(c.lhs, LamType) and isinstance(c.rhs, LamType):
-                        c1 = TypeConstrEq(c.lhs.lhs, c.rhs.lhs)
-                        c2 = TypeConstrEq(c.lhs.rhs, c.rhs.rhs)
-                        newConstrs += [c1, c2]
-                        continue
-                    if isinstance(c.lhs, TupleType) and isinstance(c.rhs, TupleType):
-                        if c.lhs.arity() != c.rhs.arity():
-                            raise MiniMLError(f'tuple arity dismatch: cannot unify {c.lhs} with {c.rhs}')
-                        newCs = [TypeConstrEq(x, y) for x, y in zip(c.lhs.subs, c.rhs.subs)]
-                        newConstrs += newCs
-                        continue
-                    if c.lhs.unableToUnify(c.rhs):
-                        raise MiniMLError(f'cannot unify {c.lhs} with {c.rhs}')
-
-                newConstrs += [c]
-            constrs = newConstrs
-
-            if DEBUG['typer.PRINT_CONSTRS']:
-                print('-'*70)
-                print('Constrs:')
-                pprint(constrs)
-                print(':Constrs')
-
-            # 2. find a resolved type variable (OPT: multiple at once)
-            constrs = [c for c in constrs if not c.isValid()] # filter out all tautologies
-            if constrs == []:
-                break
-            substTvId, substTy = None, None
-            for c in constrs:
-                if isinstance(c, TypeConstrEq):
-                    if isinstance(c.lhs, TypeVar):
-                        substTvId, substTy = c.lhs.id, c.rhs
-                        break
-                    if isinstance(c.rhs, TypeVar):
-                        substTvId, substTy = c.rhs.id, c.lhs
-                        break
-            else:
-                raise MiniMLError('unification failed: no trivial varsubst')
-            tvMap[substTvId] = substTy
-            if substTvId in substTy.freeTV():
-                raise MiniMLError(f'unable to unify possibly recursive type: \'{substTvId} == {substTy}')
-
-            if DEBUG['typer.PRINT_CONSTRS']:
-                print('='*70)
-                print(f'{str(substTvId):<30} => {str(substTy):<30}')
-            # todo check: panic if    free(substTy).contains(substTvId)
-
-            # 3. apply the substitution
-            #    note the substitution need be applied to tvMap as well
-            #    as tvMap is a specific trivial form of constraint
-            constrs = [c.subst(substTvId, substTy) for c in constrs]
-            for tvId, ty in tvMap.items():
-                tvMap[tvId] = ty.subst(substTvId, substTy)
-            constrs = [c for c in constrs if not c.isValid()] # filter out all tautologies
-            if constrs == []:
-                break
+    def unify(constrs, stats=None):
+        if DEBUG['typer.PRINT_CONSTRS']:
+            print('='*70)
+            print('Constrs:')
+            from pprint import pprint
+            pprint(constrs)
+            print(':Constrs')
+
+        uf = Unifier(stats)
+        for c in constrs:
+            if isinstance(c, TypeConstrEq):
+                uf.unify(c.lhs, c.rhs)
+        tvMap = uf.solution()
+
+        if DEBUG['typer.PRINT_UNIF_STATS']:
+            print(f'unification: {len(constrs)} constraints, {len(tvMap)} type variables solved')
 
         if DEBUG['typer.PRINT_TVMAP']:
             print(tvMap)
 
         return tvMap
 
-    def __init__(self, constrs):
-        self.tvMap = UnifyTagVisitor.unify(constrs)
+    def __init__(self, constrs=None, stats=None, tvMap=None):
+        """
+        Tag types with tvMap if given, e.g. by OnlineTyperVisitor.solution.
+        Otherwise solve constrs for it.
+        """
+        if tvMap is None:
+            tvMap = UnifyTagVisitor.unify(constrs, stats)
+        self.tvMap = tvMap
+        self.memo = {} # see Type.substMap
 
-    def visit(self, n):
+    def tag(self, n):
+        """
+        Tags n alone. Can be fused into other passes as a hook.
+        """
         if hasattr(n, 'type'):
-            n.type = n.type.substMap(self.tvMap)
-        ASTVisitor.visit(self, n)
+            n.type = n.type.substMap(self.tvMap, self.memo)
+        if hasattr(n, '_tenv'):
+            del n._tenv
         if DEBUG['typer.PRINT_VARTY_AFTER_UNIFICATION']:
             if isinstance(n, LetNode):
-                v, t = n.name, str(n.ty.type)
+                v, t = n.name, str(n.ty.type.substMap(self.tvMap))
                 print(f'let     {v:<20}{t:<40}')
             elif isinstance(n, LamNode):
-                v, t = n.name, str(n.ty.type)
+                v, t = n.name, str(n.ty.type.substMap(self.tvMap))
                 print(f'lam     {v:<20}{t:<40}')
             elif isinstance(n, LetRecArmNode):
-                v, t = n.fnName, str(n.fnTy.type)
+                v, t = n.fnName, str(n.fnTy.type.substMap(self.tvMap))
                 print(f'lrarm   {v:<20}{t:<40}')
 
+    def visitDefault(self, n):
+        self.tag(n)
+        yield from self.visitChildrenIter(n)
+
 
-class TypedIndentedPrintVisitor(ASTVisitor):
+class TypedIndentedPrintVisitor(IterativeVisitor):
     VisitorName = 'TypedIndentedPrint'
+    visitsAllNodes = True
     INDENT = '|   '
 
-    def visitTermNode(self, n):
-        ty = getattr(n, 'type', None)
-        if ty is not None:
-            return ['* typer: ' + str(n.v), str(ty)]
-        else:
-            return [str(n.v)]
+    def visitTermNode(self, v):
+        return [str(v)]
 
     def joinResults(self, n, chLines):
         ty = getattr(n, 'type', None)
@@ -735,6 +1187,6 @@ class TypedIndentedPrintVisitor(ASTVisitor):
             return [n.NodeName] + [self.INDENT + x for x in flatten(chLines)]
 
     def visitTop(self, n):
-        res = self.visitChildren(n)
+        res = yield from self.visitChildrenIter(n)
         res = self.joinResults(n, res)
         return '\n'.join(res)
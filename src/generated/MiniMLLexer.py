@@ -0,0 +1,188 @@
+# Generated from MiniML.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+def serializedATN():
+    return [
+        4,0,42,267,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,1,0,1,
+        0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,2,1,2,1,2,1,2,1,3,1,3,1,
+        4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,7,1,
+        7,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,
+        1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,15,1,15,1,16,1,16,1,16,1,17,
+        1,17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,
+        1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,
+        1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,
+        1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,
+        1,26,1,27,1,27,1,28,1,28,1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,32,
+        1,33,1,33,1,34,1,34,1,34,1,35,1,35,1,35,1,36,1,36,1,36,1,37,1,37,
+        1,37,1,38,4,38,233,8,38,11,38,12,38,234,1,39,4,39,238,8,39,11,39,
+        12,39,239,1,39,1,39,1,40,1,40,5,40,246,8,40,10,40,12,40,249,9,40,
+        1,41,1,41,1,41,1,41,5,41,255,8,41,10,41,12,41,258,9,41,1,41,1,41,
+        1,42,1,42,1,43,1,43,1,44,1,44,0,0,45,1,1,3,2,5,3,7,4,9,5,11,6,13,
+        7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,
+        37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,
+        59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,
+        81,41,83,42,85,0,87,0,89,0,1,0,5,3,0,9,10,13,13,32,32,2,0,10,10,
+        13,13,3,0,65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,1,0,48,
+        57,267,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,
+        0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,
+        0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,
+        0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,
+        0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,
+        0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,
+        0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,
+        0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,
+        0,0,81,1,0,0,0,0,83,1,0,0,0,1,91,1,0,0,0,3,100,1,0,0,0,5,102,1,0,
+        0,0,7,106,1,0,0,0,9,108,1,0,0,0,11,116,1,0,0,0,13,120,1,0,0,0,15,
+        123,1,0,0,0,17,127,1,0,0,0,19,129,1,0,0,0,21,131,1,0,0,0,23,134,
+        1,0,0,0,25,140,1,0,0,0,27,142,1,0,0,0,29,144,1,0,0,0,31,146,1,0,
+        0,0,33,148,1,0,0,0,35,151,1,0,0,0,37,156,1,0,0,0,39,161,1,0,0,0,
+        41,165,1,0,0,0,43,173,1,0,0,0,45,179,1,0,0,0,47,185,1,0,0,0,49,191,
+        1,0,0,0,51,196,1,0,0,0,53,201,1,0,0,0,55,205,1,0,0,0,57,207,1,0,
+        0,0,59,209,1,0,0,0,61,211,1,0,0,0,63,213,1,0,0,0,65,215,1,0,0,0,
+        67,217,1,0,0,0,69,219,1,0,0,0,71,222,1,0,0,0,73,225,1,0,0,0,75,228,
+        1,0,0,0,77,232,1,0,0,0,79,237,1,0,0,0,81,243,1,0,0,0,83,250,1,0,
+        0,0,85,261,1,0,0,0,87,263,1,0,0,0,89,265,1,0,0,0,91,92,5,100,0,0,
+        92,93,5,97,0,0,93,94,5,116,0,0,94,95,5,97,0,0,95,96,5,116,0,0,96,
+        97,5,121,0,0,97,98,5,112,0,0,98,99,5,101,0,0,99,2,1,0,0,0,100,101,
+        5,61,0,0,101,4,1,0,0,0,102,103,5,101,0,0,103,104,5,110,0,0,104,105,
+        5,100,0,0,105,6,1,0,0,0,106,107,5,124,0,0,107,8,1,0,0,0,108,109,
+        5,108,0,0,109,110,5,101,0,0,110,111,5,116,0,0,111,112,5,32,0,0,112,
+        113,5,114,0,0,113,114,5,101,0,0,114,115,5,99,0,0,115,10,1,0,0,0,
+        116,117,5,97,0,0,117,118,5,110,0,0,118,119,5,100,0,0,119,12,1,0,
+        0,0,120,121,5,105,0,0,121,122,5,110,0,0,122,14,1,0,0,0,123,124,5,
+        108,0,0,124,125,5,101,0,0,125,126,5,116,0,0,126,16,1,0,0,0,127,128,
+        5,58,0,0,128,18,1,0,0,0,129,130,5,92,0,0,130,20,1,0,0,0,131,132,
+        5,45,0,0,132,133,5,62,0,0,133,22,1,0,0,0,134,135,5,109,0,0,135,136,
+        5,97,0,0,136,137,5,116,0,0,137,138,5,99,0,0,138,139,5,104,0,0,139,
+        24,1,0,0,0,140,141,5,44,0,0,141,26,1,0,0,0,142,143,5,40,0,0,143,
+        28,1,0,0,0,144,145,5,41,0,0,145,30,1,0,0,0,146,147,5,59,0,0,147,
+        32,1,0,0,0,148,149,5,105,0,0,149,150,5,102,0,0,150,34,1,0,0,0,151,
+        152,5,116,0,0,152,153,5,104,0,0,153,154,5,101,0,0,154,155,5,110,
+        0,0,155,36,1,0,0,0,156,157,5,101,0,0,157,158,5,108,0,0,158,159,5,
+        115,0,0,159,160,5,101,0,0,160,38,1,0,0,0,161,162,5,110,0,0,162,163,
+        5,116,0,0,163,164,5,104,0,0,164,40,1,0,0,0,165,166,5,112,0,0,166,
+        167,5,114,0,0,167,168,5,105,0,0,168,169,5,110,0,0,169,170,5,116,
+        0,0,170,171,5,108,0,0,171,172,5,110,0,0,172,42,1,0,0,0,173,174,5,
+        112,0,0,174,175,5,114,0,0,175,176,5,105,0,0,176,177,5,110,0,0,177,
+        178,5,116,0,0,178,44,1,0,0,0,179,180,5,112,0,0,180,181,5,97,0,0,
+        181,182,5,110,0,0,182,183,5,105,0,0,183,184,5,99,0,0,184,46,1,0,
+        0,0,185,186,5,102,0,0,186,187,5,97,0,0,187,188,5,108,0,0,188,189,
+        5,115,0,0,189,190,5,101,0,0,190,48,1,0,0,0,191,192,5,116,0,0,192,
+        193,5,114,0,0,193,194,5,117,0,0,194,195,5,101,0,0,195,50,1,0,0,0,
+        196,197,5,117,0,0,197,198,5,110,0,0,198,199,5,105,0,0,199,200,5,
+        116,0,0,200,52,1,0,0,0,201,202,5,105,0,0,202,203,5,110,0,0,203,204,
+        5,116,0,0,204,54,1,0,0,0,205,206,5,42,0,0,206,56,1,0,0,0,207,208,
+        5,47,0,0,208,58,1,0,0,0,209,210,5,37,0,0,210,60,1,0,0,0,211,212,
+        5,43,0,0,212,62,1,0,0,0,213,214,5,45,0,0,214,64,1,0,0,0,215,216,
+        5,62,0,0,216,66,1,0,0,0,217,218,5,60,0,0,218,68,1,0,0,0,219,220,
+        5,62,0,0,220,221,5,61,0,0,221,70,1,0,0,0,222,223,5,60,0,0,223,224,
+        5,61,0,0,224,72,1,0,0,0,225,226,5,61,0,0,226,227,5,61,0,0,227,74,
+        1,0,0,0,228,229,5,33,0,0,229,230,5,61,0,0,230,76,1,0,0,0,231,233,
+        3,89,44,0,232,231,1,0,0,0,233,234,1,0,0,0,234,232,1,0,0,0,234,235,
+        1,0,0,0,235,78,1,0,0,0,236,238,7,0,0,0,237,236,1,0,0,0,238,239,1,
+        0,0,0,239,237,1,0,0,0,239,240,1,0,0,0,240,241,1,0,0,0,241,242,6,
+        39,0,0,242,80,1,0,0,0,243,247,3,85,42,0,244,246,3,87,43,0,245,244,
+        1,0,0,0,246,249,1,0,0,0,247,245,1,0,0,0,247,248,1,0,0,0,248,82,1,
+        0,0,0,249,247,1,0,0,0,250,251,5,45,0,0,251,252,5,45,0,0,252,256,
+        1,0,0,0,253,255,8,1,0,0,254,253,1,0,0,0,255,258,1,0,0,0,256,254,
+        1,0,0,0,256,257,1,0,0,0,257,259,1,0,0,0,258,256,1,0,0,0,259,260,
+        6,41,0,0,260,84,1,0,0,0,261,262,7,2,0,0,262,86,1,0,0,0,263,264,7,
+        3,0,0,264,88,1,0,0,0,265,266,7,4,0,0,266,90,1,0,0,0,5,0,234,239,
+        247,256,1,6,0,0
+    ]
+
+class MiniMLLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    T__0 = 1
+    T__1 = 2
+    T__2 = 3
+    T__3 = 4
+    T__4 = 5
+    T__5 = 6
+    T__6 = 7
+    T__7 = 8
+    T__8 = 9
+    T__9 = 10
+    T__10 = 11
+    T__11 = 12
+    T__12 = 13
+    T__13 = 14
+    T__14 = 15
+    T__15 = 16
+    T__16 = 17
+    T__17 = 18
+    T__18 = 19
+    T__19 = 20
+    T__20 = 21
+    T__21 = 22
+    T__22 = 23
+    T__23 = 24
+    T__24 = 25
+    T__25 = 26
+    T__26 = 27
+    T__27 = 28
+    T__28 = 29
+    T__29 = 30
+    T__30 = 31
+    T__31 = 32
+    T__32 = 33
+    T__33 = 34
+    T__34 = 35
+    T__35 = 36
+    T__36 = 37
+    T__37 = 38
+    Integer = 39
+    Whitespace = 40
+    Ident = 41
+    Comment = 42
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'datatype'", "'='", "'end'", "'|'", "'let rec'", "'and'", "'in'", 
+            "'let'", "':'", "'\\'", "'->'", "'match'", "','", "'('", "')'", 
+            "';'", "'if'", "'then'", "'else'", "'nth'", "'println'", "'print'", 
+            "'panic'", "'false'", "'true'", "'unit'", "'int'", "'*'", "'/'", 
+            "'%'", "'+'", "'-'", "'>'", "'<'", "'>='", "'<='", "'=='", "'!='" ]
+
+    symbolicNames = [ "<INVALID>",
+            "Integer", "Whitespace", "Ident", "Comment" ]
+
+    ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
+                  "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
+                  "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
+                  "T__20", "T__21", "T__22", "T__23", "T__24", "T__25", 
+                  "T__26", "T__27", "T__28", "T__29", "T__30", "T__31", 
+                  "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
+                  "Integer", "Whitespace", "Ident", "Comment", "IdentLead", 
+                  "WordChar", "Digit" ]
+
+    grammarFileName = "MiniML.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
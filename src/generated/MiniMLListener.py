@@ -0,0 +1,480 @@
+# Generated from MiniML.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .MiniMLParser import MiniMLParser
+else:
+    from MiniMLParser import MiniMLParser
+
+# This class defines a complete listener for a parse tree produced by MiniMLParser.
+class MiniMLListener(ParseTreeListener):
+
+    # Enter a parse tree produced by MiniMLParser#top.
+    def enterTop(self, ctx:MiniMLParser.TopContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#top.
+    def exitTop(self, ctx:MiniMLParser.TopContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#dataType.
+    def enterDataType(self, ctx:MiniMLParser.DataTypeContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#dataType.
+    def exitDataType(self, ctx:MiniMLParser.DataTypeContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#dataTypeArm.
+    def enterDataTypeArm(self, ctx:MiniMLParser.DataTypeArmContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#dataTypeArm.
+    def exitDataTypeArm(self, ctx:MiniMLParser.DataTypeArmContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#expr.
+    def enterExpr(self, ctx:MiniMLParser.ExprContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#expr.
+    def exitExpr(self, ctx:MiniMLParser.ExprContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#let_.
+    def enterLet_(self, ctx:MiniMLParser.Let_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#let_.
+    def exitLet_(self, ctx:MiniMLParser.Let_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#let1.
+    def enterLet1(self, ctx:MiniMLParser.Let1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#let1.
+    def exitLet1(self, ctx:MiniMLParser.Let1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#let2.
+    def enterLet2(self, ctx:MiniMLParser.Let2Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#let2.
+    def exitLet2(self, ctx:MiniMLParser.Let2Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#letRecArm.
+    def enterLetRecArm(self, ctx:MiniMLParser.LetRecArmContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#letRecArm.
+    def exitLetRecArm(self, ctx:MiniMLParser.LetRecArmContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#mat_.
+    def enterMat_(self, ctx:MiniMLParser.Mat_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#mat_.
+    def exitMat_(self, ctx:MiniMLParser.Mat_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#mat1.
+    def enterMat1(self, ctx:MiniMLParser.Mat1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#mat1.
+    def exitMat1(self, ctx:MiniMLParser.Mat1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#matchArm.
+    def enterMatchArm(self, ctx:MiniMLParser.MatchArmContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#matchArm.
+    def exitMatchArm(self, ctx:MiniMLParser.MatchArmContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ptn.
+    def enterPtn(self, ctx:MiniMLParser.PtnContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ptn.
+    def exitPtn(self, ctx:MiniMLParser.PtnContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ptn1_.
+    def enterPtn1_(self, ctx:MiniMLParser.Ptn1_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ptn1_.
+    def exitPtn1_(self, ctx:MiniMLParser.Ptn1_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ptnTuple.
+    def enterPtnTuple(self, ctx:MiniMLParser.PtnTupleContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ptnTuple.
+    def exitPtnTuple(self, ctx:MiniMLParser.PtnTupleContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ptnData.
+    def enterPtnData(self, ctx:MiniMLParser.PtnDataContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ptnData.
+    def exitPtnData(self, ctx:MiniMLParser.PtnDataContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ptnBinder.
+    def enterPtnBinder(self, ctx:MiniMLParser.PtnBinderContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ptnBinder.
+    def exitPtnBinder(self, ctx:MiniMLParser.PtnBinderContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ptnLit.
+    def enterPtnLit(self, ctx:MiniMLParser.PtnLitContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ptnLit.
+    def exitPtnLit(self, ctx:MiniMLParser.PtnLitContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ptnParen.
+    def enterPtnParen(self, ctx:MiniMLParser.PtnParenContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ptnParen.
+    def exitPtnParen(self, ctx:MiniMLParser.PtnParenContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#lam_.
+    def enterLam_(self, ctx:MiniMLParser.Lam_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#lam_.
+    def exitLam_(self, ctx:MiniMLParser.Lam_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#lam1.
+    def enterLam1(self, ctx:MiniMLParser.Lam1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#lam1.
+    def exitLam1(self, ctx:MiniMLParser.Lam1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#seq.
+    def enterSeq(self, ctx:MiniMLParser.SeqContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#seq.
+    def exitSeq(self, ctx:MiniMLParser.SeqContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ite_.
+    def enterIte_(self, ctx:MiniMLParser.Ite_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ite_.
+    def exitIte_(self, ctx:MiniMLParser.Ite_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#ite1.
+    def enterIte1(self, ctx:MiniMLParser.Ite1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#ite1.
+    def exitIte1(self, ctx:MiniMLParser.Ite1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#rel_.
+    def enterRel_(self, ctx:MiniMLParser.Rel_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#rel_.
+    def exitRel_(self, ctx:MiniMLParser.Rel_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#rel1.
+    def enterRel1(self, ctx:MiniMLParser.Rel1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#rel1.
+    def exitRel1(self, ctx:MiniMLParser.Rel1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#add_.
+    def enterAdd_(self, ctx:MiniMLParser.Add_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#add_.
+    def exitAdd_(self, ctx:MiniMLParser.Add_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#add1.
+    def enterAdd1(self, ctx:MiniMLParser.Add1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#add1.
+    def exitAdd1(self, ctx:MiniMLParser.Add1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#mul_.
+    def enterMul_(self, ctx:MiniMLParser.Mul_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#mul_.
+    def exitMul_(self, ctx:MiniMLParser.Mul_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#mul1.
+    def enterMul1(self, ctx:MiniMLParser.Mul1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#mul1.
+    def exitMul1(self, ctx:MiniMLParser.Mul1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#una_.
+    def enterUna_(self, ctx:MiniMLParser.Una_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#una_.
+    def exitUna_(self, ctx:MiniMLParser.Una_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#una1.
+    def enterUna1(self, ctx:MiniMLParser.Una1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#una1.
+    def exitUna1(self, ctx:MiniMLParser.Una1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#app_.
+    def enterApp_(self, ctx:MiniMLParser.App_Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#app_.
+    def exitApp_(self, ctx:MiniMLParser.App_Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#app1.
+    def enterApp1(self, ctx:MiniMLParser.App1Context):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#app1.
+    def exitApp1(self, ctx:MiniMLParser.App1Context):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#atomTuple.
+    def enterAtomTuple(self, ctx:MiniMLParser.AtomTupleContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#atomTuple.
+    def exitAtomTuple(self, ctx:MiniMLParser.AtomTupleContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#atomLit.
+    def enterAtomLit(self, ctx:MiniMLParser.AtomLitContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#atomLit.
+    def exitAtomLit(self, ctx:MiniMLParser.AtomLitContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#atomIdent.
+    def enterAtomIdent(self, ctx:MiniMLParser.AtomIdentContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#atomIdent.
+    def exitAtomIdent(self, ctx:MiniMLParser.AtomIdentContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#atomParen.
+    def enterAtomParen(self, ctx:MiniMLParser.AtomParenContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#atomParen.
+    def exitAtomParen(self, ctx:MiniMLParser.AtomParenContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#atomBuiltin.
+    def enterAtomBuiltin(self, ctx:MiniMLParser.AtomBuiltinContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#atomBuiltin.
+    def exitAtomBuiltin(self, ctx:MiniMLParser.AtomBuiltinContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#atomNth.
+    def enterAtomNth(self, ctx:MiniMLParser.AtomNthContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#atomNth.
+    def exitAtomNth(self, ctx:MiniMLParser.AtomNthContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#builtin.
+    def enterBuiltin(self, ctx:MiniMLParser.BuiltinContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#builtin.
+    def exitBuiltin(self, ctx:MiniMLParser.BuiltinContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#litInt.
+    def enterLitInt(self, ctx:MiniMLParser.LitIntContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#litInt.
+    def exitLitInt(self, ctx:MiniMLParser.LitIntContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#litUnit.
+    def enterLitUnit(self, ctx:MiniMLParser.LitUnitContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#litUnit.
+    def exitLitUnit(self, ctx:MiniMLParser.LitUnitContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#litBool.
+    def enterLitBool(self, ctx:MiniMLParser.LitBoolContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#litBool.
+    def exitLitBool(self, ctx:MiniMLParser.LitBoolContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#tyInt.
+    def enterTyInt(self, ctx:MiniMLParser.TyIntContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#tyInt.
+    def exitTyInt(self, ctx:MiniMLParser.TyIntContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#tyArrow.
+    def enterTyArrow(self, ctx:MiniMLParser.TyArrowContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#tyArrow.
+    def exitTyArrow(self, ctx:MiniMLParser.TyArrowContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#tyParen.
+    def enterTyParen(self, ctx:MiniMLParser.TyParenContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#tyParen.
+    def exitTyParen(self, ctx:MiniMLParser.TyParenContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#tyUnit.
+    def enterTyUnit(self, ctx:MiniMLParser.TyUnitContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#tyUnit.
+    def exitTyUnit(self, ctx:MiniMLParser.TyUnitContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#tyIdent.
+    def enterTyIdent(self, ctx:MiniMLParser.TyIdentContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#tyIdent.
+    def exitTyIdent(self, ctx:MiniMLParser.TyIdentContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#mulOp.
+    def enterMulOp(self, ctx:MiniMLParser.MulOpContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#mulOp.
+    def exitMulOp(self, ctx:MiniMLParser.MulOpContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#addOp.
+    def enterAddOp(self, ctx:MiniMLParser.AddOpContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#addOp.
+    def exitAddOp(self, ctx:MiniMLParser.AddOpContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#relOp.
+    def enterRelOp(self, ctx:MiniMLParser.RelOpContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#relOp.
+    def exitRelOp(self, ctx:MiniMLParser.RelOpContext):
+        pass
+
+
+    # Enter a parse tree produced by MiniMLParser#unaOp.
+    def enterUnaOp(self, ctx:MiniMLParser.UnaOpContext):
+        pass
+
+    # Exit a parse tree produced by MiniMLParser#unaOp.
+    def exitUnaOp(self, ctx:MiniMLParser.UnaOpContext):
+        pass
+
+
+
+del MiniMLParser
\ No newline at end of file
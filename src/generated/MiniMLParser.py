@@ -0,0 +1,3089 @@
+# Generated from MiniML.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,42,305,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        1,0,5,0,56,8,0,10,0,12,0,59,9,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,5,1,
+        68,8,1,10,1,12,1,71,9,1,1,1,1,1,1,2,1,2,1,2,4,2,78,8,2,11,2,12,2,
+        79,1,3,1,3,1,4,1,4,1,4,1,4,1,4,5,4,89,8,4,10,4,12,4,92,9,4,1,4,1,
+        4,1,4,1,4,1,4,1,4,1,4,3,4,101,8,4,1,4,1,4,1,4,1,4,1,4,3,4,108,8,
+        4,1,5,1,5,1,5,3,5,113,8,5,1,5,1,5,1,5,1,5,1,5,3,5,120,8,5,1,5,1,
+        5,1,5,1,6,1,6,1,6,1,6,4,6,129,8,6,11,6,12,6,130,1,6,1,6,3,6,135,
+        8,6,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,9,1,9,1,9,1,9,4,9,148,8,9,11,9,
+        12,9,149,1,9,1,9,4,9,154,8,9,11,9,12,9,155,3,9,158,8,9,1,10,1,10,
+        1,10,1,10,1,10,1,10,3,10,166,8,10,1,11,1,11,1,11,1,11,1,11,3,11,
+        173,8,11,1,11,1,11,3,11,177,8,11,1,12,1,12,1,12,5,12,182,8,12,10,
+        12,12,12,185,9,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,3,13,195,
+        8,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,5,14,204,8,14,10,14,12,14,
+        207,9,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,5,15,216,8,15,10,15,
+        12,15,219,9,15,1,16,1,16,1,16,1,16,1,16,1,16,1,16,5,16,228,8,16,
+        10,16,12,16,231,9,16,1,17,1,17,1,17,1,17,3,17,237,8,17,1,18,1,18,
+        1,18,1,18,1,18,5,18,244,8,18,10,18,12,18,247,9,18,1,19,1,19,1,19,
+        1,19,4,19,253,8,19,11,19,12,19,254,1,19,1,19,1,19,1,19,1,19,1,19,
+        1,19,1,19,1,19,1,19,1,19,1,19,3,19,269,8,19,1,20,1,20,1,21,1,21,
+        1,21,1,21,3,21,277,8,21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,
+        3,22,287,8,22,1,22,1,22,1,22,5,22,292,8,22,10,22,12,22,295,9,22,
+        1,23,1,23,1,24,1,24,1,25,1,25,1,26,1,26,1,26,0,5,28,30,32,36,44,
+        27,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,
+        44,46,48,50,52,0,5,1,0,21,23,1,0,24,25,1,0,28,30,1,0,31,32,1,0,33,
+        38,315,0,57,1,0,0,0,2,63,1,0,0,0,4,74,1,0,0,0,6,81,1,0,0,0,8,107,
+        1,0,0,0,10,109,1,0,0,0,12,134,1,0,0,0,14,136,1,0,0,0,16,141,1,0,
+        0,0,18,157,1,0,0,0,20,165,1,0,0,0,22,176,1,0,0,0,24,178,1,0,0,0,
+        26,194,1,0,0,0,28,196,1,0,0,0,30,208,1,0,0,0,32,220,1,0,0,0,34,236,
+        1,0,0,0,36,238,1,0,0,0,38,268,1,0,0,0,40,270,1,0,0,0,42,276,1,0,
+        0,0,44,286,1,0,0,0,46,296,1,0,0,0,48,298,1,0,0,0,50,300,1,0,0,0,
+        52,302,1,0,0,0,54,56,3,2,1,0,55,54,1,0,0,0,56,59,1,0,0,0,57,55,1,
+        0,0,0,57,58,1,0,0,0,58,60,1,0,0,0,59,57,1,0,0,0,60,61,3,6,3,0,61,
+        62,5,0,0,1,62,1,1,0,0,0,63,64,5,1,0,0,64,65,5,41,0,0,65,69,5,2,0,
+        0,66,68,3,4,2,0,67,66,1,0,0,0,68,71,1,0,0,0,69,67,1,0,0,0,69,70,
+        1,0,0,0,70,72,1,0,0,0,71,69,1,0,0,0,72,73,5,3,0,0,73,3,1,0,0,0,74,
+        75,5,4,0,0,75,77,5,41,0,0,76,78,3,44,22,0,77,76,1,0,0,0,78,79,1,
+        0,0,0,79,77,1,0,0,0,79,80,1,0,0,0,80,5,1,0,0,0,81,82,3,8,4,0,82,
+        7,1,0,0,0,83,108,3,12,6,0,84,85,5,5,0,0,85,90,3,10,5,0,86,87,5,6,
+        0,0,87,89,3,10,5,0,88,86,1,0,0,0,89,92,1,0,0,0,90,88,1,0,0,0,90,
+        91,1,0,0,0,91,93,1,0,0,0,92,90,1,0,0,0,93,94,5,7,0,0,94,95,3,6,3,
+        0,95,108,1,0,0,0,96,97,5,8,0,0,97,100,5,41,0,0,98,99,5,9,0,0,99,
+        101,3,44,22,0,100,98,1,0,0,0,100,101,1,0,0,0,101,102,1,0,0,0,102,
+        103,5,2,0,0,103,104,3,6,3,0,104,105,5,7,0,0,105,106,3,6,3,0,106,
+        108,1,0,0,0,107,83,1,0,0,0,107,84,1,0,0,0,107,96,1,0,0,0,108,9,1,
+        0,0,0,109,112,5,41,0,0,110,111,5,9,0,0,111,113,3,44,22,0,112,110,
+        1,0,0,0,112,113,1,0,0,0,113,114,1,0,0,0,114,115,5,2,0,0,115,116,
+        5,10,0,0,116,119,5,41,0,0,117,118,5,9,0,0,118,120,3,44,22,0,119,
+        117,1,0,0,0,119,120,1,0,0,0,120,121,1,0,0,0,121,122,5,11,0,0,122,
+        123,3,6,3,0,123,11,1,0,0,0,124,135,3,22,11,0,125,126,5,12,0,0,126,
+        128,3,6,3,0,127,129,3,14,7,0,128,127,1,0,0,0,129,130,1,0,0,0,130,
+        128,1,0,0,0,130,131,1,0,0,0,131,132,1,0,0,0,132,133,5,3,0,0,133,
+        135,1,0,0,0,134,124,1,0,0,0,134,125,1,0,0,0,135,13,1,0,0,0,136,137,
+        5,4,0,0,137,138,3,16,8,0,138,139,5,11,0,0,139,140,3,6,3,0,140,15,
+        1,0,0,0,141,142,3,18,9,0,142,17,1,0,0,0,143,158,3,20,10,0,144,147,
+        3,20,10,0,145,146,5,13,0,0,146,148,3,20,10,0,147,145,1,0,0,0,148,
+        149,1,0,0,0,149,147,1,0,0,0,149,150,1,0,0,0,150,158,1,0,0,0,151,
+        153,5,41,0,0,152,154,3,20,10,0,153,152,1,0,0,0,154,155,1,0,0,0,155,
+        153,1,0,0,0,155,156,1,0,0,0,156,158,1,0,0,0,157,143,1,0,0,0,157,
+        144,1,0,0,0,157,151,1,0,0,0,158,19,1,0,0,0,159,166,5,41,0,0,160,
+        166,3,42,21,0,161,162,5,14,0,0,162,163,3,16,8,0,163,164,5,15,0,0,
+        164,166,1,0,0,0,165,159,1,0,0,0,165,160,1,0,0,0,165,161,1,0,0,0,
+        166,21,1,0,0,0,167,177,3,24,12,0,168,169,5,10,0,0,169,172,5,41,0,
+        0,170,171,5,9,0,0,171,173,3,44,22,0,172,170,1,0,0,0,172,173,1,0,
+        0,0,173,174,1,0,0,0,174,175,5,11,0,0,175,177,3,6,3,0,176,167,1,0,
+        0,0,176,168,1,0,0,0,177,23,1,0,0,0,178,183,3,26,13,0,179,180,5,16,
+        0,0,180,182,3,26,13,0,181,179,1,0,0,0,182,185,1,0,0,0,183,181,1,
+        0,0,0,183,184,1,0,0,0,184,25,1,0,0,0,185,183,1,0,0,0,186,195,3,28,
+        14,0,187,188,5,17,0,0,188,189,3,28,14,0,189,190,5,18,0,0,190,191,
+        3,28,14,0,191,192,5,19,0,0,192,193,3,26,13,0,193,195,1,0,0,0,194,
+        186,1,0,0,0,194,187,1,0,0,0,195,27,1,0,0,0,196,197,6,14,-1,0,197,
+        198,3,30,15,0,198,205,1,0,0,0,199,200,10,1,0,0,200,201,3,50,25,0,
+        201,202,3,30,15,0,202,204,1,0,0,0,203,199,1,0,0,0,204,207,1,0,0,
+        0,205,203,1,0,0,0,205,206,1,0,0,0,206,29,1,0,0,0,207,205,1,0,0,0,
+        208,209,6,15,-1,0,209,210,3,32,16,0,210,217,1,0,0,0,211,212,10,1,
+        0,0,212,213,3,48,24,0,213,214,3,32,16,0,214,216,1,0,0,0,215,211,
+        1,0,0,0,216,219,1,0,0,0,217,215,1,0,0,0,217,218,1,0,0,0,218,31,1,
+        0,0,0,219,217,1,0,0,0,220,221,6,16,-1,0,221,222,3,34,17,0,222,229,
+        1,0,0,0,223,224,10,1,0,0,224,225,3,46,23,0,225,226,3,34,17,0,226,
+        228,1,0,0,0,227,223,1,0,0,0,228,231,1,0,0,0,229,227,1,0,0,0,229,
+        230,1,0,0,0,230,33,1,0,0,0,231,229,1,0,0,0,232,237,3,36,18,0,233,
+        234,3,52,26,0,234,235,3,34,17,0,235,237,1,0,0,0,236,232,1,0,0,0,
+        236,233,1,0,0,0,237,35,1,0,0,0,238,239,6,18,-1,0,239,240,3,38,19,
+        0,240,245,1,0,0,0,241,242,10,1,0,0,242,244,3,38,19,0,243,241,1,0,
+        0,0,244,247,1,0,0,0,245,243,1,0,0,0,245,246,1,0,0,0,246,37,1,0,0,
+        0,247,245,1,0,0,0,248,249,5,14,0,0,249,252,3,6,3,0,250,251,5,13,
+        0,0,251,253,3,6,3,0,252,250,1,0,0,0,253,254,1,0,0,0,254,252,1,0,
+        0,0,254,255,1,0,0,0,255,256,1,0,0,0,256,257,5,15,0,0,257,269,1,0,
+        0,0,258,269,3,42,21,0,259,269,5,41,0,0,260,261,5,14,0,0,261,262,
+        3,6,3,0,262,263,5,15,0,0,263,269,1,0,0,0,264,269,3,40,20,0,265,266,
+        5,20,0,0,266,267,5,39,0,0,267,269,3,38,19,0,268,248,1,0,0,0,268,
+        258,1,0,0,0,268,259,1,0,0,0,268,260,1,0,0,0,268,264,1,0,0,0,268,
+        265,1,0,0,0,269,39,1,0,0,0,270,271,7,0,0,0,271,41,1,0,0,0,272,277,
+        5,39,0,0,273,274,5,14,0,0,274,277,5,15,0,0,275,277,7,1,0,0,276,272,
+        1,0,0,0,276,273,1,0,0,0,276,275,1,0,0,0,277,43,1,0,0,0,278,279,6,
+        22,-1,0,279,287,5,26,0,0,280,287,5,27,0,0,281,282,5,14,0,0,282,283,
+        3,44,22,0,283,284,5,15,0,0,284,287,1,0,0,0,285,287,5,41,0,0,286,
+        278,1,0,0,0,286,280,1,0,0,0,286,281,1,0,0,0,286,285,1,0,0,0,287,
+        293,1,0,0,0,288,289,10,1,0,0,289,290,5,11,0,0,290,292,3,44,22,1,
+        291,288,1,0,0,0,292,295,1,0,0,0,293,291,1,0,0,0,293,294,1,0,0,0,
+        294,45,1,0,0,0,295,293,1,0,0,0,296,297,7,2,0,0,297,47,1,0,0,0,298,
+        299,7,3,0,0,299,49,1,0,0,0,300,301,7,4,0,0,301,51,1,0,0,0,302,303,
+        5,32,0,0,303,53,1,0,0,0,28,57,69,79,90,100,107,112,119,130,134,149,
+        155,157,165,172,176,183,194,205,217,229,236,245,254,268,276,286,
+        293
+    ]
+
+class MiniMLParser ( Parser ):
+
+    grammarFileName = "MiniML.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'datatype'", "'='", "'end'", "'|'", "'let rec'", 
+                     "'and'", "'in'", "'let'", "':'", "'\\'", "'->'", "'match'", 
+                     "','", "'('", "')'", "';'", "'if'", "'then'", "'else'", 
+                     "'nth'", "'println'", "'print'", "'panic'", "'false'", 
+                     "'true'", "'unit'", "'int'", "'*'", "'/'", "'%'", "'+'", 
+                     "'-'", "'>'", "'<'", "'>='", "'<='", "'=='", "'!='" ]
+
+    symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "Integer", 
+                      "Whitespace", "Ident", "Comment" ]
+
+    RULE_top = 0
+    RULE_dataType = 1
+    RULE_dataTypeArm = 2
+    RULE_expr = 3
+    RULE_let = 4
+    RULE_letRecArm = 5
+    RULE_mat = 6
+    RULE_matchArm = 7
+    RULE_ptn = 8
+    RULE_ptn1 = 9
+    RULE_ptn0 = 10
+    RULE_lam = 11
+    RULE_seq = 12
+    RULE_ite = 13
+    RULE_rel = 14
+    RULE_add = 15
+    RULE_mul = 16
+    RULE_una = 17
+    RULE_app = 18
+    RULE_atom = 19
+    RULE_builtin = 20
+    RULE_lit = 21
+    RULE_ty = 22
+    RULE_mulOp = 23
+    RULE_addOp = 24
+    RULE_relOp = 25
+    RULE_unaOp = 26
+
+    ruleNames =  [ "top", "dataType", "dataTypeArm", "expr", "let", "letRecArm", 
+                   "mat", "matchArm", "ptn", "ptn1", "ptn0", "lam", "seq", 
+                   "ite", "rel", "add", "mul", "una", "app", "atom", "builtin", 
+                   "lit", "ty", "mulOp", "addOp", "relOp", "unaOp" ]
+
+    EOF = Token.EOF
+    T__0=1
+    T__1=2
+    T__2=3
+    T__3=4
+    T__4=5
+    T__5=6
+    T__6=7
+    T__7=8
+    T__8=9
+    T__9=10
+    T__10=11
+    T__11=12
+    T__12=13
+    T__13=14
+    T__14=15
+    T__15=16
+    T__16=17
+    T__17=18
+    T__18=19
+    T__19=20
+    T__20=21
+    T__21=22
+    T__22=23
+    T__23=24
+    T__24=25
+    T__25=26
+    T__26=27
+    T__27=28
+    T__28=29
+    T__29=30
+    T__30=31
+    T__31=32
+    T__32=33
+    T__33=34
+    T__34=35
+    T__35=36
+    T__36=37
+    T__37=38
+    Integer=39
+    Whitespace=40
+    Ident=41
+    Comment=42
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class TopContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self):
+            return self.getTypedRuleContext(MiniMLParser.ExprContext,0)
+
+
+        def EOF(self):
+            return self.getToken(MiniMLParser.EOF, 0)
+
+        def dataType(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.DataTypeContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.DataTypeContext,i)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_top
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTop" ):
+                listener.enterTop(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTop" ):
+                listener.exitTop(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTop" ):
+                return visitor.visitTop(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def top(self):
+
+        localctx = MiniMLParser.TopContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_top)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 57
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==1:
+                self.state = 54
+                self.dataType()
+                self.state = 59
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 60
+            self.expr()
+            self.state = 61
+            self.match(MiniMLParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DataTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+
+        def dataTypeArm(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.DataTypeArmContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.DataTypeArmContext,i)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_dataType
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDataType" ):
+                listener.enterDataType(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDataType" ):
+                listener.exitDataType(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDataType" ):
+                return visitor.visitDataType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dataType(self):
+
+        localctx = MiniMLParser.DataTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_dataType)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 63
+            self.match(MiniMLParser.T__0)
+            self.state = 64
+            self.match(MiniMLParser.Ident)
+            self.state = 65
+            self.match(MiniMLParser.T__1)
+            self.state = 69
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==4:
+                self.state = 66
+                self.dataTypeArm()
+                self.state = 71
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 72
+            self.match(MiniMLParser.T__2)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DataTypeArmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+
+        def ty(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.TyContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.TyContext,i)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_dataTypeArm
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDataTypeArm" ):
+                listener.enterDataTypeArm(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDataTypeArm" ):
+                listener.exitDataTypeArm(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDataTypeArm" ):
+                return visitor.visitDataTypeArm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dataTypeArm(self):
+
+        localctx = MiniMLParser.DataTypeArmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_dataTypeArm)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 74
+            self.match(MiniMLParser.T__3)
+            self.state = 75
+            self.match(MiniMLParser.Ident)
+            self.state = 77 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 76
+                self.ty(0)
+                self.state = 79 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 2199224598528) != 0)):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def let(self):
+            return self.getTypedRuleContext(MiniMLParser.LetContext,0)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_expr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExpr" ):
+                listener.enterExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExpr" ):
+                listener.exitExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr" ):
+                return visitor.visitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr(self):
+
+        localctx = MiniMLParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_expr)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 81
+            self.let()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LetContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_let
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class Let1Context(LetContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LetContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(MiniMLParser.ExprContext,0)
+
+        def letRecArm(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.LetRecArmContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.LetRecArmContext,i)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLet1" ):
+                listener.enterLet1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLet1" ):
+                listener.exitLet1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLet1" ):
+                return visitor.visitLet1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Let2Context(LetContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LetContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.ExprContext,i)
+
+        def ty(self):
+            return self.getTypedRuleContext(MiniMLParser.TyContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLet2" ):
+                listener.enterLet2(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLet2" ):
+                listener.exitLet2(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLet2" ):
+                return visitor.visitLet2(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Let_Context(LetContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LetContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def mat(self):
+            return self.getTypedRuleContext(MiniMLParser.MatContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLet_" ):
+                listener.enterLet_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLet_" ):
+                listener.exitLet_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLet_" ):
+                return visitor.visitLet_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def let(self):
+
+        localctx = MiniMLParser.LetContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_let)
+        self._la = 0 # Token type
+        try:
+            self.state = 107
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [10, 12, 14, 17, 20, 21, 22, 23, 24, 25, 32, 39, 41]:
+                localctx = MiniMLParser.Let_Context(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 83
+                self.mat()
+                pass
+            elif token in [5]:
+                localctx = MiniMLParser.Let1Context(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 84
+                self.match(MiniMLParser.T__4)
+
+                self.state = 85
+                self.letRecArm()
+                self.state = 90
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==6:
+                    self.state = 86
+                    self.match(MiniMLParser.T__5)
+                    self.state = 87
+                    self.letRecArm()
+                    self.state = 92
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 93
+                self.match(MiniMLParser.T__6)
+                self.state = 94
+                self.expr()
+                pass
+            elif token in [8]:
+                localctx = MiniMLParser.Let2Context(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 96
+                self.match(MiniMLParser.T__7)
+                self.state = 97
+                self.match(MiniMLParser.Ident)
+                self.state = 100
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==9:
+                    self.state = 98
+                    self.match(MiniMLParser.T__8)
+                    self.state = 99
+                    self.ty(0)
+
+
+                self.state = 102
+                self.match(MiniMLParser.T__1)
+                self.state = 103
+                self.expr()
+                self.state = 104
+                self.match(MiniMLParser.T__6)
+                self.state = 105
+                self.expr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LetRecArmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.t1 = None # TyContext
+            self.t2 = None # TyContext
+
+        def Ident(self, i:int=None):
+            if i is None:
+                return self.getTokens(MiniMLParser.Ident)
+            else:
+                return self.getToken(MiniMLParser.Ident, i)
+
+        def expr(self):
+            return self.getTypedRuleContext(MiniMLParser.ExprContext,0)
+
+
+        def ty(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.TyContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.TyContext,i)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_letRecArm
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLetRecArm" ):
+                listener.enterLetRecArm(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLetRecArm" ):
+                listener.exitLetRecArm(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLetRecArm" ):
+                return visitor.visitLetRecArm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def letRecArm(self):
+
+        localctx = MiniMLParser.LetRecArmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_letRecArm)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 109
+            self.match(MiniMLParser.Ident)
+            self.state = 112
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==9:
+                self.state = 110
+                self.match(MiniMLParser.T__8)
+                self.state = 111
+                localctx.t1 = self.ty(0)
+
+
+            self.state = 114
+            self.match(MiniMLParser.T__1)
+            self.state = 115
+            self.match(MiniMLParser.T__9)
+            self.state = 116
+            self.match(MiniMLParser.Ident)
+            self.state = 119
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==9:
+                self.state = 117
+                self.match(MiniMLParser.T__8)
+                self.state = 118
+                localctx.t2 = self.ty(0)
+
+
+            self.state = 121
+            self.match(MiniMLParser.T__10)
+            self.state = 122
+            self.expr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MatContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_mat
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class Mat1Context(MatContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.MatContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(MiniMLParser.ExprContext,0)
+
+        def matchArm(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.MatchArmContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.MatchArmContext,i)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMat1" ):
+                listener.enterMat1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMat1" ):
+                listener.exitMat1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMat1" ):
+                return visitor.visitMat1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Mat_Context(MatContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.MatContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def lam(self):
+            return self.getTypedRuleContext(MiniMLParser.LamContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMat_" ):
+                listener.enterMat_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMat_" ):
+                listener.exitMat_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMat_" ):
+                return visitor.visitMat_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def mat(self):
+
+        localctx = MiniMLParser.MatContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_mat)
+        self._la = 0 # Token type
+        try:
+            self.state = 134
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [10, 14, 17, 20, 21, 22, 23, 24, 25, 32, 39, 41]:
+                localctx = MiniMLParser.Mat_Context(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 124
+                self.lam()
+                pass
+            elif token in [12]:
+                localctx = MiniMLParser.Mat1Context(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 125
+                self.match(MiniMLParser.T__11)
+                self.state = 126
+                self.expr()
+                self.state = 128 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 127
+                    self.matchArm()
+                    self.state = 130 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==4):
+                        break
+
+                self.state = 132
+                self.match(MiniMLParser.T__2)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MatchArmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.body = None # ExprContext
+
+        def ptn(self):
+            return self.getTypedRuleContext(MiniMLParser.PtnContext,0)
+
+
+        def expr(self):
+            return self.getTypedRuleContext(MiniMLParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_matchArm
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMatchArm" ):
+                listener.enterMatchArm(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMatchArm" ):
+                listener.exitMatchArm(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMatchArm" ):
+                return visitor.visitMatchArm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def matchArm(self):
+
+        localctx = MiniMLParser.MatchArmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_matchArm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 136
+            self.match(MiniMLParser.T__3)
+            self.state = 137
+            self.ptn()
+            self.state = 138
+            self.match(MiniMLParser.T__10)
+            self.state = 139
+            localctx.body = self.expr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PtnContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ptn1(self):
+            return self.getTypedRuleContext(MiniMLParser.Ptn1Context,0)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_ptn
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPtn" ):
+                listener.enterPtn(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPtn" ):
+                listener.exitPtn(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPtn" ):
+                return visitor.visitPtn(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ptn(self):
+
+        localctx = MiniMLParser.PtnContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_ptn)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 141
+            self.ptn1()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Ptn1Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_ptn1
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class Ptn1_Context(Ptn1Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.Ptn1Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ptn0(self):
+            return self.getTypedRuleContext(MiniMLParser.Ptn0Context,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPtn1_" ):
+                listener.enterPtn1_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPtn1_" ):
+                listener.exitPtn1_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPtn1_" ):
+                return visitor.visitPtn1_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class PtnTupleContext(Ptn1Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.Ptn1Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ptn0(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.Ptn0Context)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.Ptn0Context,i)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPtnTuple" ):
+                listener.enterPtnTuple(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPtnTuple" ):
+                listener.exitPtnTuple(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPtnTuple" ):
+                return visitor.visitPtnTuple(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class PtnDataContext(Ptn1Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.Ptn1Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+        def ptn0(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.Ptn0Context)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.Ptn0Context,i)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPtnData" ):
+                listener.enterPtnData(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPtnData" ):
+                listener.exitPtnData(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPtnData" ):
+                return visitor.visitPtnData(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def ptn1(self):
+
+        localctx = MiniMLParser.Ptn1Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_ptn1)
+        self._la = 0 # Token type
+        try:
+            self.state = 157
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,12,self._ctx)
+            if la_ == 1:
+                localctx = MiniMLParser.Ptn1_Context(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 143
+                self.ptn0()
+                pass
+
+            elif la_ == 2:
+                localctx = MiniMLParser.PtnTupleContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 144
+                self.ptn0()
+                self.state = 147 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 145
+                    self.match(MiniMLParser.T__12)
+                    self.state = 146
+                    self.ptn0()
+                    self.state = 149 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==13):
+                        break
+
+                pass
+
+            elif la_ == 3:
+                localctx = MiniMLParser.PtnDataContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 151
+                self.match(MiniMLParser.Ident)
+                self.state = 153 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 152
+                    self.ptn0()
+                    self.state = 155 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 2748829417472) != 0)):
+                        break
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Ptn0Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_ptn0
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class PtnParenContext(Ptn0Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.Ptn0Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ptn(self):
+            return self.getTypedRuleContext(MiniMLParser.PtnContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPtnParen" ):
+                listener.enterPtnParen(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPtnParen" ):
+                listener.exitPtnParen(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPtnParen" ):
+                return visitor.visitPtnParen(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class PtnBinderContext(Ptn0Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.Ptn0Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPtnBinder" ):
+                listener.enterPtnBinder(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPtnBinder" ):
+                listener.exitPtnBinder(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPtnBinder" ):
+                return visitor.visitPtnBinder(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class PtnLitContext(Ptn0Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.Ptn0Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def lit(self):
+            return self.getTypedRuleContext(MiniMLParser.LitContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPtnLit" ):
+                listener.enterPtnLit(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPtnLit" ):
+                listener.exitPtnLit(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPtnLit" ):
+                return visitor.visitPtnLit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def ptn0(self):
+
+        localctx = MiniMLParser.Ptn0Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_ptn0)
+        try:
+            self.state = 165
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,13,self._ctx)
+            if la_ == 1:
+                localctx = MiniMLParser.PtnBinderContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 159
+                self.match(MiniMLParser.Ident)
+                pass
+
+            elif la_ == 2:
+                localctx = MiniMLParser.PtnLitContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 160
+                self.lit()
+                pass
+
+            elif la_ == 3:
+                localctx = MiniMLParser.PtnParenContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 161
+                self.match(MiniMLParser.T__13)
+                self.state = 162
+                self.ptn()
+                self.state = 163
+                self.match(MiniMLParser.T__14)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LamContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_lam
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class Lam_Context(LamContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LamContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def seq(self):
+            return self.getTypedRuleContext(MiniMLParser.SeqContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLam_" ):
+                listener.enterLam_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLam_" ):
+                listener.exitLam_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLam_" ):
+                return visitor.visitLam_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Lam1Context(LamContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LamContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+        def expr(self):
+            return self.getTypedRuleContext(MiniMLParser.ExprContext,0)
+
+        def ty(self):
+            return self.getTypedRuleContext(MiniMLParser.TyContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLam1" ):
+                listener.enterLam1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLam1" ):
+                listener.exitLam1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLam1" ):
+                return visitor.visitLam1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def lam(self):
+
+        localctx = MiniMLParser.LamContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_lam)
+        self._la = 0 # Token type
+        try:
+            self.state = 176
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [14, 17, 20, 21, 22, 23, 24, 25, 32, 39, 41]:
+                localctx = MiniMLParser.Lam_Context(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 167
+                self.seq()
+                pass
+            elif token in [10]:
+                localctx = MiniMLParser.Lam1Context(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 168
+                self.match(MiniMLParser.T__9)
+                self.state = 169
+                self.match(MiniMLParser.Ident)
+                self.state = 172
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==9:
+                    self.state = 170
+                    self.match(MiniMLParser.T__8)
+                    self.state = 171
+                    self.ty(0)
+
+
+                self.state = 174
+                self.match(MiniMLParser.T__10)
+                self.state = 175
+                self.expr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SeqContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ite(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.IteContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.IteContext,i)
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_seq
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSeq" ):
+                listener.enterSeq(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSeq" ):
+                listener.exitSeq(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSeq" ):
+                return visitor.visitSeq(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def seq(self):
+
+        localctx = MiniMLParser.SeqContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_seq)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 178
+            self.ite()
+            self.state = 183
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==16:
+                self.state = 179
+                self.match(MiniMLParser.T__15)
+                self.state = 180
+                self.ite()
+                self.state = 185
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IteContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_ite
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class Ite_Context(IteContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.IteContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def rel(self):
+            return self.getTypedRuleContext(MiniMLParser.RelContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIte_" ):
+                listener.enterIte_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIte_" ):
+                listener.exitIte_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIte_" ):
+                return visitor.visitIte_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Ite1Context(IteContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.IteContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def rel(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.RelContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.RelContext,i)
+
+        def ite(self):
+            return self.getTypedRuleContext(MiniMLParser.IteContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIte1" ):
+                listener.enterIte1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIte1" ):
+                listener.exitIte1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIte1" ):
+                return visitor.visitIte1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def ite(self):
+
+        localctx = MiniMLParser.IteContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_ite)
+        try:
+            self.state = 194
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [14, 20, 21, 22, 23, 24, 25, 32, 39, 41]:
+                localctx = MiniMLParser.Ite_Context(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 186
+                self.rel(0)
+                pass
+            elif token in [17]:
+                localctx = MiniMLParser.Ite1Context(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 187
+                self.match(MiniMLParser.T__16)
+                self.state = 188
+                self.rel(0)
+                self.state = 189
+                self.match(MiniMLParser.T__17)
+                self.state = 190
+                self.rel(0)
+                self.state = 191
+                self.match(MiniMLParser.T__18)
+                self.state = 192
+                self.ite()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RelContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_rel
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class Rel_Context(RelContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.RelContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def add(self):
+            return self.getTypedRuleContext(MiniMLParser.AddContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRel_" ):
+                listener.enterRel_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRel_" ):
+                listener.exitRel_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRel_" ):
+                return visitor.visitRel_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Rel1Context(RelContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.RelContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def rel(self):
+            return self.getTypedRuleContext(MiniMLParser.RelContext,0)
+
+        def relOp(self):
+            return self.getTypedRuleContext(MiniMLParser.RelOpContext,0)
+
+        def add(self):
+            return self.getTypedRuleContext(MiniMLParser.AddContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRel1" ):
+                listener.enterRel1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRel1" ):
+                listener.exitRel1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRel1" ):
+                return visitor.visitRel1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def rel(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = MiniMLParser.RelContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 28
+        self.enterRecursionRule(localctx, 28, self.RULE_rel, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx = MiniMLParser.Rel_Context(self, localctx)
+            self._ctx = localctx
+            _prevctx = localctx
+
+            self.state = 197
+            self.add(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 205
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,18,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = MiniMLParser.Rel1Context(self, MiniMLParser.RelContext(self, _parentctx, _parentState))
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_rel)
+                    self.state = 199
+                    if not self.precpred(self._ctx, 1):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                    self.state = 200
+                    self.relOp()
+                    self.state = 201
+                    self.add(0) 
+                self.state = 207
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,18,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class AddContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_add
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class Add_Context(AddContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AddContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def mul(self):
+            return self.getTypedRuleContext(MiniMLParser.MulContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAdd_" ):
+                listener.enterAdd_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAdd_" ):
+                listener.exitAdd_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAdd_" ):
+                return visitor.visitAdd_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Add1Context(AddContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AddContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def add(self):
+            return self.getTypedRuleContext(MiniMLParser.AddContext,0)
+
+        def addOp(self):
+            return self.getTypedRuleContext(MiniMLParser.AddOpContext,0)
+
+        def mul(self):
+            return self.getTypedRuleContext(MiniMLParser.MulContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAdd1" ):
+                listener.enterAdd1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAdd1" ):
+                listener.exitAdd1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAdd1" ):
+                return visitor.visitAdd1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def add(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = MiniMLParser.AddContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 30
+        self.enterRecursionRule(localctx, 30, self.RULE_add, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx = MiniMLParser.Add_Context(self, localctx)
+            self._ctx = localctx
+            _prevctx = localctx
+
+            self.state = 209
+            self.mul(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 217
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,19,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = MiniMLParser.Add1Context(self, MiniMLParser.AddContext(self, _parentctx, _parentState))
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_add)
+                    self.state = 211
+                    if not self.precpred(self._ctx, 1):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                    self.state = 212
+                    self.addOp()
+                    self.state = 213
+                    self.mul(0) 
+                self.state = 219
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,19,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class MulContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_mul
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class Mul_Context(MulContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.MulContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def una(self):
+            return self.getTypedRuleContext(MiniMLParser.UnaContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMul_" ):
+                listener.enterMul_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMul_" ):
+                listener.exitMul_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMul_" ):
+                return visitor.visitMul_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Mul1Context(MulContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.MulContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def mul(self):
+            return self.getTypedRuleContext(MiniMLParser.MulContext,0)
+
+        def mulOp(self):
+            return self.getTypedRuleContext(MiniMLParser.MulOpContext,0)
+
+        def una(self):
+            return self.getTypedRuleContext(MiniMLParser.UnaContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMul1" ):
+                listener.enterMul1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMul1" ):
+                listener.exitMul1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMul1" ):
+                return visitor.visitMul1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def mul(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = MiniMLParser.MulContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 32
+        self.enterRecursionRule(localctx, 32, self.RULE_mul, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx = MiniMLParser.Mul_Context(self, localctx)
+            self._ctx = localctx
+            _prevctx = localctx
+
+            self.state = 221
+            self.una()
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 229
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,20,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = MiniMLParser.Mul1Context(self, MiniMLParser.MulContext(self, _parentctx, _parentState))
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_mul)
+                    self.state = 223
+                    if not self.precpred(self._ctx, 1):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                    self.state = 224
+                    self.mulOp()
+                    self.state = 225
+                    self.una() 
+                self.state = 231
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,20,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class UnaContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_una
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class Una_Context(UnaContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.UnaContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def app(self):
+            return self.getTypedRuleContext(MiniMLParser.AppContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterUna_" ):
+                listener.enterUna_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitUna_" ):
+                listener.exitUna_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUna_" ):
+                return visitor.visitUna_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class Una1Context(UnaContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.UnaContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def unaOp(self):
+            return self.getTypedRuleContext(MiniMLParser.UnaOpContext,0)
+
+        def una(self):
+            return self.getTypedRuleContext(MiniMLParser.UnaContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterUna1" ):
+                listener.enterUna1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitUna1" ):
+                listener.exitUna1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUna1" ):
+                return visitor.visitUna1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def una(self):
+
+        localctx = MiniMLParser.UnaContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_una)
+        try:
+            self.state = 236
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [14, 20, 21, 22, 23, 24, 25, 39, 41]:
+                localctx = MiniMLParser.Una_Context(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 232
+                self.app(0)
+                pass
+            elif token in [32]:
+                localctx = MiniMLParser.Una1Context(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 233
+                self.unaOp()
+                self.state = 234
+                self.una()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AppContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_app
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class App_Context(AppContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AppContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def atom(self):
+            return self.getTypedRuleContext(MiniMLParser.AtomContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterApp_" ):
+                listener.enterApp_(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitApp_" ):
+                listener.exitApp_(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitApp_" ):
+                return visitor.visitApp_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class App1Context(AppContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AppContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def app(self):
+            return self.getTypedRuleContext(MiniMLParser.AppContext,0)
+
+        def atom(self):
+            return self.getTypedRuleContext(MiniMLParser.AtomContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterApp1" ):
+                listener.enterApp1(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitApp1" ):
+                listener.exitApp1(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitApp1" ):
+                return visitor.visitApp1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def app(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = MiniMLParser.AppContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 36
+        self.enterRecursionRule(localctx, 36, self.RULE_app, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx = MiniMLParser.App_Context(self, localctx)
+            self._ctx = localctx
+            _prevctx = localctx
+
+            self.state = 239
+            self.atom()
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 245
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = MiniMLParser.App1Context(self, MiniMLParser.AppContext(self, _parentctx, _parentState))
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_app)
+                    self.state = 241
+                    if not self.precpred(self._ctx, 1):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                    self.state = 242
+                    self.atom() 
+                self.state = 247
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class AtomContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_atom
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class AtomIdentContext(AtomContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AtomContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAtomIdent" ):
+                listener.enterAtomIdent(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAtomIdent" ):
+                listener.exitAtomIdent(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtomIdent" ):
+                return visitor.visitAtomIdent(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AtomBuiltinContext(AtomContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AtomContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def builtin(self):
+            return self.getTypedRuleContext(MiniMLParser.BuiltinContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAtomBuiltin" ):
+                listener.enterAtomBuiltin(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAtomBuiltin" ):
+                listener.exitAtomBuiltin(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtomBuiltin" ):
+                return visitor.visitAtomBuiltin(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AtomParenContext(AtomContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AtomContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(MiniMLParser.ExprContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAtomParen" ):
+                listener.enterAtomParen(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAtomParen" ):
+                listener.exitAtomParen(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtomParen" ):
+                return visitor.visitAtomParen(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AtomTupleContext(AtomContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AtomContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.ExprContext,i)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAtomTuple" ):
+                listener.enterAtomTuple(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAtomTuple" ):
+                listener.exitAtomTuple(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtomTuple" ):
+                return visitor.visitAtomTuple(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AtomLitContext(AtomContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AtomContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def lit(self):
+            return self.getTypedRuleContext(MiniMLParser.LitContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAtomLit" ):
+                listener.enterAtomLit(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAtomLit" ):
+                listener.exitAtomLit(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtomLit" ):
+                return visitor.visitAtomLit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AtomNthContext(AtomContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.AtomContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Integer(self):
+            return self.getToken(MiniMLParser.Integer, 0)
+        def atom(self):
+            return self.getTypedRuleContext(MiniMLParser.AtomContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAtomNth" ):
+                listener.enterAtomNth(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAtomNth" ):
+                listener.exitAtomNth(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtomNth" ):
+                return visitor.visitAtomNth(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def atom(self):
+
+        localctx = MiniMLParser.AtomContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_atom)
+        self._la = 0 # Token type
+        try:
+            self.state = 268
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
+            if la_ == 1:
+                localctx = MiniMLParser.AtomTupleContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 248
+                self.match(MiniMLParser.T__13)
+                self.state = 249
+                self.expr()
+                self.state = 252 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 250
+                    self.match(MiniMLParser.T__12)
+                    self.state = 251
+                    self.expr()
+                    self.state = 254 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not (_la==13):
+                        break
+
+                self.state = 256
+                self.match(MiniMLParser.T__14)
+                pass
+
+            elif la_ == 2:
+                localctx = MiniMLParser.AtomLitContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 258
+                self.lit()
+                pass
+
+            elif la_ == 3:
+                localctx = MiniMLParser.AtomIdentContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 259
+                self.match(MiniMLParser.Ident)
+                pass
+
+            elif la_ == 4:
+                localctx = MiniMLParser.AtomParenContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 260
+                self.match(MiniMLParser.T__13)
+                self.state = 261
+                self.expr()
+                self.state = 262
+                self.match(MiniMLParser.T__14)
+                pass
+
+            elif la_ == 5:
+                localctx = MiniMLParser.AtomBuiltinContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 264
+                self.builtin()
+                pass
+
+            elif la_ == 6:
+                localctx = MiniMLParser.AtomNthContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
+                self.state = 265
+                self.match(MiniMLParser.T__19)
+                self.state = 266
+                self.match(MiniMLParser.Integer)
+                self.state = 267
+                self.atom()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BuiltinContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_builtin
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBuiltin" ):
+                listener.enterBuiltin(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBuiltin" ):
+                listener.exitBuiltin(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBuiltin" ):
+                return visitor.visitBuiltin(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def builtin(self):
+
+        localctx = MiniMLParser.BuiltinContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_builtin)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 270
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 14680064) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_lit
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class LitIntContext(LitContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LitContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Integer(self):
+            return self.getToken(MiniMLParser.Integer, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLitInt" ):
+                listener.enterLitInt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLitInt" ):
+                listener.exitLitInt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLitInt" ):
+                return visitor.visitLitInt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LitBoolContext(LitContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LitContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLitBool" ):
+                listener.enterLitBool(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLitBool" ):
+                listener.exitLitBool(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLitBool" ):
+                return visitor.visitLitBool(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LitUnitContext(LitContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.LitContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLitUnit" ):
+                listener.enterLitUnit(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLitUnit" ):
+                listener.exitLitUnit(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLitUnit" ):
+                return visitor.visitLitUnit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def lit(self):
+
+        localctx = MiniMLParser.LitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_lit)
+        self._la = 0 # Token type
+        try:
+            self.state = 276
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [39]:
+                localctx = MiniMLParser.LitIntContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 272
+                self.match(MiniMLParser.Integer)
+                pass
+            elif token in [14]:
+                localctx = MiniMLParser.LitUnitContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 273
+                self.match(MiniMLParser.T__13)
+                self.state = 274
+                self.match(MiniMLParser.T__14)
+                pass
+            elif token in [24, 25]:
+                localctx = MiniMLParser.LitBoolContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 275
+                _la = self._input.LA(1)
+                if not(_la==24 or _la==25):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TyContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_ty
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class TyIntContext(TyContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.TyContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTyInt" ):
+                listener.enterTyInt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTyInt" ):
+                listener.exitTyInt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTyInt" ):
+                return visitor.visitTyInt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class TyArrowContext(TyContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.TyContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ty(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MiniMLParser.TyContext)
+            else:
+                return self.getTypedRuleContext(MiniMLParser.TyContext,i)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTyArrow" ):
+                listener.enterTyArrow(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTyArrow" ):
+                listener.exitTyArrow(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTyArrow" ):
+                return visitor.visitTyArrow(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class TyParenContext(TyContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.TyContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ty(self):
+            return self.getTypedRuleContext(MiniMLParser.TyContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTyParen" ):
+                listener.enterTyParen(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTyParen" ):
+                listener.exitTyParen(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTyParen" ):
+                return visitor.visitTyParen(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class TyUnitContext(TyContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.TyContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTyUnit" ):
+                listener.enterTyUnit(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTyUnit" ):
+                listener.exitTyUnit(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTyUnit" ):
+                return visitor.visitTyUnit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class TyIdentContext(TyContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MiniMLParser.TyContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Ident(self):
+            return self.getToken(MiniMLParser.Ident, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTyIdent" ):
+                listener.enterTyIdent(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTyIdent" ):
+                listener.exitTyIdent(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTyIdent" ):
+                return visitor.visitTyIdent(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def ty(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = MiniMLParser.TyContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 44
+        self.enterRecursionRule(localctx, 44, self.RULE_ty, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 286
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [26]:
+                localctx = MiniMLParser.TyUnitContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 279
+                self.match(MiniMLParser.T__25)
+                pass
+            elif token in [27]:
+                localctx = MiniMLParser.TyIntContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 280
+                self.match(MiniMLParser.T__26)
+                pass
+            elif token in [14]:
+                localctx = MiniMLParser.TyParenContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 281
+                self.match(MiniMLParser.T__13)
+                self.state = 282
+                self.ty(0)
+                self.state = 283
+                self.match(MiniMLParser.T__14)
+                pass
+            elif token in [41]:
+                localctx = MiniMLParser.TyIdentContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 285
+                self.match(MiniMLParser.Ident)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 293
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = MiniMLParser.TyArrowContext(self, MiniMLParser.TyContext(self, _parentctx, _parentState))
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_ty)
+                    self.state = 288
+                    if not self.precpred(self._ctx, 1):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                    self.state = 289
+                    self.match(MiniMLParser.T__10)
+                    self.state = 290
+                    self.ty(1) 
+                self.state = 295
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class MulOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_mulOp
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMulOp" ):
+                listener.enterMulOp(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMulOp" ):
+                listener.exitMulOp(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMulOp" ):
+                return visitor.visitMulOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def mulOp(self):
+
+        localctx = MiniMLParser.MulOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_mulOp)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 296
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1879048192) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AddOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_addOp
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAddOp" ):
+                listener.enterAddOp(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAddOp" ):
+                listener.exitAddOp(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAddOp" ):
+                return visitor.visitAddOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def addOp(self):
+
+        localctx = MiniMLParser.AddOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_addOp)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 298
+            _la = self._input.LA(1)
+            if not(_la==31 or _la==32):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RelOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_relOp
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRelOp" ):
+                listener.enterRelOp(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRelOp" ):
+                listener.exitRelOp(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelOp" ):
+                return visitor.visitRelOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def relOp(self):
+
+        localctx = MiniMLParser.RelOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_relOp)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 300
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 541165879296) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class UnaOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return MiniMLParser.RULE_unaOp
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterUnaOp" ):
+                listener.enterUnaOp(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitUnaOp" ):
+                listener.exitUnaOp(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUnaOp" ):
+                return visitor.visitUnaOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unaOp(self):
+
+        localctx = MiniMLParser.UnaOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_unaOp)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 302
+            self.match(MiniMLParser.T__31)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[14] = self.rel_sempred
+        self._predicates[15] = self.add_sempred
+        self._predicates[16] = self.mul_sempred
+        self._predicates[18] = self.app_sempred
+        self._predicates[22] = self.ty_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def rel_sempred(self, localctx:RelContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 1)
+         
+
+    def add_sempred(self, localctx:AddContext, predIndex:int):
+            if predIndex == 1:
+                return self.precpred(self._ctx, 1)
+         
+
+    def mul_sempred(self, localctx:MulContext, predIndex:int):
+            if predIndex == 2:
+                return self.precpred(self._ctx, 1)
+         
+
+    def app_sempred(self, localctx:AppContext, predIndex:int):
+            if predIndex == 3:
+                return self.precpred(self._ctx, 1)
+         
+
+    def ty_sempred(self, localctx:TyContext, predIndex:int):
+            if predIndex == 4:
+                return self.precpred(self._ctx, 1)
+         
+
+
+
+
@@ -0,0 +1,273 @@
+# Generated from MiniML.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .MiniMLParser import MiniMLParser
+else:
+    from MiniMLParser import MiniMLParser
+
+# This class defines a complete generic visitor for a parse tree produced by MiniMLParser.
+
+class MiniMLVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by MiniMLParser#top.
+    def visitTop(self, ctx:MiniMLParser.TopContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#dataType.
+    def visitDataType(self, ctx:MiniMLParser.DataTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#dataTypeArm.
+    def visitDataTypeArm(self, ctx:MiniMLParser.DataTypeArmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#expr.
+    def visitExpr(self, ctx:MiniMLParser.ExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#let_.
+    def visitLet_(self, ctx:MiniMLParser.Let_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#let1.
+    def visitLet1(self, ctx:MiniMLParser.Let1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#let2.
+    def visitLet2(self, ctx:MiniMLParser.Let2Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#letRecArm.
+    def visitLetRecArm(self, ctx:MiniMLParser.LetRecArmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#mat_.
+    def visitMat_(self, ctx:MiniMLParser.Mat_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#mat1.
+    def visitMat1(self, ctx:MiniMLParser.Mat1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#matchArm.
+    def visitMatchArm(self, ctx:MiniMLParser.MatchArmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ptn.
+    def visitPtn(self, ctx:MiniMLParser.PtnContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ptn1_.
+    def visitPtn1_(self, ctx:MiniMLParser.Ptn1_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ptnTuple.
+    def visitPtnTuple(self, ctx:MiniMLParser.PtnTupleContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ptnData.
+    def visitPtnData(self, ctx:MiniMLParser.PtnDataContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ptnBinder.
+    def visitPtnBinder(self, ctx:MiniMLParser.PtnBinderContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ptnLit.
+    def visitPtnLit(self, ctx:MiniMLParser.PtnLitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ptnParen.
+    def visitPtnParen(self, ctx:MiniMLParser.PtnParenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#lam_.
+    def visitLam_(self, ctx:MiniMLParser.Lam_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#lam1.
+    def visitLam1(self, ctx:MiniMLParser.Lam1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#seq.
+    def visitSeq(self, ctx:MiniMLParser.SeqContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ite_.
+    def visitIte_(self, ctx:MiniMLParser.Ite_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#ite1.
+    def visitIte1(self, ctx:MiniMLParser.Ite1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#rel_.
+    def visitRel_(self, ctx:MiniMLParser.Rel_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#rel1.
+    def visitRel1(self, ctx:MiniMLParser.Rel1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#add_.
+    def visitAdd_(self, ctx:MiniMLParser.Add_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#add1.
+    def visitAdd1(self, ctx:MiniMLParser.Add1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#mul_.
+    def visitMul_(self, ctx:MiniMLParser.Mul_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#mul1.
+    def visitMul1(self, ctx:MiniMLParser.Mul1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#una_.
+    def visitUna_(self, ctx:MiniMLParser.Una_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#una1.
+    def visitUna1(self, ctx:MiniMLParser.Una1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#app_.
+    def visitApp_(self, ctx:MiniMLParser.App_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#app1.
+    def visitApp1(self, ctx:MiniMLParser.App1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#atomTuple.
+    def visitAtomTuple(self, ctx:MiniMLParser.AtomTupleContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#atomLit.
+    def visitAtomLit(self, ctx:MiniMLParser.AtomLitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#atomIdent.
+    def visitAtomIdent(self, ctx:MiniMLParser.AtomIdentContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#atomParen.
+    def visitAtomParen(self, ctx:MiniMLParser.AtomParenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#atomBuiltin.
+    def visitAtomBuiltin(self, ctx:MiniMLParser.AtomBuiltinContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#atomNth.
+    def visitAtomNth(self, ctx:MiniMLParser.AtomNthContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#builtin.
+    def visitBuiltin(self, ctx:MiniMLParser.BuiltinContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#litInt.
+    def visitLitInt(self, ctx:MiniMLParser.LitIntContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#litUnit.
+    def visitLitUnit(self, ctx:MiniMLParser.LitUnitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#litBool.
+    def visitLitBool(self, ctx:MiniMLParser.LitBoolContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#tyInt.
+    def visitTyInt(self, ctx:MiniMLParser.TyIntContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#tyArrow.
+    def visitTyArrow(self, ctx:MiniMLParser.TyArrowContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#tyParen.
+    def visitTyParen(self, ctx:MiniMLParser.TyParenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#tyUnit.
+    def visitTyUnit(self, ctx:MiniMLParser.TyUnitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#tyIdent.
+    def visitTyIdent(self, ctx:MiniMLParser.TyIdentContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#mulOp.
+    def visitMulOp(self, ctx:MiniMLParser.MulOpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#addOp.
+    def visitAddOp(self, ctx:MiniMLParser.AddOpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#relOp.
+    def visitRelOp(self, ctx:MiniMLParser.RelOpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MiniMLParser#unaOp.
+    def visitUnaOp(self, ctx:MiniMLParser.UnaOpContext):
+        return self.visitChildren(ctx)
+
+
+
+del MiniMLParser
\ No newline at end of file
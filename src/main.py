@@ -1,27 +1,51 @@
+"""
+The driver. Stages import what they need when they run: start-up (e.g. for
+`-h` or `-s lex`) does not load antlr or the passes it does not reach.
+"""
+import os
 import sys
+import time
 import argparse
-from antlr4 import *
+from contextlib import nullcontext
+from itertools import repeat
 
-from .utils import *
-from .generated.MiniMLLexer import MiniMLLexer
-from .generated.MiniMLParser import MiniMLParser
-from .frontend import *
-from .utils import *
+from .debug import DEBUG
+from .utils import MiniMLError
+
+
+def timed(stats, phase):
+    return stats.timed(phase) if stats is not None else nullcontext()
 
 
 def printAst(ast):
     if args.format == 'lisp':
-        print(LISPStylePrintVisitor()(ast), file=args.outfile)
+        from .frontend import LISPStylePrintVisitor
+        printer = LISPStylePrintVisitor()
     elif args.format == 'indent':
-        print(IndentedPrintVisitor()(ast), file=args.outfile)
+        from .frontend import IndentedPrintVisitor
+        printer = IndentedPrintVisitor()
     elif args.format == 'code':
-        print(FormattedPrintVisitor()(ast), file=args.outfile)
+        from .frontend import FormattedPrintVisitor
+        printer = FormattedPrintVisitor()
+    print(passes.run('print', printer, ast), file=args.outfile)
+
+
+class StopCompilation(Exception):
+    """
+    Ends compiling the current file early, e.g. after printing a debug stage.
+    """
+    def __init__(self, code=0):
+        self.code = code
+
+
+def exitStage():
+    raise StopCompilation(0)
 
 
 def doParseArgs(argv):
     parser = argparse.ArgumentParser(description='MiniML compiler')
     parser.add_argument(
-            'infile', type=str,
+            'infile', type=str, nargs='?',
             help='input file')
     parser.add_argument(
             'outfile', default=sys.stdout, type=argparse.FileType('w'), nargs='?',
@@ -30,110 +54,373 @@ def doParseArgs(argv):
             '-f', '--format', choices={'lisp', 'indent', 'code'}, default='lisp',
             help='AST print format')
     parser.add_argument(
-            '-s', '--stage', type=str, choices={'cst', 'lex', 'ast', 'name', 'secd', 'c', 'patmat', 'debrujin', 'type'},
+            '-s', '--stage', type=str, choices={'cst', 'lex', 'ast', 'name', 'secd', 'c', 'patmat', 'datarepr', 'debrujin', 'type', 'flat'},
             default='secd',
             help='[Debug] print debug info for that stage')
     parser.add_argument(
             '-bt', '--backtrace', action='store_true',
             help='[Debug] print backtrace within compiler on any error')
-    args = parser.parse_args()
+    parser.add_argument(
+            '--typer', choices={'batch', 'online'}, default='batch',
+            help='type inference engine: solve all constraints at once, or unify them on the fly')
+    parser.add_argument(
+            '--backend', choices={'tree', 'flat'}, default='tree',
+            help='run de Bruijn conversion and SECD generation on the AST, or on the flat IR')
+    parser.add_argument(
+            '--typer-stats', type=argparse.FileType('w'), metavar='FILE',
+            help='[Debug] write typer statistics to FILE as JSON')
+    parser.add_argument(
+            '--typer-cache', metavar='FILE',
+            help='reuse schemata of closed let definitions typed before, kept in FILE')
+    parser.add_argument(
+            '--stage-cache', metavar='DIR',
+            help='cache the AST after namer, typer and debrujin in DIR, and resume from there for unchanged sources. '
+                 'Entries are pickles, checked against corruption but not forgery: DIR must be writable only by trusted users')
+    parser.add_argument(
+            '--pass-times', type=argparse.FileType('w'), metavar='FILE',
+            help='[Debug] write wall times of the AST passes to FILE as JSON')
+    parser.add_argument(
+            '--batch', nargs='+', metavar='INFILE',
+            help='compile all INFILEs in one process, each into --outdir (default: next to it)')
+    parser.add_argument(
+            '--manifest', metavar='FILE',
+            help='compile in batch the inputs listed in FILE, one `INFILE [OUTFILE]` per line')
+    parser.add_argument(
+            '--outdir', metavar='DIR',
+            help='directory of batch outputs')
+    parser.add_argument(
+            '-j', '--jobs', type=int, default=1, metavar='N',
+            help='compile batch inputs in N worker processes')
+    parser.add_argument(
+            '--serve', metavar='SOCKET',
+            help='run a compile server on the Unix socket SOCKET, for `miniml` run with MINIML_SERVER=SOCKET')
+    args = parser.parse_args(argv[1:])
+    if args.serve:
+        if args.infile is not None or args.batch or args.manifest:
+            parser.error('--serve takes no inputs')
+    elif args.batch or args.manifest:
+        if args.infile is not None:
+            parser.error('infile and outfile cannot be given in batch mode')
+        if args.typer_stats:
+            parser.error('--typer-stats is not supported in batch mode')
+    elif args.infile is None:
+        parser.error('the following arguments are required: infile')
     return args
 
 
 def doLex(inputStream):
+    from antlr4 import CommonTokenStream
+    from .generated.MiniMLLexer import MiniMLLexer
     lexer = MiniMLLexer(inputStream)
     class BailErrorListener:
         def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
             raise MiniMLError(f'lexer error at {line},{column}')
     lexer.addErrorListener(BailErrorListener())
     if args.stage == 'lex':
+        from .utils import dumpLexerTokens
         dumpLexerTokens(lexer)
-        exit(0)
+        exitStage()
     return CommonTokenStream(lexer)
 
 
 def doParse(tokenStream):
+    from .generated.MiniMLParser import MiniMLParser
     parser = MiniMLParser(tokenStream)
     cst = parser.top()
     if parser.getNumberOfSyntaxErrors() != 0:
-        print('Invalid syntax.')
-        exit(1)
+        raise MiniMLError('Invalid syntax.')
     if args.stage == 'cst':
         print(cst.toStringTree(recog=parser), file=args.outfile)
-        exit(0)
+        exitStage()
     return cst
 
 
 def doConstructAST(cst):
-    ast = ConstructASTVisitor().visit(cst)
+    from .frontend import ConstructASTVisitor
+    with passes.timed('ast'):
+        ast = ConstructASTVisitor().visit(cst)
     if args.stage == 'ast':
         printAst(ast)
-        exit(0)
+        exitStage()
     return ast
 
 
 def doPatMat(ast):
-    PatMatVisitor().visit(ast)
+    from .frontend import PatMatVisitor
+    passes.run('patmat', PatMatVisitor(), ast)
     if args.stage == 'patmat':
         printAst(ast)
-        exit(0)
+        exitStage()
+    return ast
+
+
+def doDataRepr(ast):
+    from .frontend import DataReprVisitor
+    passes.run('datarepr', DataReprVisitor(), ast)
+    if args.stage == 'datarepr':
+        printAst(ast)
+        exitStage()
     return ast
 
 
 def doNamer(ast):
-    NamerVisitor().visit(ast)
+    from .frontend import NamerVisitor
+    passes.run('namer', NamerVisitor(), ast)
     if args.stage == 'name':
         printAst(ast)
-        exit(0)
+        exitStage()
     return ast
 
 
 def doTyper(ast):
-    TyperVisitor().visit(ast)
+    from .frontend import (TyperVisitor, OnlineTyperVisitor, TypedIndentedPrintVisitor,
+            UnifyTagVisitor, TyperStats)
+    stats = TyperStats() if args.typer_stats else None
+    cache = None
+    if args.typer_cache:
+        from .frontend import TypeCache
+        cache = TypeCache.load(args.typer_cache)
+    typer = (OnlineTyperVisitor if args.typer == 'online' else TyperVisitor)(stats, cache)
+    with timed(stats, 'constrgen'):
+        passes.run('constrgen', typer, ast)
     if DEBUG['main.PRINT_AST_BEFORE_UNIFY']:
-        print(TypedIndentedPrintVisitor()(ast), file=args.outfile)
-    UnifyTagVisitor(ast._constr).visit(ast)
+        print(passes.run('typedprint', TypedIndentedPrintVisitor(), ast), file=args.outfile)
+    with timed(stats, 'unify'), passes.timed('unify'):
+        if args.typer == 'online':
+            unifyTag = UnifyTagVisitor(tvMap=typer.solution())
+        else:
+            unifyTag = UnifyTagVisitor(typer.constrs, stats)
+    passes.defer('tag', unifyTag.tag)
+    if cache is not None:
+        cache.save(args.typer_cache)
+    if stats is not None:
+        stats.dump(args.typer_stats)
     if args.stage == 'type':
-        print(TypedIndentedPrintVisitor()(ast), file=args.outfile)
-        exit(0)
+        print(passes.run('typedprint', TypedIndentedPrintVisitor(), ast), file=args.outfile)
+        exitStage()
     return ast
 
 
 def doDeBrujin(ast):
-    DeBrujinVisitor().visit(ast)
+    from .frontend import DeBrujinVisitor
+    passes.run('debrujin', DeBrujinVisitor(), ast)
     if args.stage == 'debrujin':
         printAst(ast)
-        exit(0)
+        exitStage()
     return ast
 
 
+def doLower(ast):
+    from .frontend import FlatLowerVisitor
+    ir = passes.run('lower', FlatLowerVisitor(), ast)
+    if args.stage == 'flat':
+        print(ir, file=args.outfile)
+        exitStage()
+    return ir
+
+
 def doSECD(ast):
-    secd = SECDGenVisitor().visit(ast)
+    from .frontend import SECDGenVisitor
+    secd = passes.run('secd', SECDGenVisitor(), ast)
+    return doEmit(secd)
+
+
+def doFlatSECD(ir):
+    from .frontend import FlatSECDGen
+    with passes.timed('secd'):
+        secd = FlatSECDGen()(ir)
+    return doEmit(secd)
+
+
+def doEmit(secd):
     if args.stage == 'secd':
-        print(secd.emit(fmt='secdi'), file=args.outfile)
-        exit(0)
+        with passes.timed('emit'):
+            print(secd.emit(fmt='secdi'), file=args.outfile)
+        exitStage()
     elif args.stage == 'c':
-        print(secd.emit(fmt='c'), file=args.outfile)
-        exit(0)
+        with passes.timed('emit'):
+            print(secd.emit(fmt='c'), file=args.outfile)
+        exitStage()
     return secd
 
 
-def main(argv):
+def resumableStages():
+    """
+    Stages whose cached AST suffices for what args ask for.
+    """
+    stages = []
+    if args.stage in {'type', 'patmat', 'datarepr', 'debrujin', 'flat', 'secd', 'c'}:
+        stages += ['namer']
+    if args.stage in {'patmat', 'datarepr', 'debrujin', 'flat', 'secd', 'c'} \
+            and not args.typer_stats and not args.typer_cache:
+        stages += ['typer']
+    if args.stage in {'secd', 'c'} and args.backend == 'tree':
+        stages += ['debrujin']
+    return stages
+
+
+def loadStage():
+    if stageCache is None:
+        return None, None
+    with passes.timed('stagecache'):
+        return stageCache.latest(resumableStages())
+
+
+def saveStage(stage, ast):
+    if stageCache is not None:
+        # the cached AST has its types resolved
+        passes.flush(ast)
+        with passes.timed('stagecache'):
+            stageCache.save(stage, ast)
+
+
+def compile():
+    """
+    Compiles args.infile as args ask for. Returns the exit code.
+    """
+    from .frontend import PassManager
+    global passes, stageCache
+    passes = PassManager()
+    stageCache = None
     try:
-        global args
-        args = doParseArgs(argv)
-        inputs = FileStream(args.infile)
-        tokens = doLex(inputs)
-        cst = doParse(tokens)
-        ast = doConstructAST(cst)
-        ast = doNamer(ast)
-        ast = doTyper(ast)
-        ast = doPatMat(ast)
-        ast = doDeBrujin(ast)
-        secd = doSECD(ast)
+        if args.stage_cache:
+            from .frontend import StageCache
+            with open(args.infile, 'rb') as f:
+                stageCache = StageCache(args.stage_cache, f.read())
+        done, ast = loadStage()
+        if done is None:
+            from antlr4 import FileStream
+            inputs = FileStream(args.infile)
+            tokens = doLex(inputs)
+            cst = doParse(tokens)
+            ast = doConstructAST(cst)
+            ast = doNamer(ast)
+            saveStage('namer', ast)
+        if done in {None, 'namer'}:
+            ast = doTyper(ast)
+            saveStage('typer', ast)
+        if args.stage == 'flat' or args.backend == 'flat' and args.stage != 'debrujin':
+            ast = doPatMat(ast)
+            ast = doDataRepr(ast)
+            ir = doLower(ast)
+            secd = doFlatSECD(ir)
+        else:
+            if done != 'debrujin':
+                ast = doPatMat(ast)
+                ast = doDataRepr(ast)
+                ast = doDeBrujin(ast)
+                saveStage('debrujin', ast)
+            secd = doSECD(ast)
         return 0
+    except StopCompilation as e:
+        return e.code
+
+
+def batchJobs():
+    """
+    (infile, outfile) pairs of the batch.
+    """
+    jobs = [(infile, None) for infile in args.batch or []]
+    if args.manifest:
+        with open(args.manifest) as f:
+            for line in f:
+                fields = line.split('#')[0].split()
+                if fields:
+                    jobs += [(fields[0], fields[1] if len(fields) > 1 else None)]
+    ext = {'secd': '.secd', 'c': '.c'}.get(args.stage, '.' + args.stage)
+    res = []
+    for infile, outfile in jobs:
+        if outfile is None:
+            outfile = os.path.splitext(infile)[0] + ext
+            if args.outdir:
+                outfile = os.path.join(args.outdir, os.path.basename(outfile))
+        res += [(infile, outfile)]
+    return res
+
+
+def compileJob(options, infile, outfile):
+    """
+    Compiles one file of a batch, possibly in a worker process.
+    Returns (infile, exit code, error message or None, seconds, pass times).
+    """
+    import traceback
+    global args
+    args = argparse.Namespace(**vars(options))
+    args.infile = infile
+    start = time.perf_counter()
+    error = None
+    try:
+        f = open(outfile, 'w')
+    except OSError as e:
+        return infile, 1, f'cannot open {outfile}: {e.strerror}', time.perf_counter() - start, {}
+    try:
+        with f:
+            args.outfile = f
+            code = compile()
+    except MiniMLError as e:
+        code, error = 1, traceback.format_exc() if args.backtrace else str(e)
+    except Exception as e:
+        code, error = 1, traceback.format_exc() if args.backtrace else f'internal error: {e!r}'
+    if code != 0 and os.path.exists(outfile):
+        os.remove(outfile)
+    return infile, code, error, time.perf_counter() - start, passes.times
+
+
+def mainBatch():
+    global args
+    batchArgs = args
+    jobs = batchJobs()
+    if args.outdir:
+        os.makedirs(args.outdir, exist_ok=True)
+    # open files do not pickle
+    options = argparse.Namespace(**{ k: v for k, v in vars(args).items()
+        if k not in {'outfile', 'pass_times', 'typer_stats'} })
+    options.pass_times = options.typer_stats = None
+    start = time.perf_counter()
+    infiles, outfiles = [j[0] for j in jobs], [j[1] for j in jobs]
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(args.jobs) as pool:
+            results = list(pool.map(compileJob, repeat(options), infiles, outfiles))
+    else:
+        results = [compileJob(options, infile, outfile) for infile, outfile in jobs]
+        args = batchArgs
+    wall = time.perf_counter() - start
+
+    times = {}
+    failed = 0
+    for infile, code, error, seconds, passTimes in results:
+        if code != 0:
+            failed += 1
+            print(f'{infile}: {error or "failed"}', file=sys.stderr)
+        for name, t in passTimes.items():
+            times[name] = times.get(name, 0) + t
+    total = sum(r[3] for r in results)
+    print(f'miniml: {len(results)} files, {failed} failed, {wall:.2f}s'
+            f' ({total:.2f}s compiling, {args.jobs} jobs)', file=sys.stderr)
+    if args.pass_times:
+        from .frontend import PassManager
+        totals = PassManager()
+        totals.times = times
+        totals.dump(args.pass_times)
+    return 1 if failed else 0
+
+
+def main(argv):
+    global args
+    args = doParseArgs(argv)
+    if args.batch or args.manifest:
+        return mainBatch()
+    try:
+        if args.serve:
+            from .server import serve
+            return serve(args.serve)
+        code = compile()
     except MiniMLError as e:
         if args.backtrace:
             raise e
         print(e, file=sys.stderr)
         return 1
+    if code == 0 and args.pass_times:
+        passes.dump(args.pass_times)
+    return code
@@ -0,0 +1,153 @@
+"""
+Compile server, so that compiling a file does not pay for starting up the
+compiler: importing antlr and the generated parser, deserializing its ATN
+and filling its DFA cache.
+
+The server keeps all of that loaded and listens on a Unix socket for thin
+clients (client.py) forwarding their command lines. Each request is served in
+a process forked from the server. Requests thus run concurrently, and each
+starts from the same compiler state as a new `miniml` process would, so the
+output does not depend on earlier requests. The on-disk caches
+(--typer-cache, --stage-cache) are shared as usual.
+
+The server stops on SIGTERM or SIGINT, after the requests in flight, and when
+the compiler sources change under it. Clients then compile locally.
+"""
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+from antlr4 import InputStream, CommonTokenStream
+
+from .utils import MiniMLError
+from .generated.MiniMLLexer import MiniMLLexer
+from .generated.MiniMLParser import MiniMLParser
+from . import frontend
+from .frontend import StageCache
+from . import main as driver
+
+
+# Parsed once at start-up to fill the parser's DFA cache.
+WARMUP = r"""
+datatype List =
+| Nil int
+| Cons int List
+end
+
+let rec len = \l ->
+    match l
+    | Nil _ -> 0
+    | Cons _ t -> 1 + len t
+    end
+and even = \n: int -> if n == 0 then 1 else odd (n-1)
+and odd = \n: int -> if n == 0 then 0 else even (n-1)
+in
+let pair = (len (Cons 1 (Nil 0)), \x: int -> x * 2 % 3) in
+match pair
+| a, f -> println (f a); println (nth 0 pair - a)
+end
+"""
+
+
+def warmUp():
+    # the driver imports passes lazily, load them all before forking
+    for name in frontend.__all__:
+        getattr(frontend, name)
+    parser = MiniMLParser(CommonTokenStream(MiniMLLexer(InputStream(WARMUP))))
+    parser.removeErrorListeners()
+    parser.top()
+
+
+def runRequest(argv, cwd):
+    """
+    Runs `miniml argv` in cwd, as the main of this (forked) process.
+    """
+    if '--serve' in argv:
+        return { 'code': 2, 'stdout': '', 'stderr': 'miniml: --serve cannot be forwarded\n' }
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            os.chdir(cwd)
+            code = driver.main(['miniml'] + argv)
+        except SystemExit as e:
+            code = e.code
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        if code is None:
+            code = 0
+        elif not isinstance(code, int):
+            print(code, file=sys.stderr)
+            code = 1
+    # the process ends in os._exit, which flushes nothing
+    args = getattr(driver, 'args', None)
+    for f in vars(args).values() if args is not None else []:
+        if isinstance(f, io.TextIOWrapper) and f not in {sys.__stdout__, sys.__stderr__}:
+            f.close()
+    return { 'code': code, 'stdout': out.getvalue(), 'stderr': err.getvalue() }
+
+
+class CompileHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        request = json.loads(self.rfile.read())
+        if StageCache.hashCompilerSources() != StageCache.compilerVersion():
+            os.kill(os.getppid(), signal.SIGTERM)
+            reply = { 'retry': 'compiler sources changed, server stopping' }
+        else:
+            reply = runRequest(request['argv'], request['cwd'])
+        self.wfile.write(json.dumps(reply).encode())
+
+
+class CompileServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    # waited for by server_close
+    block_on_close = True
+
+
+def claimSocket(path):
+    """
+    Removes the socket file left at path by a server that is gone.
+    """
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+            return
+    raise MiniMLError(f'a server is already running at {path}')
+
+
+def stop(signum, frame):
+    raise SystemExit(0)
+
+
+def serve(path):
+    """
+    Serves requests on the Unix socket at path until stopped. Returns the exit code.
+    """
+    StageCache.compilerVersion()
+    warmUp()
+    claimSocket(path)
+    server = CompileServer(path, CompileHandler)
+    ino = os.stat(path).st_ino
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    print(f'miniml: serving on {path}', file=sys.stderr)
+    try:
+        server.serve_forever()
+    finally:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        server.server_close()
+        # unless a new server took over the path
+        if os.path.exists(path) and os.stat(path).st_ino == ino:
+            os.remove(path)
+    return 0
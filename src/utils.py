@@ -1,10 +1,3 @@
-from copy import deepcopy
-from antlr4 import *
-from ast import literal_eval
-from pprint import pprint
-
-from .debug import *
-
 class MiniMLError(Exception):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, *kwargs)
@@ -98,6 +91,7 @@ class stacked_dict:
         return len(self._s[-1])
 
     def push(self):
+        from copy import deepcopy
         self._s.append(deepcopy(self._s[-1]))
         self._d.append({})
 
@@ -109,6 +103,55 @@ class stacked_dict:
     def peek(self, last=0):
         return self._d[-1-last]
 
+class PersistentMap:
+    """
+    Immutable map. `set` returns a new map sharing all but O(log n) of this
+    one's structure, and lookups take O(log n), with n the number of keys.
+
+    A hash trie: nodes are dicts from 5 bits of the key's hash to either a
+    (key, value) leaf or a child node for the next 5 bits. Keys whose hashes
+    agree on all bits share a bucket, a plain dict at the bottom.
+    """
+    __slots__ = ('root',)
+    BITS = 5
+    HASH_BITS = 64
+
+    def __init__(self, root=None):
+        self.root = root if root is not None else {}
+
+    def __getitem__(self, key):
+        h, node, shift = hash(key), self.root, 0
+        while shift < PersistentMap.HASH_BITS:
+            e = node.get((h >> shift) & 31)
+            if type(e) is tuple:
+                if e[0] == key:
+                    return e[1]
+                raise KeyError(key)
+            if e is None:
+                raise KeyError(key)
+            node, shift = e, shift + PersistentMap.BITS
+        return node[key]
+
+    def set(self, key, value):
+        return PersistentMap(PersistentMap.setIn(self.root, hash(key), 0, key, value))
+
+    def setIn(node, h, shift, key, value):
+        new = dict(node)
+        if shift >= PersistentMap.HASH_BITS:
+            new[key] = value
+            return new
+        i = (h >> shift) & 31
+        e = node.get(i)
+        shift += PersistentMap.BITS
+        if e is None or type(e) is tuple and e[0] == key:
+            new[i] = (key, value)
+        elif type(e) is tuple:
+            child = PersistentMap.setIn({}, hash(e[0]), shift, e[0], e[1])
+            new[i] = PersistentMap.setIn(child, h, shift, key, value)
+        else:
+            new[i] = PersistentMap.setIn(e, h, shift, key, value)
+        return new
+
 def noDuplicates(l):
     return len(set(l)) == len(l)
 
@@ -0,0 +1,14 @@
+let f = \n: int ->
+    match n
+    | 0 -> println 100
+    | 1 -> println 101
+    | _ -> println 999
+    end
+in
+let g = \b ->
+    match b
+    | true -> println 1
+    | false -> println 0
+    end
+in
+f 0; f 1; f 5; g true; g false
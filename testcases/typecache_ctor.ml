@@ -0,0 +1,12 @@
+-- With --typer-cache, typecache_ctor_badtype.ml must still fail to type
+-- after this file filled the cache: their K differ.
+datatype T =
+| K int
+end
+
+let f = \x ->
+    match x
+    | K y -> y
+    end
+in
+println ((f (K 1)) + 1)
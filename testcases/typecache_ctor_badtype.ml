@@ -0,0 +1,11 @@
+-- See typecache_ctor.ml.
+datatype T =
+| K unit
+end
+
+let f = \x ->
+    match x
+    | K y -> y
+    end
+in
+println ((f (K ())) + 1)
@@ -0,0 +1,85 @@
+"""
+Deep programs compile at the default recursion limit, past the parser.
+"""
+import sys
+import threading
+
+import pytest
+
+from src import main
+from src.frontend.typer import BaseType, LamType, TupleType, TypeVar, Unifier
+
+DEPTH = 2000
+
+
+def deepLambdas(n):
+    """
+    \\x0 -> ... -> \\x{n-1} -> x0, applied to n arguments: a deep lambda nest,
+    a deep application chain and a deep arrow type.
+    """
+    lams = ''.join(f'\\x{i} -> ' for i in range(n))
+    args = ' '.join(str(i) for i in range(n))
+    return f'let f = {lams}x0 in\nprintln (f {args})\n'
+
+
+def unlimited(f):
+    """
+    f with a raised recursion limit: the ANTLR parser and ConstructASTVisitor
+    still recurse on the input.
+    """
+    def g(*args):
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(100 * DEPTH)
+        try:
+            return f(*args)
+        finally:
+            sys.setrecursionlimit(limit)
+    return g
+
+
+def compileDeep(monkeypatch, tmp_path, *options):
+    src = tmp_path / 'deep.ml'
+    src.write_text(deepLambdas(DEPTH))
+    out = tmp_path / 'deep.out'
+    monkeypatch.setattr(main, 'doParse', unlimited(main.doParse))
+    monkeypatch.setattr(main, 'doConstructAST', unlimited(main.doConstructAST))
+    res = []
+    def run():
+        try:
+            res.append(main.main(['miniml', *options, str(src), str(out)]))
+        except Exception as e:
+            res.append(e)
+    stackSize = threading.stack_size(512 << 20)
+    try:
+        t = threading.Thread(target=run)
+        t.start()
+        t.join()
+    finally:
+        threading.stack_size(stackSize)
+    assert sys.getrecursionlimit() < DEPTH
+    assert res == [0]
+    return out.read_text()
+
+
+@pytest.mark.parametrize('backend', ['tree', 'flat'])
+def test_deep_lambdas_c(monkeypatch, tmp_path, backend):
+    code = compileDeep(monkeypatch, tmp_path, '-s', 'c', '--backend', backend)
+    assert 'void main(void)' in code
+    assert code.count('Iclosure(') == DEPTH
+
+
+def test_deep_types():
+    ty = BaseType('int')
+    for i in range(DEPTH):
+        ty = LamType(TypeVar(i), TupleType(ty, TypeVar(i)))
+    assert ty.size() == 4 * DEPTH + 1
+    assert ty.freeTV()[:2] == [DEPTH - 1, DEPTH - 2]
+    assert str(ty).count('->') == DEPTH
+    tvMap = { i: BaseType('bool') for i in range(DEPTH) }
+    assert ty.substMap(tvMap).ground
+
+    uf = Unifier()
+    uf.unify(TypeVar(DEPTH), ty)
+    for i in range(DEPTH):
+        uf.unify(TypeVar(i), TypeVar(i + 1) if i + 1 < DEPTH else BaseType('unit'))
+    assert uf.resolve(TypeVar(DEPTH)).ground
@@ -0,0 +1,36 @@
+"""
+Node-local passes are fused into the walks of other passes.
+"""
+import json
+import os
+
+import pytest
+
+from src import main
+
+FACT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testcases', 'fact.ml')
+
+
+def passTimes(capsys, tmp_path, *options):
+    """
+    The passes a compilation of fact.ml ran, see --pass-times.
+    """
+    assert main.main(['miniml', '--pass-times', '-', *options, FACT, str(tmp_path / 'out')]) == 0
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.mark.parametrize('backend', ['tree', 'flat'])
+def test_tag_fused_into_patmat(capsys, tmp_path, backend):
+    times = passTimes(capsys, tmp_path, '-s', 'c', '--backend', backend)
+    assert 'tag+patmat' in times
+    assert 'tag' not in times and 'patmat' not in times
+
+
+def test_tag_fused_into_typed_print(capsys, tmp_path):
+    times = passTimes(capsys, tmp_path, '-s', 'type')
+    assert 'tag+typedprint' in times
+
+
+def test_tag_walks_before_stage_cache(capsys, tmp_path):
+    times = passTimes(capsys, tmp_path, '--stage-cache', str(tmp_path / 'cache'), '-s', 'c')
+    assert 'tag' in times and 'patmat' in times
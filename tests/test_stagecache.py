@@ -0,0 +1,70 @@
+"""
+Stage cache entries that do not check out are misses, never unpickled.
+"""
+import os
+import pickle
+
+import pytest
+
+from src import main
+from src.frontend import StageCache
+
+FACT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testcases', 'fact.ml')
+
+
+class Boom:
+    """
+    Unpickling it fails the test.
+    """
+    def __reduce__(self):
+        return (pytest.fail, ('unpickled an unchecked entry',))
+
+
+def compileFact(tmp_path, cacheDir, name):
+    out = tmp_path / name
+    assert main.main(['miniml', '--stage-cache', str(cacheDir), '-s', 'c', FACT, str(out)]) == 0
+    return out.read_text()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with open(FACT, 'rb') as f:
+        return StageCache(tmp_path / 'cache', f.read())
+
+
+def test_hit(cache):
+    assert cache.save('namer', ('ast', 1))
+    assert cache.latest(['namer']) == ('namer', ('ast', 1))
+
+
+@pytest.mark.parametrize('damage', [
+    lambda entry: entry[:-1],
+    lambda entry: entry[:StageCache.DIGEST_SIZE // 2],
+    lambda entry: entry[:-1] + bytes([entry[-1] ^ 1]),
+    lambda entry: bytes(StageCache.DIGEST_SIZE) + entry[StageCache.DIGEST_SIZE:],
+    lambda entry: entry[:StageCache.DIGEST_SIZE] + pickle.dumps(Boom()),
+    lambda entry: pickle.dumps(Boom()),
+])
+def test_damaged_entry_is_miss(cache, damage):
+    cache.save('typer', ('ast', 2))
+    path = cache.path('typer')
+    path.write_bytes(damage(path.read_bytes()))
+    assert cache.latest(['namer', 'typer']) == (None, None)
+
+
+def test_unpicklable_ast_not_cached(cache):
+    deep = ()
+    for _ in range(100000):
+        deep = (deep,)
+    assert not cache.save('namer', deep)
+    assert cache.latest(['namer']) == (None, None)
+    assert not cache.cacheDir.exists()
+
+
+def test_compile_past_damaged_entries(tmp_path):
+    cacheDir = tmp_path / 'cache'
+    code = compileFact(tmp_path, cacheDir, 'cold')
+    assert compileFact(tmp_path, cacheDir, 'warm') == code
+    for entry in cacheDir.iterdir():
+        entry.write_bytes(entry.read_bytes()[:-7])
+    assert compileFact(tmp_path, cacheDir, 'damaged') == code
@@ -0,0 +1,79 @@
+"""
+The type cache file is data only: it reads back any types, deep ones included,
+and anything else makes an empty cache.
+"""
+import json
+import pickle
+
+import pytest
+
+from src.frontend import TypeCache
+from src.frontend.typer import BaseType, DataType, LamType, TupleType, TypeSchema, TypeVar
+
+DEPTH = 5000
+
+
+def schemas():
+    a, b = TypeVar(0), TypeVar(1)
+    pair = TupleType(a, BaseType('int'))
+    deep = a
+    for _ in range(DEPTH):
+        deep = LamType(pair, TupleType(deep, pair))
+    return [
+        TypeSchema(LamType(a, a), quantTVIds=[0]),
+        TypeSchema(TupleType(DataType('tree'), LamType(b, TupleType()), BaseType('bool')), quantTVIds=[1]),
+        TypeSchema(deep, quantTVIds=[0]),
+    ]
+
+
+def test_round_trip(tmp_path):
+    cache = TypeCache()
+    cache.store('k', schemas())
+    cache.store('l', schemas()[:1])
+    cache.save(tmp_path / 'cache')
+    loaded = TypeCache.load(tmp_path / 'cache')
+    assert list(loaded.entries) == ['k', 'l']
+    for s, t in zip(cache.lookup('k'), loaded.lookup('k')):
+        assert t.ty is s.ty and t.quantTVIds == s.quantTVIds and t.constrs == []
+    # shared components are written once
+    assert len(json.loads((tmp_path / 'cache').read_text())['types']) < 2 * DEPTH + 10
+
+
+def save(path, types, entries, version=TypeCache.VERSION):
+    path.write_text(json.dumps({'version': version, 'types': types, 'entries': entries}))
+
+
+@pytest.mark.parametrize('types, entries', [
+    ([['base', 'int']], [['k', [[1, []]]]]),
+    ([['base', 'int']], [['k', [[-1, []]]]]),
+    ([['base', 'float']], [['k', [[0, []]]]]),
+    ([['lam', 0, 0]], [['k', [[0, []]]]]),
+    ([['base', 'int'], ['lam', 0]], [['k', [[1, []]]]]),
+    ([['var', True]], [['k', [[0, [True]]]]]),
+    ([['var', 0]], [['k', [[0, []]]]]),
+    ([['var', 0]], [['k', [[0, [0]]]], 'k']),
+    ([['code', 'os.system']], []),
+    ({}, []),
+])
+def test_malformed_is_empty(tmp_path, types, entries):
+    save(tmp_path / 'cache', types, entries)
+    assert TypeCache.load(tmp_path / 'cache').entries == {}
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'{"version": 3, "types": [',
+    b'[' * 100000,
+    pickle.dumps((2, [('k', [])])),
+    b'\xff\xfe',
+])
+def test_unreadable_is_empty(tmp_path, content):
+    (tmp_path / 'cache').write_bytes(content)
+    assert TypeCache.load(tmp_path / 'cache').entries == {}
+
+
+def test_other_version_is_empty(tmp_path):
+    save(tmp_path / 'cache', [['base', 'int']], [['k', [[0, []]]]], version=TypeCache.VERSION - 1)
+    assert TypeCache.load(tmp_path / 'cache').entries == {}
+    save(tmp_path / 'cache', [['base', 'int']], [['k', [[0, []]]]])
+    assert TypeCache.load(tmp_path / 'cache').lookup('k')[0].ty is BaseType('int')